@@ -0,0 +1,63 @@
+import random
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from bmi_for_age import FEMALE, LMS_PATH, MALE, BMIForAge, LMSTable, load_reference, normal_cdf, percentile_one
+
+# BMI-for-age lookup latency: one child at a time (bisect + LMS formula) and
+# whole columns at once (searchsorted + array arithmetic).
+#   python bench_bmi_for_age.py [bulk_rows]
+# Uses assets/bmi_for_age_lms.csv when present. Otherwise it times a smooth
+# made-up table of the same shape (ages 24-240 months in half months); those
+# numbers are only for timing and are not reference values.
+
+
+def synthetic_reference():
+    ages = np.arange(24.0, 240.5, 0.5)
+    tables = {sex: LMSTable(ages, -1.5 + 0.005 * ages + shift, 15 + 0.03 * ages + shift, 0.08 + 0.0001 * ages)
+              for sex, shift in ((MALE, 0.0), (FEMALE, 0.3))}
+    return BMIForAge(tables)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    reference = load_reference()
+    if reference is None:
+        print(f"⚠️  {LMS_PATH.name} not found; timing a synthetic table")
+        reference = synthetic_reference()
+    low = max(table.ages[0] for table in reference.tables.values())
+    high = min(table.ages[-1] for table in reference.tables.values())
+    sexes = list(reference.tables)
+
+    rng = random.Random(11)
+    children = [(rng.choice(sexes), rng.uniform(low, high), rng.uniform(12, 35)) for _ in range(20_000)]
+    samples = []
+    for sex, age, bmi in children:
+        started = time.perf_counter_ns()
+        z = reference.zscore(sex, age, bmi)
+        percentile_one(z)
+        samples.append(time.perf_counter_ns() - started)
+    samples.sort()
+    print(f"👶 single lookup: median {statistics.median(samples) / 1000:.1f} µs"
+          f"  p99 {samples[int(len(samples) * 0.99)] / 1000:.1f} µs  (z-score + percentile)")
+
+    np_rng = np.random.default_rng(11)
+    sex = np_rng.choice(sexes, rows)
+    age = np_rng.uniform(low, high, rows)
+    bmi = np_rng.uniform(12, 35, rows)
+    started = time.perf_counter()
+    z = reference.zscores(sex, age, bmi)
+    percentile = normal_cdf(z) * 100
+    elapsed = time.perf_counter() - started
+    print(f"📊 bulk: {rows} children in {elapsed * 1000:.0f} ms ({rows / elapsed:,.0f} rows/s)")
+
+    check = [reference.zscore(int(s), float(a), float(b)) for s, a, b in zip(sex[:1000], age[:1000], bmi[:1000])]
+    worst = max(abs(c - v) for c, v in zip(check, z[:1000].tolist()))
+    print(f"   single vs bulk max |Δz| over 1000 rows: {worst:.1e}; median percentile {np.median(percentile):.1f}")
+
+
+if __name__ == "__main__":
+    main()
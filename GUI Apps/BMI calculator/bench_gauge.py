@@ -0,0 +1,56 @@
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+from bmi_gauge import BMIGauge
+
+# Repaint cost of the BMI gauge per new value: marker-only repaints over the
+# cached band layer vs redrawing the whole gauge from scratch every time.
+#   python bench_gauge.py [updates]
+
+
+def run(app, gauge, updates, full_redraw):
+    times, areas = [], []
+    original = gauge.paintEvent
+
+    def timed_paint(event):
+        if full_redraw:
+            gauge._bands_key = None  # forget the cached band layer
+        started = time.perf_counter()
+        original(event)
+        times.append(time.perf_counter() - started)
+        areas.append(event.rect().width() * event.rect().height())
+
+    gauge.paintEvent = timed_paint
+    rng = random.Random(3)
+    for _ in range(updates):
+        gauge.set_value(round(rng.uniform(14, 38), 1))
+        if full_redraw:
+            gauge.update()
+        app.processEvents()
+    gauge.paintEvent = original
+    return times, areas
+
+
+def main():
+    updates = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    app = QApplication(sys.argv)
+    gauge = BMIGauge()
+    gauge.resize(640, gauge.minimumHeight())
+    gauge.show()
+    app.processEvents()
+
+    for name, full_redraw in (("full redraw", True), ("cached bands + marker", False)):
+        times, areas = run(app, gauge, updates, full_redraw)
+        print(f"📊 {name:<22} median {statistics.median(times) * 1e6:7.1f} µs"
+              f"  max {max(times) * 1e6:7.1f} µs  {statistics.median(areas):7.0f} px² per paint")
+
+
+if __name__ == "__main__":
+    main()
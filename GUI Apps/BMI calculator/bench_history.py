@@ -0,0 +1,66 @@
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from bmi_history import BMIHistory
+from trend_chart import lttb
+
+# BMI history store at millions of points: bulk append throughput, range
+# query latency and LTTB downsampling to a chart's pixel width.
+#   python bench_history.py [points_per_person] [people]
+
+DAY = 24 * 60 * 60
+
+
+def main():
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    people = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    rng = np.random.default_rng(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        history = BMIHistory(Path(tmp) / "history.db")
+        start = time.time() - points * 60  # one reading a minute
+        ts = start + np.arange(points) * 60.0
+
+        started = time.perf_counter()
+        for p in range(people):
+            bmi = 24 + np.cumsum(rng.normal(0, 0.01, points))
+            person = f"person-{p}"
+            for lo in range(0, points, 50_000):
+                hi = lo + 50_000
+                history.append_many(zip([person] * len(ts[lo:hi]), ts[lo:hi].tolist(), bmi[lo:hi].tolist(),
+                                         [70.0] * len(ts[lo:hi]), [1.7] * len(ts[lo:hi])))
+        history.flush()
+        elapsed = time.perf_counter() - started
+        total = points * people
+        print(f"📈 append {total} readings: {elapsed:.2f} s ({total / elapsed:,.0f} rows/s)")
+
+        started = time.perf_counter()
+        single = [history.append("person-0", ts[-1] + 60 * (i + 1), 24.0, 70.0, 1.7) for i in range(1000)]
+        queued = (time.perf_counter() - started) / len(single) * 1e6
+        history.flush()
+        print(f"   single append: {queued:.1f} µs on the caller's thread (committed in the background)")
+
+        started = time.perf_counter()
+        all_ts, all_bmi = history.query("person-0")
+        print(f"   query all {all_ts.size} points of one person: {(time.perf_counter() - started) * 1000:.0f} ms")
+
+        samples = []
+        for _ in range(50):
+            lo = float(rng.uniform(ts[0], ts[-1] - 30 * DAY))
+            started = time.perf_counter()
+            window_ts, _ = history.query("person-1", lo, lo + 30 * DAY)
+            samples.append(time.perf_counter() - started)
+        print(f"   query a 30-day range ({window_ts.size} points): median {np.median(samples) * 1000:.1f} ms")
+
+        for width in (800, 2000):
+            started = time.perf_counter()
+            kept = lttb(all_ts, all_bmi, width)
+            print(f"   LTTB {all_ts.size} -> {kept.size} points: {(time.perf_counter() - started) * 1000:.1f} ms")
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+from bmi_calc import BMICalculator
+
+# Time spent handling resize events while the window edge is dragged back and
+# forth, with the old per-event smooth rescale vs the cached, debounced path.
+#   python bench_resize.py [drags]
+
+
+def smooth_every_event(window):
+    """The original resizeEvent: a full smooth rescale of chart.jpg each time."""
+    original = window.original_chart.pixmap
+
+    def update_chart_image():
+        window.chart_label.setPixmap(original.scaledToWidth(int(window.width() * 0.5), Qt.SmoothTransformation))
+
+    return update_chart_image
+
+
+def drag(app, window, handler, drags):
+    times = []
+
+    def timed_resize(event):
+        started = time.perf_counter()
+        handler()
+        times.append(time.perf_counter() - started)
+
+    window.resizeEvent = timed_resize
+    widths = list(range(600, 1400, 7)) + list(range(1400, 600, -7))
+    started = time.perf_counter()
+    for _ in range(drags):
+        for width in widths:
+            window.resize(width, 700)
+            app.processEvents()
+    total = time.perf_counter() - started
+    return times, total
+
+
+def report(name, times, total):
+    times.sort()
+    print(f"{name:<22} {len(times):>5} events  median {statistics.median(times) * 1000:6.2f} ms"
+          f"  p99 {times[int(len(times) * 0.99)] * 1000:6.2f} ms  drag total {total:5.2f} s")
+
+
+def main():
+    drags = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    app = QApplication(sys.argv)
+    window = BMICalculator()
+    window.show()
+    app.processEvents()
+    if window.original_chart.isNull():
+        sys.exit("❌ assets/chart.jpg not found")
+
+    report("smooth every event", *drag(app, window, smooth_every_event(window), drags))
+    report("cached + debounced", *drag(app, window, window.preview_chart_image, drags))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from bmi_service import HOST, PORT
+
+# Load test for bmi_service.py: many keep-alive clients firing single-person
+# requests, then bulk requests (one unit per column and per-row units), then the service's own /stats.
+#   python bench_service.py [--clients 64] [--seconds 5] [--bulk-rows 10000]
+# Starts the service in a subprocess when nothing is listening on the port.
+
+
+async def request(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {HOST}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def client(port, deadline, latencies, seed):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(HOST, port)
+    try:
+        while time.perf_counter() < deadline:
+            payload = {"weight": rng.uniform(40, 140), "height": rng.uniform(1.4, 2.1)}
+            started = time.perf_counter()
+            status, _ = await request(reader, writer, "POST", "/bmi", payload)
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                raise RuntimeError(f"status {status}")
+    finally:
+        writer.close()
+
+
+async def wait_for_service(port, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(HOST, port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+        else:
+            writer.close()
+            return
+
+
+def percentiles_ms(samples):
+    samples = sorted(samples)
+    return statistics.median(samples) * 1000, samples[int(len(samples) * 0.99)] * 1000
+
+
+async def run(args):
+    latencies = []
+    deadline = time.perf_counter() + args.seconds
+    started = time.perf_counter()
+    await asyncio.gather(*(client(args.port, deadline, latencies, seed) for seed in range(args.clients)))
+    elapsed = time.perf_counter() - started
+    p50, p99 = percentiles_ms(latencies)
+    print(f"🧮 single: {len(latencies)} requests from {args.clients} clients in {elapsed:.1f} s"
+          f" ({len(latencies) / elapsed:,.0f} req/s)  p50 {p50:.2f} ms  p99 {p99:.2f} ms")
+
+    reader, writer = await asyncio.open_connection(HOST, args.port)
+    rng = random.Random(0)
+    rows = args.bulk_rows
+    metric = {"weight": [rng.uniform(40, 140) for _ in range(rows)],
+              "height": [rng.uniform(1.4, 2.1) for _ in range(rows)]}
+    # Per-row units, including compound ones with their second field
+    mixed = {"weight": [rng.uniform(6, 20) for _ in range(rows)], "weight_unit": [("st+lb", "st")[i % 2] for i in range(rows)],
+             "weight_part": [rng.uniform(0, 13) for _ in range(rows)],
+             "height": [rng.uniform(4, 6) for _ in range(rows)], "height_unit": [("ft+in", "ft")[i % 2] for i in range(rows)],
+             "height_part": [rng.uniform(0, 11) for _ in range(rows)]}
+    for name, payload in (("metric", metric), ("per-row units", mixed)):
+        samples = []
+        for _ in range(20):
+            started = time.perf_counter()
+            status, reply = await request(reader, writer, "POST", "/bmi/bulk", payload)
+            samples.append(time.perf_counter() - started)
+            if status != 200:
+                raise RuntimeError(f"bulk {name}: status {status} {reply}")
+        p50, p99 = percentiles_ms(samples)
+        print(f"📊 bulk ({name}): {rows} rows per request  p50 {p50:.1f} ms"
+              f" ({rows / statistics.median(samples):,.0f} rows/s)")
+
+    _, stats = await request(reader, writer, "GET", "/stats")
+    writer.close()
+    print(f"   service view: {stats['requests_per_s']} req/s over the last window"
+          f"  p50 {stats.get('p50_ms')} ms  p99 {stats.get('p99_ms')} ms"
+          f"  {stats['batches']} batches, mean {stats['mean_batch']} requests each")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the local BMI service")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--bulk-rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    server = None
+    try:
+        asyncio.run(wait_for_service(args.port, timeout=0))
+    except OSError:
+        server = subprocess.Popen([sys.executable, str(Path(__file__).parent / "bmi_service.py"),
+                                   "--port", str(args.port)], stdout=subprocess.DEVNULL)
+        asyncio.run(wait_for_service(args.port))
+    try:
+        asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
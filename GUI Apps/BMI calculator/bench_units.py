@@ -0,0 +1,70 @@
+import sys
+import time
+
+import numpy as np
+
+from units import HEIGHT_UNITS, INCHES_TO_M, LBS_TO_KG, STONE_TO_KG, WEIGHT_UNITS
+
+# Mixed-unit conversion: one Python branch per value (how calculate() used to
+# convert) against the registry's code lookup plus factor-table gather.
+#   python bench_units.py [rows]
+
+
+def per_value(weights, weight_units, heights, height_units, height_parts):
+    weight_kg, height_m = [], []
+    for w, wu, h, hu, part in zip(weights, weight_units, heights, height_units, height_parts):
+        if wu == "lbs":
+            w *= LBS_TO_KG
+        elif wu == "st":
+            w *= STONE_TO_KG
+        elif wu == "g":
+            w *= 0.001
+        if hu == "inches":
+            h *= INCHES_TO_M
+        elif hu == "cm":
+            h *= 0.01
+        elif hu == "ft+in":
+            h = h * 12 * INCHES_TO_M + part * INCHES_TO_M
+        weight_kg.append(w)
+        height_m.append(h)
+    return weight_kg, height_m
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(5)
+    weight_units = rng.choice(["kg", "lbs", "st", "g"], rows)
+    height_units = rng.choice(["meters", "inches", "cm", "ft+in"], rows)
+    weights = rng.uniform(1, 100, rows)
+    heights = rng.uniform(1, 100, rows)
+    parts = rng.uniform(0, 12, rows)
+    unit_lists = (weight_units.tolist(), height_units.tolist())
+
+    (weight_ref, height_ref), loop_s = timed(
+        per_value, weights.tolist(), unit_lists[0], heights.tolist(), unit_lists[1], parts.tolist())
+    print(f"🐢 per value: {rows} rows in {loop_s * 1000:.0f} ms ({rows / loop_s:,.0f} rows/s)")
+
+    # CSV workers have parsed numbers in arrays but unit cells in plain lists
+    for label, (weight_unit, height_unit) in (("unit lists", unit_lists), ("unit arrays", (weight_units, height_units))):
+        codes, code_s = timed(lambda: (WEIGHT_UNITS.codes(weight_unit), HEIGHT_UNITS.codes(height_unit)))
+        (weight_kg, height_m), gather_s = timed(
+            lambda: (WEIGHT_UNITS.to_base(weights, codes[0]), HEIGHT_UNITS.to_base(heights, codes[1], parts)))
+        total = code_s + gather_s
+        print(f"⚡ registry, {label}: {total * 1000:.0f} ms ({rows / total:,.0f} rows/s, {loop_s / total:.1f}x)"
+              f" = {code_s * 1000:.0f} ms unit codes + {gather_s * 1000:.1f} ms factor gather")
+
+    _, single_s = timed(lambda: (WEIGHT_UNITS.to_base(weights, "lbs"), HEIGHT_UNITS.to_base(heights, "ft+in", parts)))
+    print(f"   one unit per column: {single_s * 1000:.1f} ms")
+
+    worst = max(np.max(np.abs(weight_kg - weight_ref)), np.max(np.abs(height_m - height_ref)))
+    print(f"   max |difference| vs per value: {worst:.1e}")
+
+
+if __name__ == "__main__":
+    main()
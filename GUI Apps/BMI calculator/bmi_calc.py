@@ -1,19 +1,83 @@
 import sys
+import time
 from pathlib import Path
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QLineEdit,
-    QPushButton, QComboBox, QGroupBox
+    QPushButton, QComboBox, QGroupBox, QProgressBar, QFileDialog
 )
-from PyQt5.QtGui import QIcon, QFont, QPixmap
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QIcon, QFont, QPixmap, QDoubleValidator
+from PyQt5.QtCore import Qt, QTimer, QLocale, QThreadPool
+
+from bmi_engine import CATEGORIES, COLORS, compute_bmi, to_metric
+from bmi_for_age import ADULT_MONTHS, FEMALE, LMS_PATH, MALE, load_reference
+from bmi_gauge import BMIGauge
+from bmi_history import DB_PATH, BMIHistory
+from trend_chart import TrendChart
+from chart_cache import ScaledChart
+from import_job import ImportJob
+from units import HEIGHT_UNITS, WEIGHT_UNITS
 
 base_path = Path(__file__).parent
 icon_path = base_path / "assets" / "icon.png"
 chart_path = base_path / "assets" / "chart.jpg"  # Make sure chart.jpg exists
 
+RESIZE_SETTLE_MS = 150  # smooth chart render once resizing pauses this long
+TYPING_SETTLE_MS = 120  # live BMI update once a burst of keystrokes pauses
+MAX_INPUT = 1000.0
+ERROR_COLOR = "#e74c3c"
+
+sys.path.insert(0, str(base_path.parent))  # theme.py is shared by the apps
+from theme import set_state, state_rules, stylesheet
+
+RESULT_STATES = ("underweight", "normal", "overweight", "obese")  # indexed like CATEGORIES
+
+STYLE = stylesheet("""
+    QGroupBox#inputs {
+        border: 1px solid #656b66;
+        border-radius: 10px;
+        margin-top: 10px;
+        padding: 20px;
+    }
+    QLabel#result {
+        color: black;
+    }
+    QLabel#tip {
+        color: #555;
+        font-style: italic;
+    }
+""", state_rules("QLabel#result", {
+    **{state: f"color: {color};" for state, color in zip(RESULT_STATES, COLORS)},
+    "error": f"color: {ERROR_COLOR};",
+}))
+
+
+def ordinal(n):
+    suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+
+def percentile_text(percentile):
+    # int() would turn 0.4 into "0th"
+    if percentile < 1:
+        return "<1st"
+    if percentile > 99:
+        return ">99th"
+    return ordinal(int(percentile))
+
+
+def number_validator(parent, top=MAX_INPUT):
+    # C locale so "1.75" is accepted whatever the system decimal separator
+    validator = QDoubleValidator(0.0, top, 3, parent)
+    validator.setNotation(QDoubleValidator.StandardNotation)
+    validator.setLocale(QLocale.c())
+    return validator
+
 class BMICalculator(QWidget):
-    def __init__(self):
+    def __init__(self, history_path=DB_PATH):
         super().__init__()
+        self.history = BMIHistory(history_path)
+        self.last_reading = None
+        self.trend_person = None
         self.initUI()
         self.center()
 
@@ -27,6 +91,8 @@ class BMICalculator(QWidget):
         self.setWindowTitle("BMI Calculator")
         self.setWindowIcon(QIcon(str(icon_path)))
         self.setMinimumSize(600, 500)
+        # The whole window is styled by one stylesheet, parsed once
+        self.setStyleSheet(STYLE)
 
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(30, 30, 30, 30)
@@ -40,17 +106,21 @@ class BMICalculator(QWidget):
         # ==== Group Box for Input Section ====
         self.input_group = QGroupBox()
         self.input_group.setFont(QFont("Arial", 14))
-        self.input_group.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #656b66;
-                border-radius: 10px;
-                margin-top: 10px;
-                padding: 20px;
-            }
-        """)
+        self.input_group.setObjectName("inputs")
 
         input_layout = QVBoxLayout()
 
+        # Person whose history is recorded
+        person_box = QHBoxLayout()
+        self.person_label = QLabel("Name:")
+        self.person_label.setFont(QFont("Arial", 12))
+        self.person_input = QLineEdit("Me")
+        self.person_input.setFont(QFont("Arial", 12))
+        self.person_input.editingFinished.connect(self.load_history)
+        person_box.addWidget(self.person_label)
+        person_box.addWidget(self.person_input)
+        input_layout.addLayout(person_box)
+
         # Weight input
         weight_box = QHBoxLayout()
         self.weight_label = QLabel("Weight:")
@@ -58,11 +128,17 @@ class BMICalculator(QWidget):
         self.weight_input = QLineEdit()
         self.weight_input.setPlaceholderText("e.g. 70")
         self.weight_input.setFont(QFont("Arial", 12))
+        self.weight_input.setValidator(number_validator(self.weight_input))
         self.weight_unit = QComboBox()
-        self.weight_unit.addItems(["kg", "lbs"])
+        self.weight_unit.addItems(WEIGHT_UNITS.names())
+        # Second field of compound units (the lb of st+lb), hidden otherwise
+        self.weight_part = QLineEdit()
+        self.weight_part.setFont(QFont("Arial", 12))
+        self.weight_part.setValidator(number_validator(self.weight_part))
         weight_box.addWidget(self.weight_label)
         weight_box.addWidget(self.weight_input)
         weight_box.addWidget(self.weight_unit)
+        weight_box.addWidget(self.weight_part)
         input_layout.addLayout(weight_box)
 
         # Height input
@@ -72,25 +148,70 @@ class BMICalculator(QWidget):
         self.height_input = QLineEdit()
         self.height_input.setPlaceholderText("e.g. 1.75")
         self.height_input.setFont(QFont("Arial", 12))
+        self.height_input.setValidator(number_validator(self.height_input))
         self.height_unit = QComboBox()
-        self.height_unit.addItems(["meters", "inches"])
+        self.height_unit.addItems(HEIGHT_UNITS.names())
+        self.height_part = QLineEdit()
+        self.height_part.setFont(QFont("Arial", 12))
+        self.height_part.setValidator(number_validator(self.height_part))
         height_box.addWidget(self.height_label)
         height_box.addWidget(self.height_input)
         height_box.addWidget(self.height_unit)
+        height_box.addWidget(self.height_part)
         input_layout.addLayout(height_box)
 
+        # Age and sex, optional; under 20 the BMI-for-age percentile applies
+        age_box = QHBoxLayout()
+        self.age_label = QLabel("Age:")
+        self.age_label.setFont(QFont("Arial", 12))
+        self.age_input = QLineEdit()
+        self.age_input.setPlaceholderText("years (optional, for children)")
+        self.age_input.setFont(QFont("Arial", 12))
+        self.age_input.setValidator(number_validator(self.age_input, top=130))
+        self.sex_input = QComboBox()
+        self.sex_input.addItems(["male", "female"])
+        age_box.addWidget(self.age_label)
+        age_box.addWidget(self.age_input)
+        age_box.addWidget(self.sex_input)
+        input_layout.addLayout(age_box)
+
         # Buttons
         button_box = QHBoxLayout()
         self.submit_button = QPushButton("Calculate BMI")
         self.submit_button.setFont(QFont("Arial", 12))
-        self.submit_button.clicked.connect(self.calculate)
+        self.submit_button.clicked.connect(self.record_calculation)
         self.reset_button = QPushButton("Reset")
         self.reset_button.setFont(QFont("Arial", 12))
         self.reset_button.clicked.connect(self.reset_fields)
+        self.import_button = QPushButton("Import dataset…")
+        self.import_button.setFont(QFont("Arial", 12))
+        self.import_button.setToolTip("Score a CSV/Parquet file of people in the background")
+        self.import_button.clicked.connect(self.import_dataset)
         button_box.addWidget(self.submit_button)
         button_box.addWidget(self.reset_button)
+        button_box.addWidget(self.import_button)
         input_layout.addLayout(button_box)
 
+        # Background dataset import, hidden until a job runs
+        import_box = QHBoxLayout()
+        self.import_progress = QProgressBar()
+        self.import_progress.setRange(0, 1000)
+        self.import_progress.setTextVisible(False)
+        self.import_cancel = QPushButton("Cancel")
+        self.import_cancel.clicked.connect(self.cancel_import)
+        import_box.addWidget(self.import_progress)
+        import_box.addWidget(self.import_cancel)
+        input_layout.addLayout(import_box)
+        self.import_status = QLabel("")
+        self.import_status.setFont(QFont("Arial", 10))
+        self.import_status.setWordWrap(True)
+        input_layout.addWidget(self.import_status)
+        self.import_job = None
+        # Own pool: Qt's smooth image scaling borrows the global pool's threads
+        self.import_pool = QThreadPool(self)
+        self.import_pool.setMaxThreadCount(1)
+        self.set_import_visible(False)
+
         self.input_group.setLayout(input_layout)
         main_layout.addWidget(self.input_group)
 
@@ -98,10 +219,19 @@ class BMICalculator(QWidget):
         self.result = QLabel("")
         self.result.setAlignment(Qt.AlignCenter)
         self.result.setFont(QFont("Courier New", 16, QFont.Bold))
+        self.result.setObjectName("result")
         main_layout.addWidget(self.result)
 
+        # ==== BMI Gauge ====
+        self.gauge = BMIGauge()
+        main_layout.addWidget(self.gauge)
+
+        # ==== BMI History Trend ====
+        self.trend = TrendChart()
+        main_layout.addWidget(self.trend)
+
         # ==== BMI Chart Image ====
-        self.original_chart = QPixmap(str(chart_path))
+        self.original_chart = ScaledChart(QPixmap(str(chart_path)))
         self.chart_label = QLabel()
         self.chart_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(self.chart_label)
@@ -109,77 +239,265 @@ class BMICalculator(QWidget):
         # ==== Tip ====
         tip = QLabel("Tip: Eat healthy and exercise regularly.")
         tip.setAlignment(Qt.AlignCenter)
-        tip.setStyleSheet("color: #555; font-style: italic;")
+        tip.setObjectName("tip")
         main_layout.addWidget(tip)
 
+        self.person_label.setFixedWidth(70)
         self.weight_label.setFixedWidth(70)
+        self.age_label.setFixedWidth(70)
+        self.sex_input.setFixedWidth(70)
         self.height_label.setFixedWidth(70)
         self.height_unit.setFixedWidth(70)
         self.weight_unit.setFixedWidth(70)
+        self.weight_part.setFixedWidth(60)
+        self.height_part.setFixedWidth(60)
+        self.update_unit_input(WEIGHT_UNITS, self.weight_unit.currentText(), self.weight_input, self.weight_part)
+        self.update_unit_input(HEIGHT_UNITS, self.height_unit.currentText(), self.height_input, self.height_part)
+        self.weight_unit.currentTextChanged.connect(
+            lambda unit: self.update_unit_input(WEIGHT_UNITS, unit, self.weight_input, self.weight_part))
+        self.height_unit.currentTextChanged.connect(
+            lambda unit: self.update_unit_input(HEIGHT_UNITS, unit, self.height_input, self.height_part))
+
+        # While the window is being dragged only fast previews are drawn
+        self.chart_timer = QTimer(self)
+        self.chart_timer.setSingleShot(True)
+        self.chart_timer.setInterval(RESIZE_SETTLE_MS)
+        self.chart_timer.timeout.connect(self.update_chart_image)
+
+        # ==== Live calculation ====
+        self.calc_timer = QTimer(self)
+        self.calc_timer.setSingleShot(True)
+        self.calc_timer.setInterval(TYPING_SETTLE_MS)
+        self.calc_timer.timeout.connect(self.calculate)
+        self.weight_input.textChanged.connect(self.schedule_calculation)
+        self.height_input.textChanged.connect(self.schedule_calculation)
+        self.weight_unit.currentTextChanged.connect(self.schedule_calculation)
+        self.height_unit.currentTextChanged.connect(self.schedule_calculation)
+        self.weight_part.textChanged.connect(self.schedule_calculation)
+        self.height_part.textChanged.connect(self.schedule_calculation)
+        self.age_input.textChanged.connect(self.schedule_calculation)
+        self.sex_input.currentTextChanged.connect(self.schedule_calculation)
+        self.weight_input.returnPressed.connect(self.record_calculation)
+        self.height_input.returnPressed.connect(self.record_calculation)
+        self.weight_part.returnPressed.connect(self.record_calculation)
+        self.height_part.returnPressed.connect(self.record_calculation)
 
         self.setLayout(main_layout)
         self.update_chart_image()
+        self.load_history()
         self.weight_input.setFocus()
 
     def resizeEvent(self, event):
-        self.update_chart_image()
+        self.preview_chart_image()
         super().resizeEvent(event)
 
+    def chart_width(self):
+        return int(self.width() * 0.5)
+
+    def preview_chart_image(self):
+        if self.original_chart.isNull():
+            return
+        self.chart_label.setPixmap(self.original_chart.preview(self.chart_width()))
+        if self.original_chart.cached(self.chart_width()) is None:
+            self.chart_timer.start()
+
     def update_chart_image(self):
         if not self.original_chart.isNull():
-            target_width = int(self.width() * 0.5)
-            scaled = self.original_chart.scaledToWidth(target_width, Qt.SmoothTransformation)
-            self.chart_label.setPixmap(scaled)
+            self.chart_label.setPixmap(self.original_chart.smooth(self.chart_width()))
         else:
-            self.chart_label.setText("Chart image not found.")    
+            self.chart_label.setText("Chart image not found.")
+
+    def schedule_calculation(self):
+        self.calc_timer.start()
+
+    def update_unit_input(self, registry, unit, value_input, part_input):
+        """Show the part field for compound units and scale the input limit to the unit."""
+        part_name = registry.part_name(unit)
+        part_input.setVisible(part_name is not None)
+        part_input.setPlaceholderText(part_name or "")
+        # MAX_INPUT is in kg or meters; small units such as g need larger numbers
+        value_input.validator().setTop(MAX_INPUT / min(registry.factors[registry.code(unit)], 1.0))
+
+    @staticmethod
+    def part_value(part_input):
+        """The compound-unit part as a float: 0 when hidden or empty, None when invalid."""
+        if part_input.isHidden() or not part_input.text():
+            return 0.0
+        return float(part_input.text()) if part_input.hasAcceptableInput() else None
+
+    def set_result(self, text, state=""):
+        self.result.setText(text)
+        # Re-polishes the label only when the state actually changes
+        set_state(self.result, state)
+
+    def show_error(self, message):
+        self.set_result(f"Error: {message}", "error")
+        self.gauge.set_value(None)
+        self.last_reading = None
 
     def calculate(self):
-        try:
-            weight = float(self.weight_input.text())
-            height = float(self.height_input.text())
-            weight_unit = self.weight_unit.currentText()
-            height_unit = self.height_unit.currentText()
-
-            if weight <= 0:
-                raise ValueError("Weight must be positive.")
-            if height <= 0:
-                raise ValueError("Height must be positive.")
-
-            if weight_unit == "lbs":
-                weight *= 0.453592
-            if height_unit == "inches":
-                height *= 0.0254
-
-            bmi = weight / (height ** 2)
-
-            if bmi < 18.5:
-                category = "Underweight"
-                color = "#3498db"
-            elif bmi < 25:
-                category = "Normal weight"
-                color = "#2ecc71"
-            elif bmi < 30:
-                category = "Overweight"
-                color = "#f39c12"
-            else:
-                category = "Obese"
-                color = "#e74c3c"
-
-            self.result.setText(f"Your BMI is: {bmi:.2f} ({category})")
-            self.result.setStyleSheet(f"color: {color};")
-
-        except ValueError as e:
-            self.result.setText(f"Error: {str(e)}")
-            self.result.setStyleSheet("color: #e74c3c;")
-        except Exception:
-            self.result.setText("Please enter valid numbers.")
-            self.result.setStyleSheet("color: #e74c3c;")
+        self.calc_timer.stop()
+        weight_text = self.weight_input.text()
+        height_text = self.height_input.text()
+        if not weight_text or not height_text:
+            self.set_result("")
+            self.gauge.set_value(None)
+            self.last_reading = None
+            return
+        if not (self.weight_input.hasAcceptableInput() and self.height_input.hasAcceptableInput()):
+            self.show_error("Please enter valid numbers.")
+            return
+
+        weight_part, height_part = self.part_value(self.weight_part), self.part_value(self.height_part)
+        if weight_part is None or height_part is None:
+            self.show_error("Please enter valid numbers.")
+            return
+
+        # Same engine as bmi_cli.py, so single and batch results match exactly
+        weight_kg, height_m = to_metric(float(weight_text), float(height_text), self.weight_unit.currentText(),
+                                        self.height_unit.currentText(), weight_part, height_part)
+        if weight_kg <= 0:
+            self.show_error("Weight must be positive.")
+            return
+        if height_m <= 0:
+            self.show_error("Height must be positive.")
+            return
+        bmi, category = compute_bmi([weight_kg], [height_m])
+        if category[0] < 0:
+            self.show_error("Values are out of range.")
+            return
+
+        category, age_note = self.apply_age(bmi, category)
+        self.set_result(f"Your BMI is: {bmi[0]:.2f} ({CATEGORIES[category[0]]}){age_note}", RESULT_STATES[category[0]])
+        self.gauge.set_value(float(bmi[0]))
+        self.last_reading = (float(bmi[0]), float(weight_kg), float(height_m))
+
+    def apply_age(self, bmi, category):
+        """Re-categorise a child by BMI-for-age percentile; returns (category, note line)."""
+        if not (self.age_input.text() and self.age_input.hasAcceptableInput()):
+            return category, ""
+        age_months = float(self.age_input.text()) * 12
+        if age_months >= ADULT_MONTHS:
+            return category, ""
+        reference = load_reference()
+        if reference is None:
+            return category, f"\nAdult cut-offs shown: run fetch_lms.py to add {LMS_PATH.name}"
+        sex = MALE if self.sex_input.currentText() == "male" else FEMALE
+        category, z, percentile = reference.classify([sex], [age_months], bmi, category)
+        if z[0] != z[0]:  # NaN: the tables do not cover this age
+            return category, "\nAge is outside the BMI-for-age tables"
+        return category, f"\n{percentile_text(percentile[0])} percentile for age (z = {z[0]:.2f})"
+
+    # ==== History ====
+    def person(self):
+        return self.person_input.text().strip() or "Me"
+
+    def load_history(self):
+        if self.person() != self.trend_person:
+            self.trend_person = self.person()
+            self.trend.set_series(*self.history.query(self.trend_person))
+
+    def record_calculation(self):
+        """Calculate now and record the reading; live updates while typing are not recorded."""
+        self.calculate()
+        if self.last_reading is None:
+            return
+        bmi, weight_kg, height_m = self.last_reading
+        ts = time.time()
+        self.history.append(self.person(), ts, bmi, weight_kg, height_m)
+        self.trend.append(ts, bmi)
+
+    # ==== Dataset import ====
+    def set_import_visible(self, running):
+        self.import_progress.setVisible(running)
+        self.import_cancel.setVisible(running)
+        self.import_button.setEnabled(not running)
+
+    def import_dataset(self):
+        source, _ = QFileDialog.getOpenFileName(
+            self, "Import dataset", str(Path.home()), "Datasets (*.csv *.parquet *.pq);;All files (*)")
+        if not source:
+            return
+        default = Path(source).with_name(Path(source).stem + "_scored.csv")
+        target, _ = QFileDialog.getSaveFileName(
+            self, "Save scored rows", str(default), "CSV (*.csv);;Parquet (*.parquet)")
+        if not target:
+            return
+        self.start_import(source, target)
+
+    def start_import(self, source, target):
+        """Score `source` into `target` on the thread pool; units come from the unit boxes.
+
+        Compound units ("ft+in") read their second field from a weight_part
+        or height_part column.
+        """
+        weight_unit, height_unit = self.weight_unit.currentText(), self.height_unit.currentText()
+        job = ImportJob(source, target, weight_unit, height_unit,
+                        weight_part_column="weight_part" if WEIGHT_UNITS.part_name(weight_unit) else None,
+                        height_part_column="height_part" if HEIGHT_UNITS.part_name(height_unit) else None)
+        job.signals.progress.connect(self.import_progressed)
+        job.signals.partial.connect(self.show_import_stats)
+        job.signals.finished.connect(self.import_finished)
+        job.signals.failed.connect(self.import_failed)
+        self.import_job = job
+        self.import_target = target
+        self.import_started = time.perf_counter()
+        self.import_progress.setValue(0)
+        self.import_status.setText(f"Scoring {Path(source).name}…")
+        self.set_import_visible(True)
+        self.import_pool.start(job)
+
+    def cancel_import(self):
+        if self.import_job is not None:
+            self.import_job.cancel()
+            self.import_cancel.setEnabled(False)
+            self.import_status.setText("Cancelling after the current chunk…")
+
+    def import_progressed(self, fraction, rows):
+        self.import_progress.setValue(int(fraction * 1000))
+
+    def show_import_stats(self, summary, prefix=""):
+        rows = summary["rows"]
+        elapsed = time.perf_counter() - self.import_started
+        valid = rows - summary["invalid"]
+        shares = "  ".join(f"{name} {count / valid:.0%}" for name, count in summary["counts"].items()) if valid else ""
+        self.import_status.setText(
+            f"{prefix}{rows:,} rows ({rows / elapsed:,.0f}/s), mean BMI {summary['mean_bmi']:.1f}, "
+            f"{summary['invalid']:,} invalid\n{shares}")
+
+    def import_finished(self, summary):
+        self.end_import()
+        if summary["cancelled"]:
+            prefix = f"Cancelled, partial results in {Path(self.import_target).name}: "
+        else:
+            prefix = f"Done, saved to {Path(self.import_target).name}: "
+        self.show_import_stats(summary, prefix)
+
+    def import_failed(self, message):
+        self.end_import()
+        self.import_status.setText(f"Import failed: {message}")
+
+    def end_import(self):
+        self.import_job = None
+        self.import_cancel.setEnabled(True)
+        self.set_import_visible(False)
+
+    def closeEvent(self, event):
+        if self.import_job is not None:
+            self.import_job.cancel()
+            self.import_pool.waitForDone()
+        self.history.close()
+        super().closeEvent(event)
 
     def reset_fields(self):
         self.weight_input.clear()
         self.height_input.clear()
-        self.result.setText("")
-        self.result.setStyleSheet("color: black;")
+        self.weight_part.clear()
+        self.height_part.clear()
+        self.calc_timer.stop()
+        self.set_result("")
+        self.gauge.set_value(None)
+        self.last_reading = None
         self.weight_input.setFocus()
 
 def main():
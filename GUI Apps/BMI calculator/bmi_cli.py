@@ -0,0 +1,81 @@
+import argparse
+import sys
+import time
+
+from bmi_for_age import LMS_PATH
+from bmi_stream import CHUNK_ROWS, stream
+from units import HEIGHT_UNITS, WEIGHT_UNITS
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Scores CSV or Parquet files of any size without importing Qt, using the same
+# engine as the GUI. Input is streamed in bounded chunks across all cores.
+#   python bmi_cli.py people.csv -o scored.csv --weight-unit lbs --height-unit inches
+#   cat people.csv | python bmi_cli.py - -o scored.csv
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a CSV or Parquet file of people with the BMI engine")
+    parser.add_argument("input", help="CSV or Parquet (.parquet) file with weight and height columns ('-' for CSV on stdin)")
+    parser.add_argument("-o", "--output", help="write weight,height,bmi,category rows here (.csv or .parquet)")
+    parser.add_argument("--weight-unit", choices=WEIGHT_UNITS.names(), default="kg")
+    parser.add_argument("--height-unit", choices=HEIGHT_UNITS.names(), default="meters")
+    parser.add_argument("--weight-column", default="weight")
+    parser.add_argument("--height-column", default="height")
+    parser.add_argument("--weight-unit-column", help="column giving each row's weight unit (mixed-unit files)")
+    parser.add_argument("--height-unit-column", help="column giving each row's height unit (mixed-unit files)")
+    parser.add_argument("--weight-part-column", help="column with the lb of st+lb weights")
+    parser.add_argument("--height-part-column", help="column with the in of ft+in heights")
+    parser.add_argument("--age-column", help="score children by BMI-for-age percentile using this column")
+    parser.add_argument("--sex-column", help="column holding M/F (or 1/2) for BMI-for-age")
+    parser.add_argument("--age-unit", choices=["years", "months"], default="years")
+    parser.add_argument("--lms", default=str(LMS_PATH), help="BMI-for-age LMS table (CSV)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="rows per chunk")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: all cores, 0 = score in this process)")
+    parser.add_argument("--progress", action="store_true", help="print a line after every chunk")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+
+    def progress(stats):
+        elapsed = time.perf_counter() - started
+        print(f"   {stats.rows} rows, {stats.rows / elapsed:,.0f} rows/s", file=sys.stderr)
+
+    try:
+        stats = stream(args.input, args.output, args.weight_unit, args.height_unit,
+                       args.weight_column, args.height_column, args.chunk_rows, args.workers,
+                       on_chunk=progress if args.progress else None,
+                       age_column=args.age_column, sex_column=args.sex_column,
+                       age_unit=args.age_unit, lms_path=args.lms,
+                       weight_unit_column=args.weight_unit_column, height_unit_column=args.height_unit_column,
+                       weight_part_column=args.weight_part_column, height_part_column=args.height_part_column)
+    except (OSError, ValueError) as e:
+        sys.exit(f"❌ {e}")
+    except ImportError:
+        sys.exit("❌ Parquet files need pyarrow: pip install pyarrow")
+    elapsed = time.perf_counter() - started
+
+    print(f"🧮 {stats.rows} rows in {elapsed:.2f} s ({stats.rows / elapsed:,.0f} rows/s)", file=sys.stderr)
+    for name, count in stats.category_counts().items():
+        print(f"   {name:<14} {count}", file=sys.stderr)
+    print(f"   {'Invalid':<14} {stats.invalid}", file=sys.stderr)
+    if stats.invalid < stats.rows:
+        print(f"   mean BMI {stats.mean_bmi():.2f}", file=sys.stderr)
+    peak = peak_rss_mb()
+    if peak is not None:
+        print(f"   peak memory {peak:.0f} MB (main process)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
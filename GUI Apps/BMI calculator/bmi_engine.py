@@ -0,0 +1,45 @@
+import numpy as np
+
+from units import HEIGHT_UNITS, WEIGHT_UNITS
+
+# Lower edges of every category after the first
+THRESHOLDS = np.array([18.5, 25.0, 30.0])
+CATEGORIES = ("Underweight", "Normal weight", "Overweight", "Obese")
+COLORS = ("#3498db", "#2ecc71", "#f39c12", "#e74c3c")
+INVALID = -1
+
+
+def to_metric(weight, height, weight_unit="kg", height_unit="meters", weight_part=None, height_part=None):
+    """Convert weight to kg and height to meters as float64 arrays.
+
+    Units are names from WEIGHT_UNITS / HEIGHT_UNITS, either one for the
+    whole column or one per row. `weight_part` and `height_part` are the
+    second field of compound units (the lb of "st+lb", the in of "ft+in").
+    """
+    return (WEIGHT_UNITS.to_base(weight, weight_unit, weight_part),
+            HEIGHT_UNITS.to_base(height, height_unit, height_part))
+
+
+def compute_bmi(weight, height, weight_unit="kg", height_unit="meters", weight_part=None, height_part=None):
+    """Score whole columns of people at once.
+
+    Returns `(bmi, category)`: float64 BMI values and int8 indexes into
+    CATEGORIES. Rows with a missing, non-positive or non-finite weight or
+    height, or an unknown per-row unit, get NaN and INVALID instead of
+    raising.
+    """
+    weight, height = np.broadcast_arrays(*to_metric(weight, height, weight_unit, height_unit, weight_part, height_part))
+    with np.errstate(invalid="ignore", over="ignore", divide="ignore"):
+        valid = (weight > 0) & (height > 0) & np.isfinite(weight) & np.isfinite(height)
+        bmi = np.divide(weight, height ** 2, out=np.full(weight.shape, np.nan), where=valid)
+        valid &= np.isfinite(bmi)
+    bmi[~valid] = np.nan
+    category = np.digitize(bmi, THRESHOLDS).astype(np.int8)
+    category[~valid] = INVALID
+    return bmi, category
+
+
+def category_counts(category):
+    """Number of rows per category, plus the invalid rows."""
+    counts = np.bincount(category[category != INVALID], minlength=len(CATEGORIES))
+    return dict(zip(CATEGORIES, counts.tolist())), int(np.count_nonzero(category == INVALID))
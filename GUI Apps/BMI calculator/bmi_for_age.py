@@ -0,0 +1,198 @@
+import bisect
+import csv
+import math
+from pathlib import Path
+
+import numpy as np
+
+from bmi_engine import INVALID
+
+LMS_PATH = Path(__file__).parent / "assets" / "bmi_for_age_lms.csv"
+ADULT_MONTHS = 240  # adult cut-offs apply from age 20
+
+MALE, FEMALE = 1, 2
+# Percentile cut-offs for children: <5th, 5th-85th, 85th-95th, >=95th,
+# mapped onto the same four categories as the adult BMI thresholds
+PERCENTILE_CUTOFFS = np.array([5.0, 85.0, 95.0])
+
+SEX_COLUMNS = ("sex", "Sex", "SEX")
+AGE_COLUMNS = ("agemos", "Agemos", "age_months", "Month", "month")
+WHO_AGE_COLUMNS = ("Month", "month")  # CDC's tables use Agemos
+
+
+def parse_sex(values):
+    """"M"/"male"/"1" -> MALE, "F"/"female"/"2" -> FEMALE, anything else -> 0."""
+    first = np.char.lower(np.char.strip(np.asarray(values, dtype=str))).astype("U1")
+    return np.select([(first == "m") | (first == "1"), (first == "f") | (first == "2")], [MALE, FEMALE], 0)
+
+
+def normal_cdf(z):
+    """Standard normal CDF for scalars or arrays (Abramowitz & Stegun 7.1.26, |error| < 1.5e-7)."""
+    z = np.asarray(z, dtype=np.float64)
+    x = np.abs(z) / math.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-x * x)
+    return 0.5 * (1.0 + np.copysign(erf, z))
+
+
+def percentile_one(z):
+    """Percentile (0-100) of one z-score, exact via math.erf."""
+    return 50.0 * (1.0 + math.erf(z / math.sqrt(2.0)))
+
+
+class LMSTable:
+    """L, M and S curves for one sex, in arrays sorted by age in months."""
+
+    def __init__(self, ages, L, M, S):
+        order = np.argsort(ages)
+        self.ages = np.asarray(ages, dtype=np.float64)[order]
+        self.L = np.asarray(L, dtype=np.float64)[order]
+        self.M = np.asarray(M, dtype=np.float64)[order]
+        self.S = np.asarray(S, dtype=np.float64)[order]
+        self.age_index = self.ages.tolist()  # plain list for bisect on the scalar path
+        self.lms = list(zip(self.L.tolist(), self.M.tolist(), self.S.tolist()))
+
+    def at(self, age_months):
+        """(L, M, S) linearly interpolated at one age, or None outside the table."""
+        i = bisect.bisect_left(self.age_index, age_months)
+        if i < len(self.age_index) and self.age_index[i] == age_months:
+            return self.lms[i]
+        if i == 0 or i == len(self.age_index):
+            return None
+        a0, a1 = self.age_index[i - 1], self.age_index[i]
+        w = (age_months - a0) / (a1 - a0)
+        return tuple(p0 + w * (p1 - p0) for p0, p1 in zip(self.lms[i - 1], self.lms[i]))
+
+    def at_many(self, age_months):
+        """Arrays of L, M, S at each age; NaN outside the table."""
+        age_months = np.asarray(age_months, dtype=np.float64)
+        inside = (age_months >= self.ages[0]) & (age_months <= self.ages[-1])
+        i = np.clip(np.searchsorted(self.ages, age_months), 1, len(self.ages) - 1)
+        a0, a1 = self.ages[i - 1], self.ages[i]
+        w = np.where(inside, (age_months - a0) / (a1 - a0), np.nan)
+        return tuple(p[i - 1] + w * (p[i] - p[i - 1]) for p in (self.L, self.M, self.S))
+
+
+def lms_zscore(bmi, L, M, S, restrict=True):
+    """BMI z-score from LMS parameters, elementwise.
+
+    With `restrict` the WHO adjustment beyond +/-3 SD is applied: distances
+    past the 3 SD curve are measured in units of the 2-3 SD gap, which keeps
+    extreme values from being stretched by the skewed tail.
+    """
+    bmi, L, M, S = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (bmi, L, M, S)))
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        zero = L == 0
+        safe_L = np.where(zero, 1.0, L)
+        z = np.where(zero, np.log(bmi / M) / S, ((bmi / M) ** safe_L - 1.0) / (safe_L * S))
+        if restrict:
+            def curve(sd):
+                return np.where(zero, M * np.exp(S * sd), M * (1.0 + safe_L * S * sd) ** (1.0 / safe_L))
+
+            sd3, sd2 = curve(3.0), curve(2.0)
+            sd3neg, sd2neg = curve(-3.0), curve(-2.0)
+            z = np.where(z > 3, 3.0 + (bmi - sd3) / (sd3 - sd2), z)
+            z = np.where(z < -3, -3.0 + (bmi - sd3neg) / (sd2neg - sd3neg), z)
+    return z
+
+
+def lms_zscore_one(bmi, L, M, S, restrict=True):
+    """Scalar `lms_zscore` in plain floats, for single lookups."""
+    def curve(sd):
+        return M * math.exp(S * sd) if L == 0 else M * (1.0 + L * S * sd) ** (1.0 / L)
+
+    z = math.log(bmi / M) / S if L == 0 else ((bmi / M) ** L - 1.0) / (L * S)
+    if restrict and z > 3:
+        sd3 = curve(3.0)
+        z = 3.0 + (bmi - sd3) / (sd3 - curve(2.0))
+    elif restrict and z < -3:
+        sd3neg = curve(-3.0)
+        z = -3.0 + (bmi - sd3neg) / (curve(-2.0) - sd3neg)
+    return z
+
+
+class BMIForAge:
+    """BMI-for-age reference tables indexed by sex and age.
+
+    A single lookup is a bisect into the sex's age list plus one LMS
+    evaluation; `zscores` scores whole columns with searchsorted and array
+    arithmetic.
+    """
+
+    def __init__(self, tables, restrict=True):
+        self.tables = tables  # {MALE: LMSTable, FEMALE: LMSTable}
+        self.restrict = restrict
+
+    @classmethod
+    def from_csv(cls, path=LMS_PATH, restrict=None):
+        """Load a table with sex, age in months, L, M and S columns.
+
+        The column names of CDC's bmiagerev.csv (Sex, Agemos, L, M, S) and of
+        the WHO expanded tables (Month, L, M, S, plus a sex column) are
+        recognised. `restrict` defaults to WHO's +/-3 SD adjustment for WHO
+        tables only; CDC z-scores come straight from the LMS formula.
+        """
+        with open(path, newline="") as f:
+            reader = csv.DictReader(f)
+            sex_key = next((c for c in SEX_COLUMNS if c in reader.fieldnames), None)
+            age_key = next((c for c in AGE_COLUMNS if c in reader.fieldnames), None)
+            if sex_key is None or age_key is None or not {"L", "M", "S"} <= set(reader.fieldnames):
+                raise ValueError(f"{path}: expected sex, age in months, L, M and S columns, got {reader.fieldnames}")
+            rows = {MALE: [], FEMALE: []}
+            for row in reader:
+                sex = int(parse_sex([row[sex_key]])[0])
+                if sex:
+                    rows[sex].append((float(row[age_key]), float(row["L"]), float(row["M"]), float(row["S"])))
+        tables = {sex: LMSTable(*zip(*values)) for sex, values in rows.items() if values}
+        if restrict is None:
+            restrict = age_key in WHO_AGE_COLUMNS
+        return cls(tables, restrict)
+
+    def zscore(self, sex, age_months, bmi):
+        """z-score for one child, or None when the table does not cover them."""
+        table = self.tables.get(sex)
+        lms = table.at(age_months) if table is not None else None
+        if lms is None:
+            return None
+        return lms_zscore_one(bmi, *lms, restrict=self.restrict)
+
+    def zscores(self, sex, age_months, bmi):
+        """Vectorized z-scores; NaN where sex or age is outside the tables."""
+        sex = np.asarray(sex)
+        bmi = np.asarray(bmi, dtype=np.float64)
+        age_months = np.asarray(age_months, dtype=np.float64)
+        z = np.full(bmi.shape, np.nan)
+        for code, table in self.tables.items():
+            rows = sex == code
+            if rows.any():
+                z[rows] = lms_zscore(bmi[rows], *table.at_many(age_months[rows]), restrict=self.restrict)
+        return z
+
+    def classify(self, sex, age_months, bmi, category):
+        """Age-adjusted `(category, z, percentile)` arrays for a scored batch.
+
+        Children the tables cover are re-categorised by percentile; adults
+        and uncovered rows keep the adult `category` with NaN z and percentile.
+        """
+        age_months = np.asarray(age_months, dtype=np.float64)
+        child = (age_months < ADULT_MONTHS) & (category != INVALID)
+        z = np.full(np.shape(bmi), np.nan)
+        if child.any():
+            z[child] = self.zscores(np.asarray(sex)[child], age_months[child], np.asarray(bmi)[child])
+        percentile = normal_cdf(z) * 100.0
+        scored = ~np.isnan(z)
+        category = category.copy()
+        category[scored] = np.digitize(percentile[scored], PERCENTILE_CUTOFFS)
+        return category, z, percentile
+
+
+_loaded = {}
+
+
+def load_reference(path=LMS_PATH):
+    """The reference at `path`, loaded once per process, or None if the file is missing."""
+    key = str(path)
+    if key not in _loaded:
+        _loaded[key] = BMIForAge.from_csv(path) if Path(path).exists() else None
+    return _loaded[key]
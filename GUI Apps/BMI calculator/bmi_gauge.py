@@ -0,0 +1,120 @@
+import math
+
+from PyQt5.QtCore import Qt, QPointF, QRect, QRectF, QSize
+from PyQt5.QtGui import QColor, QFont, QPainter, QPainterPath, QPixmap
+from PyQt5.QtWidgets import QWidget
+
+from bmi_engine import CATEGORIES, COLORS, THRESHOLDS
+
+GAUGE_MIN = 12.0
+GAUGE_MAX = 40.0
+MARKER_HALF_WIDTH = 28  # wide enough for the value text over the marker
+
+
+class BMIGauge(QWidget):
+    """The four BMI category bands with a marker at the current value.
+
+    Bands, labels and ticks are painted once per widget size and pixel ratio
+    into a cached pixmap rendered at device resolution, so they stay sharp on
+    any screen. A new value only invalidates the old and new marker strips,
+    and a repaint is one pixmap blit of that strip plus the marker.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.value = None
+        self._bands = None
+        self._bands_key = None
+        self.bar_top = 22
+        self.bar_height = 26
+        self.margin = MARKER_HALF_WIDTH
+        self.setMinimumHeight(self.bar_top + self.bar_height + 22)
+        self.setFont(QFont("Arial", 10))
+
+    def sizeHint(self):
+        return QSize(400, self.minimumHeight())
+
+    def set_value(self, bmi):
+        """Move the marker to `bmi`; None or NaN hides it."""
+        if bmi is not None and math.isnan(bmi):
+            bmi = None
+        if bmi == self.value:
+            return
+        old = self._marker_rect(self.value)
+        self.value = bmi
+        for rect in (old, self._marker_rect(bmi)):
+            if rect is not None:
+                self.update(rect)
+
+    # ==== Geometry ====
+    def _x(self, bmi):
+        span = self.width() - 2 * self.margin
+        fraction = (min(max(bmi, GAUGE_MIN), GAUGE_MAX) - GAUGE_MIN) / (GAUGE_MAX - GAUGE_MIN)
+        return self.margin + fraction * span
+
+    def _marker_rect(self, bmi):
+        if bmi is None:
+            return None
+        x = round(self._x(bmi))
+        return QRect(x - MARKER_HALF_WIDTH, 0, 2 * MARKER_HALF_WIDTH, self.bar_top + self.bar_height)
+
+    # ==== Cached band layer ====
+    def _band_layer(self):
+        ratio = self.devicePixelRatioF()
+        key = (self.width(), self.height(), ratio)
+        if key != self._bands_key:
+            self._bands = self._render_bands(ratio)
+            self._bands_key = key
+        return self._bands
+
+    def _render_bands(self, ratio):
+        pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self.font())
+
+        edges = [GAUGE_MIN, *THRESHOLDS.tolist(), GAUGE_MAX]
+        bar = QRectF(self.margin, self.bar_top, self.width() - 2 * self.margin, self.bar_height)
+        outline = QPainterPath()
+        outline.addRoundedRect(bar, 6, 6)
+        painter.setClipPath(outline)
+        for i, name in enumerate(CATEGORIES):
+            band = QRectF(QPointF(self._x(edges[i]), bar.top()), QPointF(self._x(edges[i + 1]), bar.bottom()))
+            painter.fillRect(band, QColor(COLORS[i]))
+            painter.setPen(QColor("white"))
+            painter.drawText(band, Qt.AlignCenter, name)
+        painter.setClipping(False)
+
+        painter.setPen(QColor("#555"))
+        label_top = bar.bottom() + 2
+        for threshold in THRESHOLDS.tolist():
+            x = self._x(threshold)
+            painter.drawText(QRectF(x - 20, label_top, 40, 18), Qt.AlignHCenter | Qt.AlignTop, f"{threshold:g}")
+        painter.end()
+        return pixmap
+
+    # ==== Painting ====
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = event.rect()
+        bands = self._band_layer()
+        ratio = bands.devicePixelRatioF()
+        source = QRectF(rect.x() * ratio, rect.y() * ratio, rect.width() * ratio, rect.height() * ratio)
+        painter.drawPixmap(QRectF(rect), bands, source)
+        if self.value is None:
+            return
+
+        painter.setRenderHint(QPainter.Antialiasing)
+        x = self._x(self.value)
+        tip = self.bar_top + 4
+        marker = QPainterPath()
+        marker.moveTo(x, tip)
+        marker.lineTo(x - 7, tip - 10)
+        marker.lineTo(x + 7, tip - 10)
+        marker.closeSubpath()
+        painter.fillPath(marker, QColor("#333"))
+        painter.setPen(QColor("#333"))
+        painter.drawText(QRectF(x - MARKER_HALF_WIDTH, 0, 2 * MARKER_HALF_WIDTH, tip - 10),
+                         Qt.AlignHCenter | Qt.AlignBottom, f"{self.value:.1f}")
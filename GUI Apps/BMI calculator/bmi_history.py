@@ -0,0 +1,181 @@
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+
+import numpy as np
+
+DATA_DIR = Path.home() / ".bmi_calculator"
+DB_PATH = DATA_DIR / "history.db"
+BLOCK_SIZE = 4096
+COLUMNS = ("ts", "bmi", "weight_kg", "height_m")
+
+# New readings land in `readings`, one row each. Once a person has
+# BLOCK_SIZE of them the writer packs the oldest into one `blocks` row of
+# float64 arrays, so a range read touches a few hundred blobs, not a million
+# rows. WITHOUT ROWID clusters readings on (person, time); blocks get their
+# own id, since a late or re-imported reading can start a block at the same
+# time as an older one, and are found through their (person, first_ts) index.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS readings (
+    person    TEXT NOT NULL,
+    ts        REAL NOT NULL,
+    bmi       REAL NOT NULL,
+    weight_kg REAL NOT NULL,
+    height_m  REAL NOT NULL,
+    PRIMARY KEY (person, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS blocks (
+    id        INTEGER PRIMARY KEY,
+    person    TEXT NOT NULL,
+    first_ts  REAL NOT NULL,
+    last_ts   REAL NOT NULL,
+    count     INTEGER NOT NULL,
+    ts        BLOB NOT NULL,
+    bmi       BLOB NOT NULL,
+    weight_kg BLOB NOT NULL,
+    height_m  BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blocks_range ON blocks (person, first_ts);
+"""
+BLOCK_FIELDS = "person, first_ts, last_ts, count, ts, bmi, weight_kg, height_m"
+
+
+class BMIHistory:
+    """Time-series store of BMI readings per person in SQLite (WAL mode).
+
+    Range reads run on the caller's thread and come back as NumPy arrays.
+    Appends are queued to a background thread that commits whatever has
+    piled up in one transaction and packs full blocks, so recording a
+    reading never blocks the GUI.
+    """
+
+    def __init__(self, path=DB_PATH):
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._reader = self._connect()
+        self._upgrade_blocks()
+        self._reader.executescript(SCHEMA)
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="bmi-history-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _upgrade_blocks(self):
+        # Blocks used to be keyed by (person, first_ts); move them to the id table
+        columns = [row[1] for row in self._reader.execute("PRAGMA table_info(blocks)")]
+        if columns and "id" not in columns:
+            with self._reader:
+                self._reader.execute("ALTER TABLE blocks RENAME TO blocks_old")
+                self._reader.executescript(SCHEMA)
+                self._reader.execute(f"INSERT INTO blocks ({BLOCK_FIELDS}) SELECT {BLOCK_FIELDS} FROM blocks_old")
+                self._reader.execute("DROP TABLE blocks_old")
+
+    # ==== Reads ====
+    def people(self):
+        return [row[0] for row in self._reader.execute(
+            "SELECT person FROM readings UNION SELECT person FROM blocks ORDER BY person")]
+
+    def count(self, person):
+        return self._reader.execute(
+            "SELECT (SELECT COUNT(*) FROM readings WHERE person = ?)"
+            " + (SELECT COALESCE(SUM(count), 0) FROM blocks WHERE person = ?)",
+            (person, person),
+        ).fetchone()[0]
+
+    def query(self, person, start=float("-inf"), end=float("inf")):
+        """`(ts, bmi)` float64 arrays for `person` with start <= ts <= end, oldest first."""
+        parts_ts, parts_bmi = [], []
+        for ts, bmi in self._reader.execute(
+            "SELECT ts, bmi FROM blocks WHERE person = ? AND first_ts <= ? AND last_ts >= ? ORDER BY first_ts",
+            (person, end, start),
+        ):
+            parts_ts.append(np.frombuffer(ts, dtype=np.float64))
+            parts_bmi.append(np.frombuffer(bmi, dtype=np.float64))
+        rows = self._reader.execute(
+            "SELECT ts, bmi FROM readings WHERE person = ? AND ts BETWEEN ? AND ? ORDER BY ts",
+            (person, start, end),
+        ).fetchall()
+        if rows:
+            tail = np.array(rows, dtype=np.float64)
+            parts_ts.append(tail[:, 0])
+            parts_bmi.append(tail[:, 1])
+        if not parts_ts:
+            return np.empty(0), np.empty(0)
+
+        ts, bmi = np.concatenate(parts_ts), np.concatenate(parts_bmi)
+        inside = (ts >= start) & (ts <= end)  # edge blocks straddle the range
+        if not inside.all():
+            ts, bmi = ts[inside], bmi[inside]
+        if ts.size > 1 and (np.diff(ts) < 0).any():  # a late reading predates a packed block
+            order = np.argsort(ts, kind="stable")
+            ts, bmi = ts[order], bmi[order]
+        return ts, bmi
+
+    # ==== Writes (queued) ====
+    def append(self, person, ts, bmi, weight_kg, height_m):
+        self.append_many([(person, ts, bmi, weight_kg, height_m)])
+
+    def append_many(self, rows):
+        """Queue `(person, ts, bmi, weight_kg, height_m)` rows."""
+        self._queue.put(rows)
+
+    def flush(self):
+        """Block until every queued append is committed."""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self):
+        self._queue.put(None)
+        self._writer.join()
+        self._reader.close()
+
+    def _write_loop(self):
+        conn = self._connect()
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            waiters = []
+            touched = set()
+            with conn:
+                for op in batch:
+                    if op is None:
+                        running = False
+                        break
+                    if isinstance(op, threading.Event):
+                        waiters.append(op)
+                        continue
+                    rows = list(op)
+                    conn.executemany("INSERT OR REPLACE INTO readings VALUES (?, ?, ?, ?, ?)", rows)
+                    touched.update(row[0] for row in rows)
+                for person in touched:
+                    self._pack_blocks(conn, person)
+            for done in waiters:
+                done.set()
+        conn.close()
+
+    def _pack_blocks(self, conn, person):
+        pending = conn.execute("SELECT COUNT(*) FROM readings WHERE person = ?", (person,)).fetchone()[0]
+        while pending >= BLOCK_SIZE:
+            block = np.array(conn.execute(
+                "SELECT ts, bmi, weight_kg, height_m FROM readings WHERE person = ? ORDER BY ts LIMIT ?",
+                (person, BLOCK_SIZE),
+            ).fetchall(), dtype=np.float64)
+            first, last = float(block[0, 0]), float(block[-1, 0])
+            conn.execute(
+                f"INSERT INTO blocks ({BLOCK_FIELDS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (person, first, last, len(block), *(block[:, i].tobytes() for i in range(len(COLUMNS)))),
+            )
+            conn.execute("DELETE FROM readings WHERE person = ? AND ts <= ?", (person, last))
+            pending -= len(block)
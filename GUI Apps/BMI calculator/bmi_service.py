@@ -0,0 +1,277 @@
+import argparse
+import asyncio
+import json
+import math
+import signal
+import time
+from collections import deque
+
+import numpy as np
+
+from bmi_engine import CATEGORIES, INVALID, compute_bmi
+from units import HEIGHT_UNITS, WEIGHT_UNITS
+
+# Localhost BMI scoring over HTTP/JSON, using the same engine as the GUI and
+# the CLI. No Qt, no third-party web framework, no network access needed.
+#   POST /bmi        {"weight": 70, "height": 1.75, "weight_unit": "kg", "height_unit": "meters"}
+#                    -> {"bmi": 22.86, "category": "Normal weight"}
+#   POST /bmi/bulk   {"weight": [...], "height": [...], "weight_unit": ..., "height_unit": ...}
+#                    -> {"bmi": [...], "category": [...]}   (null for invalid rows)
+#                    units may also be lists, one per row
+#   Compound units take their second field as "weight_part" / "height_part",
+#   e.g. {"height": 5, "height_unit": "ft+in", "height_part": 11}
+#   GET  /stats      latency p50/p99, requests per second, batching counters
+#   python bmi_service.py [--port 8765]
+
+HOST = "127.0.0.1"
+PORT = 8765
+BATCH_WINDOW = 0.002  # seconds a single request may wait for company
+MAX_BATCH = 4096
+MAX_BODY = 64 * 1024 * 1024
+LATENCY_SAMPLES = 10_000
+RATE_WINDOW = 10.0  # seconds of completions behind the requests/s figure
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+           500: "Internal Server Error"}
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def parse_units(payload):
+    """Unit codes for a request: one each, or arrays for per-row bulk units."""
+    codes = []
+    for registry, key, default in ((WEIGHT_UNITS, "weight_unit", "kg"), (HEIGHT_UNITS, "height_unit", "meters")):
+        unit = payload.get(key, default)
+        try:
+            codes.append(registry.code(unit) if isinstance(unit, str) else registry.codes([str(u) for u in unit]))
+        except (TypeError, ValueError) as e:
+            raise BadRequest(f"{key}: {e}") from None
+    return codes
+
+
+def score_to_json(bmi, category):
+    """Lists of rounded BMI and category names, None for invalid rows."""
+    rounded = np.round(bmi, 2).tolist()
+    names = [CATEGORIES[c] if c != INVALID else None for c in category.tolist()]
+    return [None if math.isnan(b) else b for b in rounded], names
+
+
+class MicroBatcher:
+    """Collects concurrent single requests into one vectorized compute_bmi call.
+
+    The first request of a batch arms a `window`-second timer; the batch is
+    scored when the timer fires or when `max_batch` requests are waiting,
+    whichever comes first. Units travel as per-row codes, so requests in
+    different units share the batch.
+    """
+
+    def __init__(self, window=BATCH_WINDOW, max_batch=MAX_BATCH):
+        self.window = window
+        self.max_batch = max_batch
+        self.pending = []
+        self._timer = None
+        self.batches = 0
+        self.batched_requests = 0
+
+    def submit(self, weight, height, weight_unit, height_unit, weight_part=0.0, height_part=0.0):
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((weight, height, weight_unit, height_unit, weight_part, height_part, future))
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self.flush)
+        return future
+
+    def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+        self.batches += 1
+        self.batched_requests += len(batch)
+        weight, height, weight_unit, height_unit, weight_part, height_part, futures = zip(*batch)
+        try:
+            bmi, names = score_to_json(*compute_bmi(
+                np.array(weight), np.array(height), np.array(weight_unit, dtype=np.intp),
+                np.array(height_unit, dtype=np.intp), np.array(weight_part), np.array(height_part)))
+        except Exception as e:
+            # Runs from a timer callback: fail the batch rather than leave it hanging
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, value, name in zip(futures, bmi, names):
+            if not future.done():
+                future.set_result((value, name))
+
+
+class ServiceStats:
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.rows = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)  # seconds, most recent requests
+        self.completions = deque()  # monotonic times within RATE_WINDOW
+
+    def record(self, latency, rows):
+        now = time.monotonic()
+        self.requests += 1
+        self.rows += rows
+        self.latencies.append(latency)
+        self.completions.append(now)
+        while self.completions and self.completions[0] < now - RATE_WINDOW:
+            self.completions.popleft()
+
+    def snapshot(self, batcher):
+        now = time.monotonic()
+        while self.completions and self.completions[0] < now - RATE_WINDOW:
+            self.completions.popleft()
+        window = min(RATE_WINDOW, now - self.started) or 1.0
+        result = {
+            "requests": self.requests,
+            "rows": self.rows,
+            "uptime_s": round(now - self.started, 1),
+            "requests_per_s": round(len(self.completions) / window, 1),
+            "batches": batcher.batches,
+            "mean_batch": round(batcher.batched_requests / batcher.batches, 2) if batcher.batches else 0,
+        }
+        if self.latencies:
+            p50, p99 = np.percentile(np.fromiter(self.latencies, dtype=np.float64), [50, 99]) * 1000
+            result.update(p50_ms=round(float(p50), 3), p99_ms=round(float(p99), 3))
+        return result
+
+
+class BMIService:
+    def __init__(self, batch_window=BATCH_WINDOW, max_batch=MAX_BATCH):
+        self.batcher = MicroBatcher(batch_window, max_batch)
+        self.stats = ServiceStats()
+
+    # ==== Endpoints ====
+    async def score_one(self, payload):
+        # Per-row unit lists are for /bmi/bulk; a batch row takes one code each
+        for key in ("weight_unit", "height_unit"):
+            if not isinstance(payload.get(key, ""), str):
+                raise BadRequest(f"{key} must be a unit name")
+        weight_unit, height_unit = parse_units(payload)
+        try:
+            weight, height = float(payload["weight"]), float(payload["height"])
+            weight_part, height_part = float(payload.get("weight_part", 0)), float(payload.get("height_part", 0))
+        except (KeyError, TypeError, ValueError):
+            raise BadRequest("weight and height must be numbers") from None
+        bmi, category = await self.batcher.submit(weight, height, weight_unit, height_unit, weight_part, height_part)
+        return {"bmi": bmi, "category": category}, 1
+
+    def score_bulk(self, payload):
+        weight_unit, height_unit = parse_units(payload)
+        try:
+            weight = np.array(payload["weight"], dtype=np.float64)
+            height = np.array(payload["height"], dtype=np.float64)
+            parts = [np.array(payload.get(key, 0), dtype=np.float64) for key in ("weight_part", "height_part")]
+        except (KeyError, TypeError, ValueError):
+            raise BadRequest("weight and height must be lists of numbers") from None
+        if weight.ndim != 1 or weight.shape != height.shape:
+            raise BadRequest("weight and height must be lists of the same length")
+        if any(np.ndim(a) and np.shape(a) != weight.shape for a in (weight_unit, height_unit, *parts)):
+            raise BadRequest("per-row units and parts must match the length of weight")
+        bmi, names = score_to_json(*compute_bmi(weight, height, weight_unit, height_unit, *parts))
+        return {"bmi": bmi, "category": names}, len(bmi)
+
+    async def route(self, method, path, body):
+        if path == "/stats":
+            return 200, self.stats.snapshot(self.batcher), 0
+        if path == "/health":
+            return 200, {"ok": True}, 0
+        if path not in ("/bmi", "/bmi/bulk"):
+            return 404, {"error": f"no route {path}"}, 0
+        if method != "POST":
+            return 405, {"error": "use POST"}, 0
+        try:
+            payload = json.loads(body)
+            if not isinstance(payload, dict):
+                raise BadRequest("body must be a JSON object")
+            reply, rows = await self.score_one(payload) if path == "/bmi" else self.score_bulk(payload)
+        except (BadRequest, ValueError) as e:
+            return 400, {"error": str(e)}, 0
+        except Exception as e:
+            return 500, {"error": f"scoring failed: {e}"}, 0
+        return 200, reply, rows
+
+    # ==== HTTP/1.1 with keep-alive ====
+    async def handle_client(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                started = time.perf_counter()
+                method, path, version = request_line.decode("latin-1").split()
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY:
+                    self.respond(writer, 413, {"error": "body too large"}, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                status, reply, rows = await self.route(method, path.split("?")[0], body)
+                close = headers.get("connection", "").lower() == "close" or version == "HTTP/1.0"
+                self.respond(writer, status, reply, close)
+                await writer.drain()
+                if path.startswith("/bmi"):
+                    self.stats.record(time.perf_counter() - started, rows)
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def respond(self, writer, status, reply, close=False):
+        body = json.dumps(reply).encode()
+        head = (f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n{'Connection: close' if close else 'Connection: keep-alive'}\r\n\r\n")
+        writer.write(head.encode() + body)
+
+
+async def serve(host=HOST, port=PORT, batch_window=BATCH_WINDOW, report_every=10.0):
+    service = BMIService(batch_window)
+    server = await asyncio.start_server(service.handle_client, host, port)
+    print(f"🧮 BMI service on http://{host}:{port} (batch window {batch_window * 1000:g} ms)", flush=True)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    reported = 0
+    try:
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), report_every)
+            except asyncio.TimeoutError:
+                pass
+            if service.stats.requests != reported:
+                reported = service.stats.requests
+                stats = service.stats.snapshot(service.batcher)
+                print(f"   {stats['requests_per_s']} req/s  p50 {stats.get('p50_ms', 0)} ms"
+                      f"  p99 {stats.get('p99_ms', 0)} ms  mean batch {stats['mean_batch']}", flush=True)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Localhost BMI scoring service")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--batch-window-ms", type=float, default=BATCH_WINDOW * 1000)
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.batch_window_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+import contextlib
+import csv
+import io
+import itertools
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from bmi_engine import CATEGORIES, INVALID, compute_bmi
+from bmi_for_age import LMS_PATH, load_reference, parse_sex
+from units import HEIGHT_UNITS, WEIGHT_UNITS
+
+CHUNK_ROWS = 100_000
+OUTPUT_HEADER = ["weight", "height", "bmi", "category"]
+AGE_HEADER = ["bmi_z", "bmi_percentile"]
+CATEGORY_NAMES = np.array(CATEGORIES + ("Invalid",))  # INVALID (-1) picks the last name
+
+
+def parse_floats(values):
+    """Strings to float64; blanks and junk become NaN instead of raising."""
+    array = np.asarray(values)
+    blank = array == ""
+    if blank.any():
+        array = np.where(blank, "nan", array)  # stays vectorized for sparse columns
+    try:
+        return array.astype(np.float64)
+    except ValueError:
+        out = np.empty(len(values))
+        for i, value in enumerate(values):
+            try:
+                out[i] = float(value)
+            except ValueError:
+                out[i] = np.nan
+        return out
+
+
+class ScoreOptions:
+    """Everything a worker needs besides the chunk itself; small and picklable."""
+
+    __slots__ = ("weight_unit", "height_unit", "age_unit", "lms_path", "output")
+
+    def __init__(self, weight_unit="kg", height_unit="meters", age_unit="years", lms_path=LMS_PATH, output=None):
+        self.weight_unit = weight_unit
+        self.height_unit = height_unit
+        self.age_unit = age_unit
+        self.lms_path = lms_path
+        # "text" for ready-to-write CSV rows, "columns" for arrays, None for totals only
+        self.output = output
+
+
+class ChunkResult:
+    __slots__ = ("rows", "counts", "invalid", "bmi_sum", "text", "columns")
+
+    def __init__(self, weight, height, bmi, category, age_scores, output):
+        valid = category != INVALID
+        self.rows = len(bmi)
+        self.counts = np.bincount(category[valid], minlength=len(CATEGORIES))
+        self.invalid = self.rows - int(np.count_nonzero(valid))
+        self.bmi_sum = float(bmi[valid].sum())
+        self.text = self.columns = None
+        columns = [weight, height, bmi, category] + list(age_scores or ())
+        if output == "text":
+            formatted = [weight.tolist(), height.tolist(), np.char.mod("%.2f", bmi).tolist(),
+                         CATEGORY_NAMES[category].tolist()]
+            if age_scores:
+                z, percentile = age_scores
+                formatted += [np.char.mod("%.3f", z).tolist(), np.char.mod("%.1f", percentile).tolist()]
+            out = io.StringIO()
+            csv.writer(out).writerows(zip(*formatted))
+            self.text = out.getvalue()
+        elif output == "columns":
+            self.columns = columns
+
+
+def score_lines(lines, indexes, options):
+    """Worker: parse one chunk of CSV lines, score it and format the output.
+
+    `indexes` maps "weight", "height" and optionally "age", "sex",
+    "weight_unit", "height_unit", "weight_part" and "height_part" to CSV
+    column positions.
+    """
+    fields = {name: [] for name in indexes}
+    for row in csv.reader(lines):
+        for name, index in indexes.items():
+            fields[name].append(row[index] if index < len(row) else "")
+    age = parse_floats(fields["age"]) if "age" in fields else None
+    units = (fields.get("weight_unit"), fields.get("height_unit"))
+    parts = tuple(parse_floats(fields[name]) if name in fields else None for name in ("weight_part", "height_part"))
+    return score_columns(parse_floats(fields["weight"]), parse_floats(fields["height"]),
+                         age, fields.get("sex"), units, parts, options)
+
+
+def missing_parts(registry, unit, part):
+    """Rows in a compound unit ("ft+in") with no column for the second field."""
+    if part is not None:
+        return False
+    code = registry.code(unit) if isinstance(unit, str) else unit
+    return registry.part_factors[code] != 0
+
+
+def score_columns(weight, height, age, sex, units, parts, options):
+    """Worker: score one chunk of already-numeric columns.
+
+    `units` holds per-row weight and height unit names, or None to use the
+    units in `options` for the whole chunk; blank cells also fall back to
+    those. `parts` holds the second field of compound units (blank counts as
+    0), or None; rows in a compound unit without one are invalid rather than
+    scored on the first field alone. With an `age` column, children covered
+    by the BMI-for-age tables are categorised by percentile and the z-score
+    and percentile are added.
+    """
+    weight_units, height_units = units
+    weight_part, height_part = parts
+    weight_unit = options.weight_unit if weight_units is None else WEIGHT_UNITS.codes(weight_units, options.weight_unit)
+    height_unit = options.height_unit if height_units is None else HEIGHT_UNITS.codes(height_units, options.height_unit)
+    bmi, category = compute_bmi(weight, height, weight_unit, height_unit, weight_part, height_part)
+    missing = (missing_parts(WEIGHT_UNITS, weight_unit, weight_part)
+               | missing_parts(HEIGHT_UNITS, height_unit, height_part))
+    if np.any(missing):
+        bmi = np.where(missing, np.nan, bmi)
+        category = np.where(missing, INVALID, category).astype(np.int8)
+    age_scores = None
+    if age is not None:
+        reference = load_reference(options.lms_path)
+        if reference is None:
+            raise FileNotFoundError(f"BMI-for-age table not found: {options.lms_path}")
+        age_months = age * 12 if options.age_unit == "years" else age
+        sex = parse_sex(sex) if sex is not None else np.zeros(len(bmi), dtype=np.int64)
+        category, z, percentile = reference.classify(sex, age_months, bmi, category)
+        age_scores = (z, percentile)
+    return ChunkResult(weight, height, bmi, category, age_scores, options.output)
+
+
+# ==== Readers: yield (worker function, args, fraction of input read) per bounded chunk ====
+def _whole_records(f, lines):
+    """Extend `lines` until it ends outside quotes, so no quoted newline is split."""
+    quotes = sum(line.count('"') for line in lines)
+    while quotes % 2:  # "" escapes come in pairs, so odd means a field is still open
+        line = f.readline()
+        if not line:
+            break
+        lines.append(line)
+        quotes += line.count('"')
+    return lines
+
+
+def csv_chunks(path, columns, chunk_rows):
+    """CSV records in chunks of about `chunk_rows` lines; `path` "-" reads stdin, whose progress stays at 0."""
+    stdin = path == "-"
+    size = None if stdin else os.path.getsize(path) or 1
+    with contextlib.nullcontext(sys.stdin) if stdin else open(path, newline="") as f:
+        header_lines = _whole_records(f, [f.readline()])
+        indexes = _column_indexes(next(csv.reader(header_lines)), columns)
+        consumed = sum(map(len, header_lines))
+        while True:
+            lines = _whole_records(f, list(itertools.islice(f, chunk_rows)))
+            if not lines:
+                return
+            consumed += sum(map(len, lines))  # characters, close enough to bytes for progress
+            yield score_lines, (lines, indexes), min(1.0, consumed / size) if size else 0.0
+
+
+def parquet_chunks(path, columns, chunk_rows):
+    import pyarrow as pa  # optional; only needed for Parquet input
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(path)
+    _column_indexes(parquet.schema_arrow.names, columns)
+    names = list(columns)
+    total = parquet.metadata.num_rows or 1
+    consumed = 0
+    text = ("sex", "weight_unit", "height_unit")
+    for batch in parquet.iter_batches(batch_size=chunk_rows, columns=[columns[name] for name in names]):
+        data = {}
+        for name in names:
+            column = batch.column(columns[name])
+            if name in text:
+                # Null cells become blanks, which fall back to the default unit like empty CSV cells
+                column = column.cast(pa.string()).fill_null("")
+            data[name] = column.to_numpy(zero_copy_only=False)
+        numeric = {name: data[name].astype(np.float64)
+                   for name in ("weight", "height", "age", "weight_part", "height_part") if name in data}
+        sex = data["sex"].astype(str) if "sex" in data else None
+        units = tuple(data[name].astype(str) if name in data else None for name in ("weight_unit", "height_unit"))
+        parts = (numeric.get("weight_part"), numeric.get("height_part"))
+        consumed += batch.num_rows
+        yield (score_columns, (numeric["weight"], numeric["height"], numeric.get("age"), sex, units, parts),
+               consumed / total)
+
+
+def _column_indexes(header, columns):
+    """Positions of the wanted columns; `columns` maps role -> column name."""
+    missing = [name for name in columns.values() if name not in header]
+    if missing:
+        raise ValueError(f"Input needs {', '.join(repr(m) for m in missing)} column(s), got {header}")
+    return {role: header.index(name) for role, name in columns.items()}
+
+
+# ==== Writers ====
+class CsvSink:
+    output = "text"
+
+    def __init__(self, path, with_age=False):
+        self.f = open(path, "w", newline="")
+        csv.writer(self.f).writerow(OUTPUT_HEADER + (AGE_HEADER if with_age else []))
+
+    def write(self, result):
+        self.f.write(result.text)
+
+    def close(self):
+        self.f.close()
+
+
+class ParquetSink:
+    output = "columns"
+
+    def __init__(self, path, with_age=False):
+        import pyarrow as pa  # optional; only needed for Parquet output
+        import pyarrow.parquet as pq
+
+        self.pa = pa
+        fields = [("weight", pa.float64()), ("height", pa.float64()), ("bmi", pa.float64()), ("category", pa.string())]
+        if with_age:
+            fields += [(name, pa.float64()) for name in AGE_HEADER]
+        self.schema = pa.schema(fields)
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, result):
+        weight, height, bmi, category, *age_scores = result.columns
+        self.writer.write_table(self.pa.table(
+            [weight, height, bmi, CATEGORY_NAMES[category], *age_scores], schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+def is_parquet(path):
+    return str(path).lower().endswith((".parquet", ".pq"))
+
+
+class StreamStats:
+    def __init__(self):
+        self.progress = 0.0  # fraction of the input read and written
+        self.cancelled = False
+        self.rows = 0
+        self.invalid = 0
+        self.bmi_sum = 0.0
+        self.counts = np.zeros(len(CATEGORIES), dtype=np.int64)
+
+    def add(self, result):
+        self.rows += result.rows
+        self.invalid += result.invalid
+        self.bmi_sum += result.bmi_sum
+        self.counts += result.counts
+
+    def category_counts(self):
+        return dict(zip(CATEGORIES, self.counts.tolist()))
+
+    def mean_bmi(self):
+        valid = self.rows - self.invalid
+        return self.bmi_sum / valid if valid else float("nan")
+
+
+def stream(input_path, output_path=None, weight_unit="kg", height_unit="meters",
+           weight_column="weight", height_column="height",
+           chunk_rows=CHUNK_ROWS, workers=None, on_chunk=None,
+           age_column=None, sex_column=None, age_unit="years", lms_path=LMS_PATH, cancel=None,
+           mp_context=None, weight_unit_column=None, height_unit_column=None,
+           weight_part_column=None, height_part_column=None):
+    """Score a file of any size in bounded chunks across a process pool.
+
+    Chunks are read lazily and at most two per worker are in flight, so peak
+    memory depends on `chunk_rows` and `workers`, not on the file size.
+    Results are written in input order as they complete. `workers=0` scores
+    in this process; the default is one process per core, or in-process on a
+    single core. `on_chunk(stats)` is called after every written chunk.
+    With `age_column` (and ideally `sex_column`) children are scored
+    against the BMI-for-age tables at `lms_path`. `weight_unit_column` and
+    `height_unit_column` name columns giving each row's unit; blank cells
+    use `weight_unit` / `height_unit`. `weight_part_column` and
+    `height_part_column` give the second field of compound units (the lb of
+    "st+lb", the in of "ft+in"); a compound unit for a whole file needs
+    one, and compound per-row units without one score as invalid. Setting the
+    `threading.Event` `cancel` stops after the chunk being written, drops
+    queued chunks and returns the partial stats with `cancelled` set.
+    Callers inside a threaded GUI pass a "forkserver" or "spawn" `mp_context`.
+    """
+    columns = {"weight": weight_column, "height": height_column}
+    # Unknown names, and compound units with nowhere to read the second field, fail before any work
+    for kind, registry, unit, unit_column, part_column in (
+            ("weight", WEIGHT_UNITS, weight_unit, weight_unit_column, weight_part_column),
+            ("height", HEIGHT_UNITS, height_unit, height_unit_column, height_part_column)):
+        part = registry.part_name(unit)
+        if part and not part_column:
+            raise ValueError(f"{kind} unit {unit!r} needs a {kind} part column for the {part} of each row")
+        if unit_column:
+            columns[f"{kind}_unit"] = unit_column
+        if part_column:
+            columns[f"{kind}_part"] = part_column
+    if age_column:
+        if load_reference(lms_path) is None:
+            raise FileNotFoundError(f"BMI-for-age table not found: {lms_path}")
+        columns["age"] = age_column
+        if sex_column:
+            columns["sex"] = sex_column
+    reader = parquet_chunks if is_parquet(input_path) else csv_chunks
+    chunks = reader(input_path, columns, chunk_rows)
+    sink = None
+    if output_path:
+        sink = (ParquetSink if is_parquet(output_path) else CsvSink)(output_path, with_age=bool(age_column))
+    options = ScoreOptions(weight_unit, height_unit, age_unit, lms_path, sink.output if sink is not None else None)
+    stats = StreamStats()
+
+    def collect(result, progress):
+        stats.add(result)
+        stats.progress = progress
+        if sink is not None:
+            sink.write(result)
+        if on_chunk is not None:
+            on_chunk(stats)
+        if cancel is not None and cancel.is_set():
+            stats.cancelled = True
+        return not stats.cancelled
+
+    try:
+        if workers is None:
+            workers = os.cpu_count() or 1
+            workers = workers if workers > 1 else 0
+        if workers == 0:
+            for func, args, progress in chunks:
+                if not collect(func(*args, options), progress):
+                    break
+            return stats
+        with ProcessPoolExecutor(workers, mp_context=mp_context) as pool:
+            pending = deque()
+            for func, args, progress in chunks:
+                pending.append((pool.submit(func, *args, options), progress))
+                if len(pending) >= 2 * workers:
+                    future, progress = pending.popleft()
+                    if not collect(future.result(), progress):
+                        break
+            while pending and not stats.cancelled:
+                future, progress = pending.popleft()
+                collect(future.result(), progress)
+            pool.shutdown(cancel_futures=True)
+        return stats
+    finally:
+        chunks.close()
+        if sink is not None:
+            sink.close()
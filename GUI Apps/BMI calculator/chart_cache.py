@@ -0,0 +1,49 @@
+from collections import OrderedDict
+
+from PyQt5.QtCore import Qt
+
+WIDTH_BUCKET = 16
+
+
+class ScaledChart:
+    """Smoothly scaled copies of one pixmap, cached by width bucket.
+
+    Widths are rounded to WIDTH_BUCKET pixels so a window drag reuses a
+    handful of scaled copies. `preview` returns a cached smooth copy when one
+    exists and otherwise a cheap fast-transform scale; `smooth` does the
+    expensive scale once per bucket. The cache is a small LRU.
+    """
+
+    def __init__(self, pixmap, cache_size=8):
+        self.pixmap = pixmap
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def isNull(self):
+        return self.pixmap.isNull()
+
+    @staticmethod
+    def bucket(width):
+        return max(WIDTH_BUCKET, round(width / WIDTH_BUCKET) * WIDTH_BUCKET)
+
+    def cached(self, width):
+        key = self.bucket(width)
+        scaled = self._cache.get(key)
+        if scaled is not None:
+            self._cache.move_to_end(key)
+        return scaled
+
+    def preview(self, width):
+        scaled = self.cached(width)
+        if scaled is None:
+            scaled = self.pixmap.scaledToWidth(self.bucket(width), Qt.FastTransformation)
+        return scaled
+
+    def smooth(self, width):
+        scaled = self.cached(width)
+        if scaled is None:
+            key = self.bucket(width)
+            scaled = self._cache[key] = self.pixmap.scaledToWidth(key, Qt.SmoothTransformation)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return scaled
@@ -0,0 +1,46 @@
+import argparse
+import sys
+import tempfile
+import urllib.request
+from pathlib import Path
+
+from bmi_for_age import LMS_PATH, BMIForAge
+
+# Downloads CDC's BMI-for-age LMS table (public domain, ages 2-20) to
+# assets/bmi_for_age_lms.csv, where the GUI, the CLI and the service look
+# for it. Any other table with the same columns, e.g. WHO's, can be saved
+# there instead.
+#   python fetch_lms.py [--url ...] [-o assets/bmi_for_age_lms.csv]
+
+CDC_URL = "https://www.cdc.gov/growthcharts/data/zscore/bmiagerev.csv"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download the CDC BMI-for-age LMS table")
+    parser.add_argument("--url", default=CDC_URL)
+    parser.add_argument("-o", "--output", default=str(LMS_PATH))
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with urllib.request.urlopen(args.url, timeout=30) as response:
+            data = response.read()
+    except OSError as e:
+        sys.exit(f"⚠️ Could not download {args.url}: {e}")
+
+    # Check it parses before replacing whatever table is there now
+    with tempfile.NamedTemporaryFile("wb", suffix=".csv", dir=output.parent, delete=False) as f:
+        f.write(data)
+    try:
+        reference = BMIForAge.from_csv(f.name)
+    except (ValueError, KeyError) as e:
+        Path(f.name).unlink()
+        sys.exit(f"⚠️ {args.url} is not an LMS table: {e}")
+    Path(f.name).replace(output)
+    ages = [f"{t.ages[0] / 12:g}-{t.ages[-1] / 12:g} years" for t in reference.tables.values()]
+    print(f"👶 Saved {output} ({', '.join(ages)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import multiprocessing
+import os
+import threading
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from bmi_stream import stream
+
+
+class ImportSignals(QObject):
+    # fraction of the input done, rows scored
+    progress = pyqtSignal(float, int)
+    # partial summary: rows, invalid, mean_bmi, counts {category: n}
+    partial = pyqtSignal(dict)
+    finished = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+
+def summary(stats):
+    """Plain-dict snapshot of StreamStats, safe to hand to another thread."""
+    return {
+        "rows": stats.rows,
+        "invalid": stats.invalid,
+        "mean_bmi": stats.mean_bmi(),
+        "counts": stats.category_counts(),
+        "progress": stats.progress,
+        "cancelled": stats.cancelled,
+    }
+
+
+def worker_context():
+    # Forking a process that runs Qt threads can copy held locks into the child
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class ImportJob(QRunnable):
+    """Scores a dataset file to disk off the GUI thread.
+
+    Runs bmi_stream.stream on a QThreadPool thread. Parsing and scoring
+    happen in its worker processes, so this thread only moves lines and
+    output text and the GUI thread is rarely kept from the GIL. Only
+    per-chunk summaries cross back to the GUI, as queued signals; the scored
+    rows go straight to `output_path`.
+    """
+
+    def __init__(self, input_path, output_path, weight_unit, height_unit, workers=None,
+                 weight_part_column=None, height_part_column=None):
+        super().__init__()
+        self.input_path = input_path
+        self.output_path = output_path
+        self.weight_unit = weight_unit
+        self.height_unit = height_unit
+        self.weight_part_column = weight_part_column
+        self.height_part_column = height_part_column
+        # At least one worker process, leaving a core for the GUI when there are several
+        self.workers = workers if workers is not None else max(1, (os.cpu_count() or 1) - 1)
+        self.cancel_event = threading.Event()
+        self.signals = ImportSignals()
+        self.setAutoDelete(False)  # the window keeps the job to cancel it
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def _chunk_done(self, stats):
+        self.signals.progress.emit(stats.progress, stats.rows)
+        self.signals.partial.emit(summary(stats))
+
+    def run(self):
+        try:
+            stats = stream(self.input_path, self.output_path, self.weight_unit, self.height_unit,
+                           workers=self.workers, on_chunk=self._chunk_done, cancel=self.cancel_event,
+                           mp_context=worker_context(), weight_part_column=self.weight_part_column,
+                           height_part_column=self.height_part_column)
+        except ImportError:
+            self.signals.failed.emit("Parquet files need pyarrow: pip install pyarrow")
+        except Exception as e:  # reported in the window instead of killing the pool thread
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(summary(stats))
@@ -0,0 +1,126 @@
+import time
+
+import numpy as np
+from PyQt5.QtCore import Qt, QPointF, QRectF, QSize
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen, QPolygonF
+from PyQt5.QtWidgets import QWidget
+
+from bmi_engine import COLORS, THRESHOLDS
+
+
+def lttb(x, y, threshold):
+    """Largest-Triangle-Three-Buckets downsampling to `threshold` points.
+
+    Keeps the first and last points and, from each bucket in between, the
+    point forming the largest triangle with the previously kept point and
+    the next bucket's mean, which preserves peaks and dips a plain stride
+    would drop. Returns indexes into `x`/`y`.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    # Bucket i covers [edges[i], edges[i + 1]) of the interior points
+    edges = (np.arange(threshold - 1) * ((n - 2) / (threshold - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+    sizes = np.diff(edges)
+    mean_x = np.add.reduceat(x[:-1], edges[:-1]) / sizes
+    mean_y = np.add.reduceat(y[:-1], edges[:-1]) / sizes
+    mean_x = np.append(mean_x, x[-1])
+    mean_y = np.append(mean_y, y[-1])
+
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        bx, by = x[lo:hi], y[lo:hi]
+        area = np.abs((x[a] - mean_x[i + 1]) * (by - y[a]) - (x[a] - bx) * (mean_y[i + 1] - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+class TrendChart(QWidget):
+    """BMI over time for one person, downsampled to the widget's pixel width.
+
+    The full series lives in NumPy arrays; new readings are appended in place
+    of re-querying the store. The LTTB-reduced polyline is cached per width,
+    so repaints only scale the kept points.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ts = np.empty(0)
+        self.bmi = np.empty(0)
+        self._kept = None
+        self._kept_width = None
+        self.margin = 8
+        self.setFont(QFont("Arial", 9))
+        self.setMinimumHeight(110)
+
+    def sizeHint(self):
+        return QSize(400, 130)
+
+    def set_series(self, ts, bmi):
+        self.ts, self.bmi = ts, bmi
+        self._kept_width = None
+        self.update()
+
+    def append(self, ts, bmi):
+        if self.ts.size and ts <= self.ts[-1]:
+            at = np.searchsorted(self.ts, ts)
+            if at < self.ts.size and self.ts[at] == ts:
+                self.bmi[at] = bmi
+            else:
+                self.ts = np.insert(self.ts, at, ts)
+                self.bmi = np.insert(self.bmi, at, bmi)
+        else:
+            self.ts = np.append(self.ts, ts)
+            self.bmi = np.append(self.bmi, bmi)
+        self._kept_width = None
+        self.update()
+
+    def _points(self):
+        width = max(3, self.width() - 2 * self.margin)
+        if width != self._kept_width:
+            self._kept = lttb(self.ts, self.bmi, width)
+            self._kept_width = width
+        return self.ts[self._kept], self.bmi[self._kept]
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        plot = QRectF(self.margin, self.margin, self.width() - 2 * self.margin, self.height() - 2 * self.margin - 14)
+        painter.fillRect(plot, QColor("#fafafa"))
+        if self.ts.size == 0:
+            painter.setPen(QColor("#888"))
+            painter.drawText(plot, Qt.AlignCenter, "No BMI history yet. Press Calculate BMI to record one.")
+            return
+
+        ts, bmi = self._points()
+        low = min(float(bmi.min()), THRESHOLDS[0]) - 1
+        high = max(float(bmi.max()), THRESHOLDS[-1]) + 1
+        start, end = float(ts[0]), float(ts[-1])
+        span = end - start or 1.0
+
+        def y_of(value):
+            return plot.bottom() - (value - low) / (high - low) * plot.height()
+
+        # Category boundaries as faint guide lines in their band colours
+        for threshold, color in zip(THRESHOLDS.tolist(), COLORS[1:]):
+            painter.setPen(QPen(QColor(color), 1, Qt.DashLine))
+            painter.drawLine(QPointF(plot.left(), y_of(threshold)), QPointF(plot.right(), y_of(threshold)))
+
+        xs = plot.left() + (ts - start) / span * plot.width()
+        ys = plot.bottom() - (bmi - low) / (high - low) * plot.height()
+        painter.setPen(QPen(QColor("#333"), 1.5))
+        if len(xs) == 1:
+            painter.drawEllipse(QPointF(xs[0], ys[0]), 3, 3)
+        else:
+            painter.drawPolyline(QPolygonF([QPointF(px, py) for px, py in zip(xs.tolist(), ys.tolist())]))
+
+        painter.setPen(QColor("#555"))
+        label_rect = QRectF(plot.left(), plot.bottom() + 2, plot.width(), 14)
+        painter.drawText(label_rect, Qt.AlignLeft, time.strftime("%Y-%m-%d", time.localtime(start)))
+        painter.drawText(label_rect, Qt.AlignHCenter, f"{self.ts.size} readings, latest {self.bmi[-1]:.1f}")
+        painter.drawText(label_rect, Qt.AlignRight, time.strftime("%Y-%m-%d", time.localtime(end)))
@@ -0,0 +1,148 @@
+import itertools
+
+import numpy as np
+
+LBS_TO_KG = 0.453592
+STONE_TO_KG = 14 * LBS_TO_KG
+INCHES_TO_M = 0.0254
+FEET_TO_M = 12 * INCHES_TO_M
+
+
+def factorize(values):
+    """`(distinct, inverse)` of a string array, like np.unique(return_inverse=True).
+
+    Names of up to 8 ASCII characters, which covers the unit spellings, are
+    packed into one uint64 each so the sort compares integers rather than
+    strings; anything longer falls back to np.unique on the strings.
+    """
+    values = np.ascontiguousarray(np.asarray(values).astype(str).reshape(-1))
+    width = values.dtype.itemsize // 4
+    if values.size and 0 < width <= 8:
+        chars = values.view(np.uint32).reshape(values.size, width)
+        if chars.max() < 128:
+            key = np.zeros(values.size, dtype=np.uint64)
+            for j in range(width):
+                key |= chars[:, j].astype(np.uint64) << np.uint64(8 * j)
+            _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+            return values[first], inverse
+    return np.unique(values, return_inverse=True)
+
+
+class UnitRegistry:
+    """Units of one quantity with their factors to the base unit.
+
+    Every unit gets an integer code indexing the `factors` and
+    `part_factors` tables, so a column with a different unit on every row is
+    converted with two gathers and a multiply-add instead of a branch per
+    row. Compound units such as "ft+in" take their second field as `part`
+    (the inches); plain units have a part factor of 0. Unknown unit names in
+    a column map to a NaN factor, so those rows come out invalid instead of
+    stopping a batch.
+    """
+
+    def __init__(self, base):
+        self.base = base
+        self.codes_by_name = {}  # name and lower-case aliases -> code
+        self.units = []  # display names in code order
+        self.part_names = []  # label of the second field, or None
+        self.factors = np.array([np.nan])  # the last slot is the unknown unit
+        self.part_factors = np.array([np.nan])
+
+    def add(self, name, factor, part=None, aliases=()):
+        """Register `name` (1 `name` = `factor` base units); `part` is (label, factor)."""
+        code = len(self.units)
+        self.units.append(name)
+        self.part_names.append(part[0] if part else None)
+        self.factors = np.insert(self.factors, code, factor)
+        self.part_factors = np.insert(self.part_factors, code, part[1] if part else 0.0)
+        for spelling in (name, *aliases):
+            self.codes_by_name[spelling.lower()] = code
+        return self
+
+    @property
+    def unknown(self):
+        return len(self.units)
+
+    def names(self):
+        return list(self.units)
+
+    def part_name(self, unit):
+        return self.part_names[self.code(unit)]
+
+    def code(self, unit):
+        try:
+            return self.codes_by_name[unit.strip().lower()]
+        except KeyError:
+            raise ValueError(f"Unknown unit {unit!r}; expected one of {', '.join(self.units)}") from None
+
+    def codes(self, units, default=None):
+        """Integer codes for a column of unit names, without a Python branch per row.
+
+        Blank cells take `default` when it is given; unrecognised names get
+        the unknown code.
+        """
+        blank = self.code(default) if default is not None else self.unknown
+
+        def lookup(name):
+            name = name.strip().lower()
+            return self.codes_by_name.get(name, self.unknown) if name else blank
+
+        if isinstance(units, np.ndarray):
+            distinct, inverse = factorize(units)
+            table = np.array([lookup(name) for name in distinct.tolist()], dtype=np.intp)
+            return table[inverse.reshape(-1)].reshape(units.shape)
+        # Plain lists (parsed CSV cells): one C-level dict pass for exact spellings,
+        # which skips the string-array copy np.unique would need, then the rest
+        # (case or spacing variants, blanks, unknown names) by distinct value
+        units = list(units)
+        codes = np.fromiter(map(self.codes_by_name.get, units, itertools.repeat(-1)), dtype=np.intp, count=len(units))
+        missed = np.flatnonzero(codes < 0)
+        if missed.size:
+            names = [units[i] for i in missed.tolist()]
+            table = {name: lookup(name) for name in set(names)}
+            codes[missed] = np.fromiter(map(table.__getitem__, names), dtype=np.intp, count=len(names))
+        return codes
+
+    def to_base(self, values, unit, part=None, default=None):
+        """Convert `values` to the base unit as float64.
+
+        `unit` is one name (or code) for the whole array, or an array of
+        names (or codes) per row; `part` holds the second field of compound
+        units.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if isinstance(unit, str):
+            unit = self.code(unit)
+        if isinstance(unit, (int, np.integer)):
+            code = int(unit)
+            out = values * self.factors[code]
+            if part is not None and self.part_factors[code]:
+                out = out + np.nan_to_num(np.asarray(part, dtype=np.float64)) * self.part_factors[code]
+            return out
+        if isinstance(unit, np.ndarray) and np.issubdtype(unit.dtype, np.integer):
+            codes = unit
+        else:
+            codes = self.codes(unit, default)
+        out = values * self.factors[codes]
+        if part is not None:
+            out = out + np.nan_to_num(np.asarray(part, dtype=np.float64)) * self.part_factors[codes]
+        return out
+
+
+WEIGHT_UNITS = (
+    UnitRegistry("kg")
+    .add("kg", 1.0, aliases=("kgs", "kilogram", "kilograms"))
+    .add("lbs", LBS_TO_KG, aliases=("lb", "pound", "pounds"))
+    .add("g", 0.001, aliases=("gram", "grams"))
+    .add("st", STONE_TO_KG, aliases=("stone", "stones"))
+    .add("st+lb", STONE_TO_KG, part=("lb", LBS_TO_KG))
+)
+
+HEIGHT_UNITS = (
+    UnitRegistry("meters")
+    .add("meters", 1.0, aliases=("m", "meter", "metre", "metres"))
+    .add("cm", 0.01, aliases=("centimeter", "centimeters", "centimetre", "centimetres"))
+    .add("inches", INCHES_TO_M, aliases=("in", "inch"))
+    .add("ft", FEET_TO_M, aliases=("feet", "foot"))
+    .add("ft+in", FEET_TO_M, part=("in", INCHES_TO_M))
+)
@@ -1,36 +1,70 @@
 import sys
+from datetime import datetime, timedelta
 from pathlib import Path
 from PyQt5.QtWidgets import (
     QApplication, QLabel, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QFrame, QTimeEdit, QTabWidget, QSizePolicy, QStackedWidget
+    QFrame, QTimeEdit, QTabWidget, QSizePolicy, QStackedWidget, QCheckBox,
+    QListWidget, QListWidgetItem, QListView, QFileDialog, QComboBox, QScrollArea,
+    QLineEdit
 )
 from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import Qt, QTimer, QTime
-from PyQt5.QtMultimedia import QSoundEffect
-from PyQt5.QtCore import QUrl
+from clock_core import ClockCore, format_time
+from alarm_store import AlarmStore, DATA_DIR, DB_PATH
+from alarm_daemon import SOCKET_PATH
+from daemon_client import DaemonClient
+from audio import AlarmAudio
+from world_clock import WorldClockPanel
+from timer_wheel import TimerWheel
+from countdown_model import CountdownListModel
+from lap_model import LapListModel
+from alarms import DAY
+from render_governor import RenderGovernor, set_text_if_changed
 
 base_path = Path(__file__).parent
 icon_path = base_path / "assets" / "clock.png"
 
+# Re-check at least hourly so wall-clock jumps (NTP, suspend) are picked up
+MAX_ALARM_WAIT_MS = 60 * 60 * 1000
+SNOOZE_SECONDS = 5 * 60
+UPCOMING_SHOWN = 50
+
 class ClockApp(QWidget): 
-    def __init__(self):
+    def __init__(self, throttle=True, store_path=DB_PATH, socket_path=SOCKET_PATH):
         super().__init__()
-        self.elapsed_time = 0
-        self.alarm_time = None
-        self.alarm_set = False
-        self.alarm_triggered = False
+        self.governor = RenderGovernor(self, throttle=throttle)
+
+        # If alarm_daemon.py is running it owns the alarms; we only talk to it
+        self.daemon = DaemonClient(socket_path, self)
+        if not self.daemon.connect_to_daemon():
+            self.daemon = None
+
+        Path(store_path).parent.mkdir(parents=True, exist_ok=True)
+        self.core = ClockCore(store=AlarmStore(store_path), load_alarms=self.daemon is None)
+        self.stopwatch = self.core.stopwatch
+        self.alarms = self.core.alarms
+        self.ringing_alarm = None
 
         self.clock_timer = QTimer(self)
+        self.clock_timer.setSingleShot(True)
+        self.clock_timer.setTimerType(Qt.PreciseTimer)
+        self.alarm_timer = QTimer(self)
+        self.alarm_timer.setSingleShot(True)
+        self.alarm_timer.setTimerType(Qt.PreciseTimer)
+        self.alarm_timer.timeout.connect(self.fire_alarms)
         self.stopwatch_timer = QTimer(self)
+        self.stopwatch_timer.setTimerType(Qt.PreciseTimer)
 
-        # Alarm sound
-        self.alarm_sound = QSoundEffect()
-        alarm_sound_path = base_path / "assets" / "alarm.wav"
-        if alarm_sound_path.exists():
-            self.alarm_sound.setSource(QUrl.fromLocalFile(str(alarm_sound_path)))
-            self.alarm_sound.setLoopCount(QSoundEffect.Infinite)
-        else:
-            print("⚠️ Warning: alarm.wav not found!")
+        # Countdowns: one wheel and one tick source however many are running
+        self.wheel = TimerWheel()
+        self.wheel_timer = QTimer(self)
+        self.wheel_timer.setTimerType(Qt.PreciseTimer)
+        self.wheel_timer.timeout.connect(self.advance_countdowns)
+        self.countdown_view_timer = QTimer(self)
+        self.countdown_view_timer.timeout.connect(self.refresh_countdowns)
+
+        # Alarm sound (nothing is loaded until an alarm is armed)
+        self.audio = AlarmAudio([base_path / "assets", DATA_DIR / "tones"], parent=self)
 
         self.auto_stop_timer = QTimer(self)
         self.auto_stop_timer.setSingleShot(True)
@@ -41,7 +75,7 @@ class ClockApp(QWidget):
     def initUI(self):
         self.setWindowTitle("Clock App")
         self.setWindowIcon(QIcon(str(icon_path)))
-        self.setGeometry(600, 300, 700, 500)
+        self.setGeometry(600, 200, 800, 700)
         self.setStyleSheet("""
             QWidget {
                 background-color: #1c1b1b;
@@ -87,8 +121,13 @@ class ClockApp(QWidget):
         tab_button_layout = QHBoxLayout()
         self.stopwatch_tab_btn = QPushButton("Stopwatch")
         self.alarm_tab_btn = QPushButton("Alarm")
+        self.timers_tab_btn = QPushButton("Timers")
+        self.world_tab_btn = QPushButton("World")
+        self.tab_buttons = (
+            self.stopwatch_tab_btn, self.alarm_tab_btn, self.timers_tab_btn, self.world_tab_btn
+        )
 
-        for btn in (self.stopwatch_tab_btn, self.alarm_tab_btn):
+        for btn in self.tab_buttons:
             btn.setCheckable(True)
             btn.setMinimumHeight(40)
             btn.setStyleSheet("font-size: 18px;")
@@ -96,6 +135,8 @@ class ClockApp(QWidget):
         self.stopwatch_tab_btn.setChecked(True)  # default
         tab_button_layout.addWidget(self.stopwatch_tab_btn)
         tab_button_layout.addWidget(self.alarm_tab_btn)
+        tab_button_layout.addWidget(self.timers_tab_btn)
+        tab_button_layout.addWidget(self.world_tab_btn)
         main_layout.addLayout(tab_button_layout)
 
         # --- Stacked widget
@@ -104,6 +145,12 @@ class ClockApp(QWidget):
         self.alarm_page = self.create_alarm_tab()
         self.stack.addWidget(self.stopwatch_page)
         self.stack.addWidget(self.alarm_page)
+        self.timers_page = self.create_timers_tab()
+        self.stack.addWidget(self.timers_page)
+        self.world_clock = None  # built the first time the World tab is opened
+        self.world_page = QScrollArea()
+        self.world_page.setWidgetResizable(True)
+        self.stack.addWidget(self.world_page)
         main_layout.addWidget(self.stack)
 
         #style tab buttons
@@ -124,42 +171,142 @@ class ClockApp(QWidget):
                             color: #000;
                             border: 2px solid #555;
                         }"""
-        self.stopwatch_tab_btn.setStyleSheet(tab_style)
-        self.alarm_tab_btn.setStyleSheet(tab_style)
+        for btn in self.tab_buttons:
+            btn.setStyleSheet(tab_style)
 
         # --- Button connections
         self.stopwatch_tab_btn.clicked.connect(self.show_stopwatch)
         self.alarm_tab_btn.clicked.connect(self.show_alarm)
+        self.timers_tab_btn.clicked.connect(self.show_timers)
+        self.world_tab_btn.clicked.connect(self.show_world)
 
         self.setLayout(main_layout)
 
-        # Timers
+        # Timers (only run while there is something visible to redraw)
         self.clock_timer.timeout.connect(self.update_clock)
-        self.clock_timer.start(1000)
+        self.stopwatch_timer.timeout.connect(self.update_stopwatch)
+        self.governor.visibility_changed.connect(self.update_render_state)
+        self.stack.currentChanged.connect(self.update_render_state)
         self.update_clock()
 
-        self.stopwatch_timer.timeout.connect(self.update_stopwatch)
+        # Restored from the store
+        self.update_stopwatch()
+        self.update_lap_stats()
+        self.start_button.setEnabled(not self.stopwatch.running)
+        self.stop_button.setEnabled(self.stopwatch.running)
+        if self.daemon is not None:
+            self.daemon.alarms_listed.connect(self.show_alarm_list)
+            self.daemon.alarms_changed.connect(self.refresh_alarm_list)
+            self.daemon.ringing.connect(self.show_ringing)
+            self.daemon.stopped.connect(self.daemon_stopped)
+            self.daemon.error.connect(lambda msg: self.alarm_status.setText(f"⚠️ {msg}"))
+            self.daemon.disconnected.connect(self.daemon_lost)
+        self.refresh_alarm_list()
+        self.arm_alarm_timer()
+
+    def closeEvent(self, event):
+        self.core.save_stopwatch()
+        self.core.store.close()
+        super().closeEvent(event)
+
+    def show_page(self, page, button):
+        self.stack.setCurrentWidget(page)
+        for btn in self.tab_buttons:
+            btn.setChecked(btn is button)
 
     def show_stopwatch(self):
-        self.stack.setCurrentWidget(self.stopwatch_page)
-        self.stopwatch_tab_btn.setChecked(True)
-        self.alarm_tab_btn.setChecked(False)
+        self.show_page(self.stopwatch_page, self.stopwatch_tab_btn)
 
     def show_alarm(self):
-        self.stack.setCurrentWidget(self.alarm_page)
-        self.alarm_tab_btn.setChecked(True)
-        self.stopwatch_tab_btn.setChecked(False)
+        self.show_page(self.alarm_page, self.alarm_tab_btn)
+
+    def show_timers(self):
+        self.show_page(self.timers_page, self.timers_tab_btn)
+
+    def show_world(self):
+        if self.world_clock is None:
+            self.world_clock = WorldClockPanel(now=self.core.now)
+            self.world_page.setWidget(self.world_clock)
+        self.show_page(self.world_page, self.world_tab_btn)
+
+    def update_render_state(self, *args):
+        visible = self.governor.visible
+        if not visible:
+            self.clock_timer.stop()
+        elif not self.clock_timer.isActive():
+            self.update_clock()
+
+        stopwatch_shown = visible and self.stack.currentWidget() is self.stopwatch_page
+        if self.stopwatch.running and stopwatch_shown:
+            if not self.stopwatch_timer.isActive():
+                self.update_stopwatch()
+                self.stopwatch_timer.start(10)
+        else:
+            self.stopwatch_timer.stop()
 
-    def update_clock(self):
-        now = QTime.currentTime()
-        self.time_label.setText(now.toString("hh:mm:ss AP"))
+        timers_shown = visible and self.stack.currentWidget() is self.timers_page
+        if timers_shown and len(self.wheel):
+            if not self.countdown_view_timer.isActive():
+                self.refresh_countdowns()
+                self.countdown_view_timer.start(1000)
+        else:
+            self.countdown_view_timer.stop()
+
+        if self.world_clock is not None:
+            self.world_clock.set_active(visible and self.stack.currentWidget() is self.world_page)
 
-        if self.alarm_set and not self.alarm_triggered and now >= self.alarm_time:
-            self.alarm_status.setText("🔔 Alarm Ringing!")
-            if self.alarm_sound.source().isValid() and not self.alarm_sound.isPlaying():
-                self.alarm_sound.play()
+    def update_clock(self):
+        self.governor.note_wakeup()
+        set_text_if_changed(self.time_label, self.core.clock_text())
+
+        if self.governor.visible:
+            # Land just after the next second boundary instead of drifting
+            self.clock_timer.start(self.core.ms_until_next_second())
+
+    def arm_alarm_timer(self):
+        # One single-shot timer for the nearest deadline; nothing runs in between
+        delay_ms = self.core.next_alarm_delay_ms()
+        if delay_ms is None:
+            self.alarm_timer.stop()
+            return
+        self.alarm_timer.start(min(delay_ms, MAX_ALARM_WAIT_MS))
+        if len(self.alarms):
+            # Load the tone once an alarm is armed, after the window is up
+            QTimer.singleShot(0, self.prepare_tone)
+
+    def selected_tone(self):
+        return self.tone_combo.currentData() or str(base_path / "assets" / "alarm.wav")
+
+    def prepare_tone(self, *args):
+        if self.daemon is None and len(self.alarms):
+            self.audio.prepare(self.selected_tone())
+
+    def fire_alarms(self):
+        fired = self.core.fire_due()
+        if fired:
+            self.show_ringing(fired[-1])
+            # A new alarm gets its full minute even if the tone was already ringing
+            if self.audio.play(self.selected_tone()) or self.auto_stop_timer.isActive():
                 self.auto_stop_timer.start(60 * 1000)
-            self.alarm_triggered = True
+            self.refresh_alarm_list()
+        self.arm_alarm_timer()
+
+    def show_ringing(self, alarm):
+        self.ringing_alarm = alarm
+        self.alarm_status.setText(f"🔔 Alarm Ringing! {alarm.label}".strip())
+
+    def daemon_stopped(self):
+        self.ringing_alarm = None
+        self.alarm_status.setText("Alarm stopped.")
+
+    def daemon_lost(self):
+        # Take the alarms back from the store so they keep firing in this window
+        self.daemon = None
+        self.ringing_alarm = None
+        self.core.own_alarms()
+        self.alarm_status.setText("⚠️ Lost connection to the alarm daemon; alarms now ring here.")
+        self.refresh_alarm_list()
+        self.arm_alarm_timer()
 
     def create_stopwatch_tab(self):
         widget = QWidget()
@@ -170,48 +317,179 @@ class ClockApp(QWidget):
         self.stopwatch_label.setStyleSheet("font-size: 60px; font-family: Arial;border:2px solid #333;")
         layout.addWidget(self.stopwatch_label)
 
+        # Laps: a virtualized view over the stopwatch's lap buffer
+        self.lap_model = LapListModel(self.stopwatch.laps, format_time, self)
+        self.lap_view = QListView()
+        self.lap_view.setModel(self.lap_model)
+        self.lap_view.setUniformItemSizes(True)
+        self.lap_view.setStyleSheet("font-size: 18px; font-family: Arial; border:2px solid #333;")
+        layout.addWidget(self.lap_view)
+
+        self.lap_stats_label = QLabel("")
+        self.lap_stats_label.setAlignment(Qt.AlignCenter)
+        self.lap_stats_label.setStyleSheet("font-size: 16px; font-family: Arial; color: #d3e0d7;")
+        layout.addWidget(self.lap_stats_label)
+
         buttons = QHBoxLayout()
         self.start_button = QPushButton("Start")
         self.stop_button = QPushButton("Stop")
+        self.lap_button = QPushButton("Lap")
         self.reset_button = QPushButton("Reset")
+        self.export_laps_button = QPushButton("Export")
 
         self.start_button.clicked.connect(self.start_stopwatch)
         self.stop_button.clicked.connect(self.stop_stopwatch)
+        self.lap_button.clicked.connect(self.lap_stopwatch)
         self.reset_button.clicked.connect(self.reset_stopwatch)
+        self.export_laps_button.clicked.connect(self.export_laps)
 
         buttons.addWidget(self.start_button)
         buttons.addWidget(self.stop_button)
+        buttons.addWidget(self.lap_button)
         buttons.addWidget(self.reset_button)
+        buttons.addWidget(self.export_laps_button)
 
         layout.addLayout(buttons)
         widget.setLayout(layout)
         return widget
 
     def start_stopwatch(self):
-        self.stopwatch_timer.start(10)
+        self.stopwatch.start()
+        self.update_render_state()
+        self.start_button.setEnabled(False)
+        self.stop_button.setEnabled(True)
 
     def stop_stopwatch(self):
+        self.stopwatch.stop()
         self.stopwatch_timer.stop()
+        self.update_stopwatch()
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
 
+    def lap_stopwatch(self):
+        if not self.stopwatch.running:
+            return
+        self.lap_model.record_lap(self.stopwatch)
+        self.update_lap_stats()
+
+    def update_lap_stats(self):
+        stats = self.stopwatch.laps.stats()
+        if stats is None:
+            self.lap_stats_label.setText("")
+            return
+        fmt = lambda ns: format_time(int(ns) // 1_000_000)
+        self.lap_stats_label.setText(
+            f"min {fmt(stats['min'])}   max {fmt(stats['max'])}   mean {fmt(stats['mean'])}"
+            f"   p50 {fmt(stats['p50'])}   p90 {fmt(stats['p90'])}   p99 {fmt(stats['p99'])}"
+        )
+
+    def export_laps(self):
+        if not len(self.stopwatch.laps):
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export Laps", "laps.csv", "CSV files (*.csv)")
+        if path:
+            self.stopwatch.laps.export_csv(path)
+
     def reset_stopwatch(self):
-        sself.stopwatch_timer.stop()
-        self.elapsed_time = 0
+        self.stopwatch_timer.stop()
+        if self.stopwatch.elapsed_ns():
+            self.core.save_stopwatch(closed=True)
+        self.lap_model.reset(self.stopwatch)
         self.stopwatch_label.setText("00:00:00.00")
+        self.lap_stats_label.setText("")
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
 
     def update_stopwatch(self):
-        self.elapsed_time += 10
-        self.stopwatch_label.setText(self.format_time(self.elapsed_time))
+        # The tick only redraws; elapsed time always comes from the monotonic clock
+        self.governor.note_wakeup()
+        set_text_if_changed(self.stopwatch_label, self.core.stopwatch_text())
 
-    def format_time(self, ms):
-        h = ms // (3600 * 1000)
-        m = (ms // (60 * 1000)) % 60
-        s = (ms // 1000) % 60
-        cs = (ms % 1000) // 10
-        return f"{h:02}:{m:02}:{s:02}.{cs:02}"
+    def create_timers_tab(self):
+        widget = QWidget()
+        layout = QVBoxLayout()
+
+        input_layout = QHBoxLayout()
+        self.countdown_edit = QTimeEdit()
+        self.countdown_edit.setDisplayFormat("HH:mm:ss")
+        self.countdown_edit.setTime(QTime(0, 5, 0))
+        self.countdown_edit.setAlignment(Qt.AlignCenter)
+        input_layout.addWidget(self.countdown_edit)
+
+        self.countdown_label_input = QLineEdit()
+        self.countdown_label_input.setPlaceholderText("Label (e.g. Centrifuge 2)")
+        self.countdown_label_input.setStyleSheet("font-size: 20px; padding: 10px; border:2px solid #333;")
+        input_layout.addWidget(self.countdown_label_input)
+        layout.addLayout(input_layout)
+
+        self.countdown_model = CountdownListModel(self.wheel, self)
+        self.countdown_view = QListView()
+        self.countdown_view.setModel(self.countdown_model)
+        self.countdown_view.setUniformItemSizes(True)
+        self.countdown_view.setStyleSheet("font-size: 18px; font-family: Arial; border:2px solid #333;")
+        layout.addWidget(self.countdown_view)
+
+        self.countdown_status = QLabel("No timers running.")
+        self.countdown_status.setAlignment(Qt.AlignCenter)
+        self.countdown_status.setStyleSheet("font-size: 20px; color: #d3e0d7;")
+        layout.addWidget(self.countdown_status)
+
+        button_layout = QHBoxLayout()
+        self.add_countdown_button = QPushButton("Start Timer")
+        self.cancel_countdown_button = QPushButton("Cancel Timer")
+        self.add_countdown_button.clicked.connect(self.add_countdown)
+        self.cancel_countdown_button.clicked.connect(self.cancel_countdown)
+        button_layout.addWidget(self.add_countdown_button)
+        button_layout.addWidget(self.cancel_countdown_button)
+        layout.addLayout(button_layout)
+
+        widget.setLayout(layout)
+        return widget
+
+    def add_countdown(self):
+        duration = QTime(0, 0).secsTo(self.countdown_edit.time())
+        if duration <= 0:
+            self.countdown_status.setText("⚠️ Pick a duration first!")
+            return
+        self.wheel.add(duration, label=self.countdown_label_input.text().strip())
+        self.countdown_model.mark_dirty()
+        self.countdown_status.setText(f"{len(self.wheel)} timers running.")
+        if not self.wheel_timer.isActive():
+            self.wheel_timer.start(int(self.wheel.tick * 1000))
+        self.update_render_state()
+        self.refresh_countdowns()
+
+    def cancel_countdown(self):
+        index = self.countdown_view.currentIndex()
+        if not index.isValid():
+            return
+        self.wheel.cancel(index.data(Qt.UserRole))
+        self.countdown_model.mark_dirty()
+        self.refresh_countdowns()
+        if len(self.wheel):
+            self.countdown_status.setText(f"{len(self.wheel)} timers running.")
+        else:
+            self.countdown_status.setText("No timers running.")
+            self.wheel_timer.stop()
+            self.update_render_state()
+
+    def advance_countdowns(self):
+        expired = self.wheel.advance()
+        if expired:
+            self.countdown_model.mark_dirty()
+            finished = expired[-1].label or f"Timer {expired[-1].id}"
+            more = f" (+{len(expired) - 1} more)" if len(expired) > 1 else ""
+            self.countdown_status.setText(f"⏲️ {finished} finished!{more}")
+            QApplication.beep()
+            if self.countdown_view_timer.isActive():
+                self.refresh_countdowns()
+        if not len(self.wheel):
+            self.wheel_timer.stop()
+            self.update_render_state()
+
+    def refresh_countdowns(self):
+        self.governor.note_wakeup()
+        self.countdown_model.refresh()
 
     def create_alarm_tab(self):
         widget = QWidget()
@@ -228,18 +506,38 @@ class ClockApp(QWidget):
         self.alarm_status.setStyleSheet("font-size: 25px; color: #d3e0d7; border:2px solid #333;")
         layout.addWidget(self.alarm_status)
 
+        options_layout = QHBoxLayout()
+        self.repeat_checkbox = QCheckBox("Repeat daily")
+        self.repeat_checkbox.setStyleSheet("font-size: 18px; margin: 5px 10px;")
+        options_layout.addWidget(self.repeat_checkbox)
+
+        self.tone_combo = QComboBox()
+        self.tone_combo.setStyleSheet("font-size: 18px; margin: 5px 10px;")
+        for name, path in self.audio.tones().items():
+            self.tone_combo.addItem(name, str(path))
+        self.tone_combo.currentIndexChanged.connect(self.prepare_tone)
+        options_layout.addWidget(self.tone_combo)
+        layout.addLayout(options_layout)
+
+        self.alarm_list = QListWidget()
+        self.alarm_list.setStyleSheet("font-size: 18px; border:2px solid #333;")
+        layout.addWidget(self.alarm_list)
+
         button_layout = QHBoxLayout()
         self.set_alarm_button = QPushButton("Set Alarm")
         self.cancel_alarm_button = QPushButton("Cancel Alarm")
         self.stop_alarm_button = QPushButton("Stop Alarm") 
+        self.snooze_alarm_button = QPushButton("Snooze")
 
         self.set_alarm_button.clicked.connect(self.set_alarm)
         self.cancel_alarm_button.clicked.connect(self.cancel_alarm)
         self.stop_alarm_button.clicked.connect(self.stop_alarm)
+        self.snooze_alarm_button.clicked.connect(self.snooze_alarm)
 
         button_layout.addWidget(self.set_alarm_button)
         button_layout.addWidget(self.cancel_alarm_button)
         button_layout.addWidget(self.stop_alarm_button)
+        button_layout.addWidget(self.snooze_alarm_button)
         layout.addLayout(button_layout)
 
         widget.setLayout(layout)
@@ -247,33 +545,86 @@ class ClockApp(QWidget):
 
     def set_alarm(self):
         selected_time = self.alarm_time_edit.time()
-        now = QTime.currentTime()
-
-        if selected_time <= now:
-            self.alarm_status.setText("⚠️ Cannot set alarm in the past!")
-            return
-
-        self.alarm_time = selected_time
-        self.alarm_set = True
-        self.alarm_triggered = False
-        self.alarm_status.setText(f"Alarm set for {self.alarm_time.toString('hh:mm AP')}")
-
+        now = datetime.fromtimestamp(self.core.now())
+        fire_at = now.replace(
+            hour=selected_time.hour(), minute=selected_time.minute(),
+            second=0, microsecond=0
+        )
+        repeat = DAY if self.repeat_checkbox.isChecked() else None
+
+        if fire_at <= now:
+            if repeat is None:
+                self.alarm_status.setText("⚠️ Cannot set alarm in the past!")
+                return
+            fire_at += timedelta(days=1)
+
+        if self.daemon is not None:
+            self.daemon.add(fire_at.timestamp(), repeat=repeat)
+        else:
+            self.core.add_alarm(fire_at.timestamp(), repeat=repeat)
+        self.alarm_status.setText(f"Alarm set for {selected_time.toString('hh:mm AP')}")
+        self.refresh_alarm_list()
+        self.arm_alarm_timer()
+
+    def refresh_alarm_list(self):
+        if self.daemon is not None:
+            self.daemon.request_list(UPCOMING_SHOWN)  # answered by alarms_listed
+        else:
+            self.show_alarm_list(self.alarms.upcoming(UPCOMING_SHOWN))
+
+    def show_alarm_list(self, alarms):
+        self.alarm_list.clear()
+        for alarm in alarms:
+            text = datetime.fromtimestamp(alarm.fire_at).strftime("%a %I:%M %p")
+            if alarm.repeat:
+                text += "  (daily)"
+            item = QListWidgetItem(text)
+            item.setData(Qt.UserRole, alarm.id)
+            self.alarm_list.addItem(item)
 
     def stop_alarm(self):
-        if self.alarm_sound.isPlaying():
-            self.alarm_sound.stop()
+        if self.daemon is not None:
+            self.daemon.stop()
+        self.audio.stop()
         self.auto_stop_timer.stop()
         self.alarm_status.setText("Alarm stopped.")
-        self.alarm_triggered = False
+        self.ringing_alarm = None
+
+    def snooze_alarm(self):
+        if self.ringing_alarm is None:
+            return
+        alarm = self.ringing_alarm
+        if self.daemon is not None:
+            self.daemon.snooze(SNOOZE_SECONDS)
+        else:
+            self.stop_alarm()
+            self.core.snooze_alarm(alarm, SNOOZE_SECONDS)
+        self.alarm_status.setText(f"Snoozed for {SNOOZE_SECONDS // 60} minutes.")
+        self.refresh_alarm_list()
+        self.arm_alarm_timer()
 
     def cancel_alarm(self):
-        self.alarm_set = False
-        self.alarm_triggered = False
+        if not self.alarm_list.count():
+            self.alarm_status.setText("No alarm set.")
+            return
+        selected = self.alarm_list.selectedItems()
+        if not selected:
+            self.alarm_status.setText("Select an alarm to cancel.")
+            return
+        item = selected[0]
+        if self.daemon is not None:
+            self.daemon.cancel(item.data(Qt.UserRole))
+        else:
+            self.core.cancel_alarm(item.data(Qt.UserRole))
         self.alarm_status.setText("Alarm canceled.")
+        self.refresh_alarm_list()
+        self.arm_alarm_timer()
 
 def main():
     app = QApplication(sys.argv)
-    Clock = ClockApp()
+    Clock = ClockApp(throttle="--no-throttle" not in sys.argv)
+    if "--wakeup-stats" in sys.argv:
+        Clock.governor.enable_stats()
     Clock.show()
     sys.exit(app.exec_())
 
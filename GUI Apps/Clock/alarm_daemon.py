@@ -0,0 +1,210 @@
+import asyncio
+import json
+import shutil
+import signal
+import socket
+import sys
+from pathlib import Path
+
+from alarm_store import AlarmStore, DATA_DIR, DB_PATH
+from clock_core import ClockCore
+
+# Headless alarm daemon: owns the alarm schedule and rings assets/alarm.wav
+# with the GUI closed. No Qt is imported. ClockApp attaches over a Unix socket
+# speaking one JSON object per line:
+#   {"cmd": "list", "limit": 50}          -> {"ok": true, "alarms": [...]}
+#   {"cmd": "add", "fire_at": <epoch>, "repeat": <seconds|null>, "label": ""}
+#   {"cmd": "cancel", "id": 3}
+#   {"cmd": "snooze", "seconds": 300}     (snoozes the ringing alarm)
+#   {"cmd": "stop"}                       (silences the ringing alarm)
+# Every client also receives {"event": "changed" | "ringing" | "stopped"}.
+#   python alarm_daemon.py
+
+base_path = Path(__file__).parent
+SOUND_PATH = base_path / "assets" / "alarm.wav"
+SOCKET_PATH = DATA_DIR / "alarmd.sock"
+
+AUTO_STOP_SECONDS = 60
+MAX_WAIT_SECONDS = 60 * 60  # re-check hourly so wall-clock jumps are noticed
+PLAYERS = (["pw-play"], ["paplay"], ["aplay", "-q"], ["afplay"])
+
+
+def find_player():
+    for command in PLAYERS:
+        if shutil.which(command[0]):
+            return command
+    return None
+
+
+def alarm_to_dict(alarm):
+    return {"id": alarm.id, "fire_at": alarm.fire_at, "repeat": alarm.repeat, "label": alarm.label}
+
+
+class AlarmDaemon:
+    def __init__(self, core, sound_path=SOUND_PATH):
+        self.core = core
+        self.sound_path = sound_path
+        self.player = find_player()
+        self.clients = set()
+        self.ringing = None
+        self._timer = None
+        self._sound_task = None
+
+    # ==== Scheduling ====
+    def arm(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        delay_ms = self.core.next_alarm_delay_ms()
+        if delay_ms is not None:
+            delay = min(delay_ms / 1000, MAX_WAIT_SECONDS)
+            self._timer = asyncio.get_running_loop().call_later(delay, self.fire)
+
+    def fire(self):
+        self._timer = None
+        fired = self.core.fire_due()
+        if fired:
+            self.ring(fired[-1])
+            self.broadcast({"event": "changed"})
+        self.arm()
+
+    # ==== Sound ====
+    def ring(self, alarm):
+        self.ringing = alarm
+        self.broadcast({"event": "ringing", "alarm": alarm_to_dict(alarm)})
+        if self._sound_task is None or self._sound_task.done():
+            self._sound_task = asyncio.create_task(self.play_sound())
+
+    async def play_sound(self):
+        if self.player is None or not self.sound_path.exists():
+            print("⚠️ Warning: no audio player or alarm.wav found, ringing silently!")
+            return
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + AUTO_STOP_SECONDS
+        try:
+            while loop.time() < deadline:
+                proc = await asyncio.create_subprocess_exec(
+                    *self.player, str(self.sound_path),
+                    stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL,
+                )
+                try:
+                    await asyncio.wait_for(proc.wait(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    proc.terminate()
+                    break
+                except asyncio.CancelledError:
+                    proc.terminate()
+                    raise
+                if proc.returncode != 0:
+                    break
+        finally:
+            self.ringing = None
+            self.broadcast({"event": "stopped"})
+
+    def stop_sound(self):
+        if self._sound_task is not None and not self._sound_task.done():
+            self._sound_task.cancel()
+        else:
+            self.ringing = None
+            self.broadcast({"event": "stopped"})
+
+    # ==== Clients ====
+    async def handle_client(self, reader, writer):
+        self.clients.add(writer)
+        try:
+            while line := await reader.readline():
+                try:
+                    reply = self.dispatch(json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    reply = {"ok": False, "error": str(e)}
+                self.send(writer, reply)
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.discard(writer)
+            writer.close()
+
+    def dispatch(self, request):
+        cmd = request["cmd"]
+        if cmd == "list":
+            alarms = self.core.alarms.upcoming(int(request.get("limit", 50)))
+            return {"ok": True, "alarms": [alarm_to_dict(alarm) for alarm in alarms]}
+        if cmd == "add":
+            repeat = request.get("repeat")
+            alarm = self.core.add_alarm(
+                float(request["fire_at"]),
+                repeat=float(repeat) if repeat else None,
+                label=str(request.get("label", "")),
+            )
+            reply = {"ok": True, "alarm": alarm_to_dict(alarm)}
+        elif cmd == "cancel":
+            if self.core.cancel_alarm(int(request["id"])) is None:
+                return {"ok": False, "error": "no such alarm"}
+            reply = {"ok": True}
+        elif cmd == "snooze":
+            if self.ringing is None:
+                return {"ok": False, "error": "no alarm ringing"}
+            alarm = self.core.snooze_alarm(self.ringing, float(request.get("seconds", 300)))
+            self.stop_sound()
+            reply = {"ok": True, "alarm": alarm_to_dict(alarm)}
+        elif cmd == "stop":
+            self.stop_sound()
+            return {"ok": True}
+        else:
+            raise KeyError(f"unknown command {cmd!r}")
+        self.arm()
+        self.broadcast({"event": "changed"})
+        return reply
+
+    def send(self, writer, message):
+        if not writer.is_closing():
+            writer.write((json.dumps(message) + "\n").encode())
+
+    def broadcast(self, message):
+        for writer in list(self.clients):
+            self.send(writer, message)
+
+
+def daemon_running(path=SOCKET_PATH):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+async def serve(socket_path=SOCKET_PATH, db_path=DB_PATH):
+    socket_path = Path(socket_path)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if daemon_running(socket_path):
+        sys.exit("⚠️ Alarm daemon is already running.")
+    socket_path.unlink(missing_ok=True)  # left behind by a crashed daemon
+
+    core = ClockCore(store=AlarmStore(db_path), load_session=False)
+    daemon = AlarmDaemon(core)
+    server = await asyncio.start_unix_server(daemon.handle_client, path=str(socket_path))
+    daemon.arm()
+    print(f"⏰ Alarm daemon listening on {socket_path} ({len(core.alarms)} alarms loaded)")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    try:
+        await stop.wait()
+    finally:
+        server.close()
+        for writer in list(daemon.clients):
+            writer.close()
+        await server.wait_closed()
+        core.store.close()
+        socket_path.unlink(missing_ok=True)
+
+
+def main():
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+
+DATA_DIR = Path.home() / ".clock_app"
+DB_PATH = DATA_DIR / "clock.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS alarms (
+    id      INTEGER PRIMARY KEY,
+    fire_at REAL NOT NULL,
+    repeat  REAL,
+    label   TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS alarms_fire_at ON alarms (fire_at);
+CREATE TABLE IF NOT EXISTS stopwatch_sessions (
+    id         INTEGER PRIMARY KEY,
+    saved_at   REAL NOT NULL,
+    elapsed_ns INTEGER NOT NULL,
+    running    INTEGER NOT NULL,
+    closed     INTEGER NOT NULL,
+    laps       BLOB NOT NULL,
+    splits     BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS stopwatch_sessions_open ON stopwatch_sessions (closed, id);
+"""
+
+
+class AlarmStore:
+    """SQLite (WAL mode) store for alarms and stopwatch sessions.
+
+    Reads run on the caller's thread and only touch the fire_at index.
+    Writes are queued to a background thread that commits whatever has piled
+    up in one transaction, so the GUI thread never waits on the disk.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._reader = self._connect()
+        self._reader.executescript(SCHEMA)
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="alarm-store-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ==== Reads ====
+    def max_alarm_id(self):
+        return self._reader.execute("SELECT COALESCE(MAX(id), 0) FROM alarms").fetchone()[0]
+
+    def load_alarms(self, until):
+        """Alarms due at or before `until`, oldest first."""
+        return self._reader.execute(
+            "SELECT id, fire_at, repeat, label FROM alarms WHERE fire_at <= ? ORDER BY fire_at",
+            (until,),
+        ).fetchall()
+
+    def load_open_session(self):
+        return self._reader.execute(
+            "SELECT id, saved_at, elapsed_ns, running, laps, splits FROM stopwatch_sessions "
+            "WHERE closed = 0 ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+
+    # ==== Writes (queued) ====
+    def save_alarm(self, alarm):
+        self._queue.put((
+            "INSERT OR REPLACE INTO alarms (id, fire_at, repeat, label) VALUES (?, ?, ?, ?)",
+            (alarm.id, alarm.fire_at, alarm.repeat, alarm.label),
+        ))
+
+    def delete_alarm(self, alarm_id):
+        self._queue.put(("DELETE FROM alarms WHERE id = ?", (alarm_id,)))
+
+    def save_session(self, session_id, saved_at, elapsed_ns, running, closed, laps, splits):
+        self._queue.put((
+            "INSERT OR REPLACE INTO stopwatch_sessions "
+            "(id, saved_at, elapsed_ns, running, closed, laps, splits) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (session_id, saved_at, elapsed_ns, int(running), int(closed), laps, splits),
+        ))
+
+    def close(self):
+        self._queue.put(None)
+        self._writer.join()
+        self._reader.close()
+
+    def _write_loop(self):
+        conn = self._connect()
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            with conn:
+                for op in batch:
+                    if op is None:
+                        running = False
+                        break
+                    conn.execute(*op)
+        conn.close()
@@ -0,0 +1,111 @@
+import heapq
+import itertools
+import time
+
+DAY = 24 * 60 * 60
+
+
+class Alarm:
+    __slots__ = ("id", "fire_at", "repeat", "label", "_seq")
+
+    def __init__(self, alarm_id, fire_at, repeat=None, label=""):
+        self.id = alarm_id
+        self.fire_at = fire_at  # epoch seconds
+        self.repeat = repeat    # seconds between rings, None for one-shot
+        self.label = label
+        self._seq = 0
+
+    def __repr__(self):
+        return f"Alarm(id={self.id}, fire_at={self.fire_at}, repeat={self.repeat}, label={self.label!r})"
+
+
+class AlarmScheduler:
+    """Holds one-shot and recurring alarms in a heap ordered by deadline.
+
+    Adding and snoozing push one heap entry (O(log n)). Cancelling only drops
+    the alarm from the index; its stale heap entry is skipped when it reaches
+    the top, and the heap is rebuilt once stale entries outnumber live ones.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._heap = []      # (fire_at, seq, alarm)
+        self._alarms = {}    # id -> Alarm
+        self._ids = itertools.count(1)
+        self._seqs = itertools.count()
+
+    def __len__(self):
+        return len(self._alarms)
+
+    def __iter__(self):
+        return iter(self._alarms.values())
+
+    def reserve_ids(self, max_id):
+        # New alarms get ids above any already handed out, e.g. from a store
+        self._ids = itertools.count(max_id + 1)
+
+    def get(self, alarm_id):
+        return self._alarms.get(alarm_id)
+
+    def add(self, fire_at, repeat=None, label="", alarm_id=None):
+        if alarm_id is None:
+            alarm_id = next(self._ids)
+        alarm = Alarm(alarm_id, fire_at, repeat, label)
+        self._alarms[alarm.id] = alarm
+        self._push(alarm)
+        return alarm
+
+    def cancel(self, alarm_id):
+        alarm = self._alarms.pop(alarm_id, None)
+        if alarm is not None and len(self._heap) > 2 * len(self._alarms) + 64:
+            self._compact()
+        return alarm
+
+    def snooze(self, alarm, seconds):
+        """Ring `alarm` again in `seconds` without touching its recurrence."""
+        return self.add(self.clock() + seconds, label=alarm.label)
+
+    def next_deadline(self):
+        heap = self._heap
+        while heap and not self._is_live(heap[0]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def upcoming(self, limit):
+        live = (entry for entry in self._heap if self._is_live(entry))
+        return [entry[2] for entry in heapq.nsmallest(limit, live)]
+
+    def pop_due(self, now=None):
+        """Remove and return every alarm whose deadline is <= now.
+
+        Recurring alarms are rescheduled to their next deadline after `now`.
+        """
+        if now is None:
+            now = self.clock()
+        heap = self._heap
+        fired = []
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if not self._is_live(entry):
+                continue
+            alarm = entry[2]
+            fired.append(alarm)
+            if alarm.repeat:
+                missed = (now - alarm.fire_at) // alarm.repeat + 1
+                alarm.fire_at += missed * alarm.repeat
+                self._push(alarm)
+            else:
+                del self._alarms[alarm.id]
+        return fired
+
+    def _push(self, alarm):
+        alarm._seq = next(self._seqs)
+        heapq.heappush(self._heap, (alarm.fire_at, alarm._seq, alarm))
+
+    def _is_live(self, entry):
+        alarm = entry[2]
+        return self._alarms.get(alarm.id) is alarm and alarm._seq == entry[1]
+
+    def _compact(self):
+        self._heap = [entry for entry in self._heap if self._is_live(entry)]
+        heapq.heapify(self._heap)
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from pathlib import Path
+from PyQt5.QtCore import QObject, QUrl
+
+
+class AlarmAudio(QObject):
+    """Alarm tones, loaded on first use.
+
+    QtMultimedia is only imported when a tone is first prepared, so launching
+    the app never starts the audio backend. Prepared QSoundEffects are kept in
+    a small LRU cache keyed by file path.
+    """
+
+    def __init__(self, tone_dirs, cache_size=4, parent=None):
+        super().__init__(parent)
+        self.tone_dirs = [Path(d) for d in tone_dirs]
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._playing = None
+
+    def tones(self):
+        """Map of tone name -> path for every .wav in the tone directories."""
+        found = {}
+        for directory in self.tone_dirs:
+            if directory.is_dir():
+                for path in sorted(directory.glob("*.wav")):
+                    found.setdefault(path.stem, path)
+        return found
+
+    def prepare(self, path):
+        key = str(path)
+        effect = self._cache.get(key)
+        if effect is not None:
+            self._cache.move_to_end(key)
+            return effect
+
+        from PyQt5.QtMultimedia import QSoundEffect  # starts the audio backend
+
+        effect = QSoundEffect(self)
+        effect.setSource(QUrl.fromLocalFile(key))  # decoded in the background
+        effect.setLoopCount(QSoundEffect.Infinite)
+        self._cache[key] = effect
+        while len(self._cache) > self.cache_size:
+            _, old = self._cache.popitem(last=False)
+            if old is self._playing:
+                self._playing = None
+            old.stop()
+            old.deleteLater()
+        return effect
+
+    def play(self, path):
+        if not Path(path).exists():
+            print("⚠️ Warning: alarm tone not found!")
+            return False
+        effect = self.prepare(path)
+        if not effect.source().isValid() or effect.isPlaying():
+            return False
+        effect.play()
+        self._playing = effect
+        return True
+
+    def stop(self):
+        if self._playing is not None:
+            self._playing.stop()
+            self._playing = None
+
+    def is_playing(self):
+        return self._playing is not None and self._playing.isPlaying()
@@ -0,0 +1,49 @@
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from alarm_store import AlarmStore
+from alarms import DAY
+from clock_core import ClockCore
+
+# Cold-start cost of ClockCore with a growing number of stored alarms spread
+# over a year. Only the next LOAD_HORIZON of alarms is loaded, so startup
+# should stay flat as the store grows.
+#   python bench_alarm_store.py
+
+
+def populate(path, count, seed=3):
+    rng = random.Random(seed)
+    core = ClockCore(store=AlarmStore(path))
+    now = core.now()
+    for i in range(count):
+        core.add_alarm(now + rng.uniform(60, 365 * DAY), repeat=DAY if i % 20 == 0 else None)
+    started = time.perf_counter()
+    core.store.close()  # waits for the writer thread to drain the queue
+    return time.perf_counter() - started
+
+
+def cold_start(path, runs=5):
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        core = ClockCore(store=AlarmStore(path))
+        best = min(best, time.perf_counter() - started)
+        loaded = len(core.alarms)
+        core.store.close()
+    return best, loaded
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in (1_000, 10_000, 50_000):
+            path = Path(tmp) / f"alarms_{count}.db"
+            flush = populate(path, count)
+            startup, loaded = cold_start(path)
+            print(f"💾 {count:>6} stored: cold start {startup * 1000:6.2f} ms, "
+                  f"{loaded:>5} alarms loaded (writer flush {flush * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
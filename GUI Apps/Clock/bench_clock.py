@@ -0,0 +1,103 @@
+import argparse
+import random
+import statistics
+import time
+import timeit
+
+from alarms import DAY
+from bench_stopwatch import simulate as simulate_stopwatch
+from clock_core import ClockCore, SimulatedTimeSource, format_time
+
+# Benchmarks the Qt-free clock core on simulated time, so days of clock ticks
+# and thousands of alarms run in seconds:
+#   python bench_clock.py [--days 3] [--alarms 5000]
+
+START = 1_700_000_000.0
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def bench_event_loop(days, n_alarms, seed=42):
+    """Replay ClockApp's timer loop: one aligned clock tick per second plus
+    one single-shot timer for the next alarm, each delivered 0-2 ms late."""
+    rng = random.Random(seed)
+    source = SimulatedTimeSource(start=START)
+    core = ClockCore(source)
+    end = START + days * DAY
+    for i in range(n_alarms):
+        core.alarms.add(rng.uniform(START, end), repeat=DAY if i % 10 == 0 else None)
+
+    latencies = []
+    ticks = 0
+    next_tick = source.now() + core.ms_until_next_second() / 1000
+    started = time.perf_counter()
+    while source.now() < end:
+        delay_ms = core.next_alarm_delay_ms()
+        alarm_due = source.now() + delay_ms / 1000 if delay_ms is not None else float("inf")
+        slack = rng.uniform(0, 0.002)
+        if next_tick <= alarm_due:
+            source.advance_to(next_tick + slack)
+            core.clock_text()
+            ticks += 1
+            next_tick = source.now() + core.ms_until_next_second() / 1000
+        else:
+            source.advance_to(alarm_due + slack)
+            now = source.now()
+            for alarm in core.fire_due():
+                scheduled = alarm.fire_at - alarm.repeat if alarm.repeat else alarm.fire_at
+                latencies.append(now - scheduled)
+    return time.perf_counter() - started, ticks, latencies
+
+
+def bench_scheduler_ops(n_alarms, seed=7):
+    rng = random.Random(seed)
+    core = ClockCore(SimulatedTimeSource(start=START))
+    alarms = core.alarms
+
+    started = time.perf_counter()
+    added = [alarms.add(START + rng.uniform(0, 30 * DAY)) for _ in range(n_alarms)]
+    add_us = (time.perf_counter() - started) / n_alarms * 1e6
+
+    started = time.perf_counter()
+    for alarm in added[: n_alarms // 2]:
+        alarms.snooze(alarm, 300)
+    snooze_us = (time.perf_counter() - started) / (n_alarms // 2) * 1e6
+
+    started = time.perf_counter()
+    for alarm in added:
+        alarms.cancel(alarm.id)
+    cancel_us = (time.perf_counter() - started) / n_alarms * 1e6
+    return add_us, snooze_us, cancel_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clock core benchmarks")
+    parser.add_argument("--days", type=float, default=3)
+    parser.add_argument("--alarms", type=int, default=5000)
+    parser.add_argument("--stopwatch-hours", type=float, default=6)
+    args = parser.parse_args()
+
+    elapsed, ticks, latencies = bench_event_loop(args.days, args.alarms)
+    print(f"⏰ Simulated {args.days:g} days: {ticks} clock ticks, {len(latencies)} alarms in {elapsed:.2f} s")
+    if latencies:
+        ms = [lat * 1000 for lat in latencies]
+        print(f"   Alarm latency  p50 {percentile(ms, 50):.2f} ms  p99 {percentile(ms, 99):.2f} ms"
+              f"  max {max(ms):.2f} ms  mean {statistics.fmean(ms):.2f} ms")
+
+    add_us, snooze_us, cancel_us = bench_scheduler_ops(100_000)
+    print(f"📋 Scheduler with 100k alarms: add {add_us:.2f} µs  snooze {snooze_us:.2f} µs  cancel {cancel_us:.2f} µs")
+
+    true_ns, stopwatch, legacy_ms = simulate_stopwatch(args.stopwatch_hours)
+    print(f"⏱️ Stopwatch drift over {args.stopwatch_hours:g} h: {stopwatch.elapsed_ns() - true_ns} ns"
+          f" (legacy counter: {(legacy_ms - true_ns // 1_000_000) / 1000:.1f} s)")
+
+    calls = 200_000
+    per_call = timeit.timeit(lambda: format_time(45_296_789), number=calls) / calls
+    print(f"🔤 format_time: {per_call * 1e9:.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Cold-start time of ClockApp with lazy audio, compared with paying for
+# QtMultimedia and a QSoundEffect up front the way the app used to.
+#   python bench_startup.py [runs]
+# Set QT_QPA_PLATFORM=offscreen to measure without opening windows.
+
+base_path = Path(__file__).parent
+
+CHILD = """
+import sys
+sys.path.insert(0, {base!r})
+from PyQt5.QtWidgets import QApplication
+app = QApplication([])
+if {eager!r}:
+    from PyQt5.QtCore import QUrl
+    from PyQt5.QtMultimedia import QSoundEffect
+    sound = QSoundEffect()
+    sound.setSource(QUrl.fromLocalFile({wav!r}))
+    sound.setLoopCount(QSoundEffect.Infinite)
+import Clock
+window = Clock.ClockApp(store_path={db!r}, socket_path={sock!r})
+window.show()
+app.processEvents()
+"""
+
+
+def time_startup(eager, runs, tmp):
+    code = CHILD.format(
+        base=str(base_path), eager=eager, wav=str(base_path / "assets" / "alarm.wav"),
+        db=str(Path(tmp) / "clock.db"), sock=str(Path(tmp) / "none.sock"),
+    )
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        if result.returncode != 0:
+            return None, (result.stderr.strip().splitlines() or [f"exit status {result.returncode}"])[-1]
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples), None
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    with tempfile.TemporaryDirectory() as tmp:
+        lazy, lazy_error = time_startup(False, runs, tmp)
+        eager, eager_error = time_startup(True, runs, tmp)
+
+    if lazy is None:
+        print(f"🚀 Lazy audio:  failed to start ({lazy_error})")
+    else:
+        print(f"🚀 Lazy audio:  {lazy * 1000:.0f} ms (median of {runs})")
+    if eager is None:
+        print(f"🔊 Eager audio: failed to start ({eager_error})")
+    else:
+        print(f"🔊 Eager audio: {eager * 1000:.0f} ms (median of {runs})")
+    if lazy is not None and eager is not None:
+        print(f"   Saved {(eager - lazy) * 1000:.0f} ms per cold start")
+
+
+if __name__ == "__main__":
+    main()
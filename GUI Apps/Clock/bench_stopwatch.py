@@ -0,0 +1,66 @@
+import random
+import sys
+
+from stopwatch import Stopwatch
+
+# Simulates a stopwatch running for hours under a busy event loop and compares
+# the old "add 10 ms per tick" counter with the monotonic Stopwatch.
+#   python bench_stopwatch.py [hours]
+
+TICK_NS = 10_000_000
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ns):
+        self.now += ns
+
+
+def simulate(hours, seed=1234):
+    rng = random.Random(seed)
+    clock = FakeClock()
+    stopwatch = Stopwatch(clock=clock)
+    legacy_ms = 0
+    end = int(hours * 3600 * 1_000_000_000)
+
+    stopwatch.start()
+    while clock.now < end:
+        # Ticks arrive late, and every so often the event loop stalls and
+        # several ticks are coalesced into one.
+        delay = TICK_NS + rng.randrange(0, 3_000_000)
+        if rng.random() < 0.001:
+            delay += rng.randrange(50_000_000, 500_000_000)
+        clock.advance(delay)
+        legacy_ms += 10
+        if rng.random() < 0.0001:
+            stopwatch.lap()
+    stopwatch.stop()
+
+    true_ns = clock.now
+    return true_ns, stopwatch, legacy_ms
+
+
+def main():
+    hours = float(sys.argv[1]) if len(sys.argv) > 1 else 6
+    true_ns, stopwatch, legacy_ms = simulate(hours)
+
+    drift_ns = stopwatch.elapsed_ns() - true_ns
+    legacy_drift_ms = legacy_ms - true_ns // 1_000_000
+    print(f"Simulated {hours:g} h, {len(stopwatch.laps)} laps")
+    print(f"Stopwatch drift:      {drift_ns} ns")
+    print(f"Legacy counter drift: {legacy_drift_ms / 1000:.1f} s")
+
+    if drift_ns != 0:
+        sys.exit("❌ Stopwatch drifted from the clock!")
+    if sum(stopwatch.laps.laps) > stopwatch.elapsed_ns():
+        sys.exit("❌ Lap total exceeds elapsed time!")
+    print("✅ Zero drift")
+
+
+if __name__ == "__main__":
+    main()
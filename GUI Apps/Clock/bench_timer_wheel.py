@@ -0,0 +1,78 @@
+import random
+import sys
+import time
+
+from timer_wheel import TimerWheel
+
+# 100k concurrent countdowns on one timer wheel, driven by a fake clock at the
+# app's 100 ms tick: cost of add, cancel and each tick, plus a check that no
+# countdown fires early or more than one tick late, and the cost of the first
+# countdown after the wheel has sat idle for a week.
+#   python bench_timer_wheel.py [countdowns] [simulated_minutes]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    minutes = float(sys.argv[2]) if len(sys.argv) > 2 else 30
+    rng = random.Random(5)
+    clock = FakeClock()
+    wheel = TimerWheel(clock=clock)
+
+    started = time.perf_counter()
+    countdowns = [wheel.add(rng.uniform(1, 4 * 3600)) for _ in range(count)]
+    add_us = (time.perf_counter() - started) / count * 1e6
+
+    cancelled = rng.sample(countdowns, count // 10)
+    started = time.perf_counter()
+    for countdown in cancelled:
+        wheel.cancel(countdown.id)
+    cancel_us = (time.perf_counter() - started) / len(cancelled) * 1e6
+    for countdown in cancelled:
+        wheel.add(countdown.duration)  # keep the wheel at full size
+
+    tick_times = []
+    fired = late = early = 0
+    for step in range(1, int(minutes * 60 / wheel.tick) + 1):
+        clock.now = step * wheel.tick
+        started = time.perf_counter()
+        expired = wheel.advance()
+        tick_times.append(time.perf_counter() - started)
+        for countdown in expired:
+            fired += 1
+            if countdown.deadline > clock.now + 1e-6:
+                early += 1
+            elif clock.now - countdown.deadline > wheel.tick + 1e-6:
+                late += 1
+
+    tick_times.sort()
+    print(f"⏲️ {count} countdowns on one wheel")
+    print(f"   add {add_us:.2f} µs   cancel {cancel_us:.2f} µs")
+    print(f"   tick p50 {tick_times[len(tick_times) // 2] * 1e6:.1f} µs"
+          f"   p99 {tick_times[int(len(tick_times) * 0.99)] * 1e6:.1f} µs"
+          f"   max {tick_times[-1] * 1e6:.1f} µs   over {minutes:g} simulated minutes")
+    print(f"   {fired} expired, {early} early, {late} late, {len(wheel)} still running")
+
+    # The app stops ticking while no countdown runs; the next one must not replay the idle time
+    idle = TimerWheel(clock=clock)
+    clock.now += 7 * 24 * 3600
+    started = time.perf_counter()
+    first = idle.add(60)
+    idle.advance()
+    print(f"   first countdown after a week idle: {(time.perf_counter() - started) * 1e3:.2f} ms")
+    clock.now = first.deadline
+    if idle.advance() != [first]:
+        late += 1
+    if early or late:
+        sys.exit("❌ Countdowns fired outside their tick!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QScrollArea
+
+from world_clock import WorldClockPanel, default_zones
+
+# Paint time per one-second frame of the world clock as the zone count grows.
+# Only visible rows are painted, so frame cost should stay flat.
+#   python bench_world_clock.py [frames]
+
+
+class FakeNow:
+    def __init__(self):
+        self.value = time.time()
+
+    def __call__(self):
+        return self.value
+
+
+def bench(app, zone_names, frames):
+    now = FakeNow()
+    panel = WorldClockPanel(zone_names, now=now)
+    area = QScrollArea()
+    area.setWidgetResizable(True)
+    area.setWidget(panel)
+    area.resize(640, 600)
+    area.show()
+    app.processEvents()
+
+    paint_ns = []
+    original = panel.paintEvent
+
+    def timed_paint(event):
+        started = time.perf_counter_ns()
+        original(event)
+        paint_ns.append(time.perf_counter_ns() - started)
+
+    panel.paintEvent = timed_paint
+    panel.active = True
+    for _ in range(frames):
+        now.value += 1
+        panel.tick()
+        app.processEvents()
+    panel.timer.stop()
+    area.close()
+    return statistics.median(paint_ns) / 1000 if paint_ns else float("nan")
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    app = QApplication(sys.argv)
+    names = default_zones()
+    for count in (50, 200, 500, 2000):
+        zone_names = (names * (count // len(names) + 1))[:count]
+        per_frame = bench(app, zone_names, frames)
+        print(f"🌍 {count:>5} zones: {per_frame:7.1f} µs paint per frame (median of {frames})")
+
+
+if __name__ == "__main__":
+    main()
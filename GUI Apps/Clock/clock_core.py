@@ -0,0 +1,159 @@
+import math
+import time
+
+from alarms import AlarmScheduler, DAY
+from stopwatch import Stopwatch
+
+
+def format_time(ms):
+    h = ms // (3600 * 1000)
+    m = (ms // (60 * 1000)) % 60
+    s = (ms // 1000) % 60
+    cs = (ms % 1000) // 10
+    return f"{h:02}:{m:02}:{s:02}.{cs:02}"
+
+
+# Only alarms due within this window are loaded from the store at a time
+LOAD_HORIZON = 2 * DAY
+
+
+class SystemTimeSource:
+    def now(self):
+        return time.time()
+
+    def monotonic_ns(self):
+        return time.perf_counter_ns()
+
+
+class SimulatedTimeSource:
+    """Time source that only moves when told to, for tests and benchmarks."""
+
+    def __init__(self, start=0.0):
+        self._now_ns = int(start * 1_000_000_000)
+
+    def now(self):
+        return self._now_ns / 1_000_000_000
+
+    def monotonic_ns(self):
+        return self._now_ns
+
+    def advance(self, seconds):
+        self._now_ns += int(seconds * 1_000_000_000)
+
+    def advance_to(self, when):
+        self._now_ns = max(self._now_ns, int(when * 1_000_000_000))
+
+
+class ClockCore:
+    """Everything the Clock app does with time, with no Qt involved.
+
+    ClockApp only turns these answers into labels and timer intervals. With a
+    `store`, alarm changes and stopwatch sessions are persisted, and alarms
+    are paged in from it one LOAD_HORIZON window at a time. `load_alarms`
+    and `load_session` pick which half of the store this core owns, so the
+    GUI can leave alarms to the alarm daemon.
+    """
+
+    def __init__(self, time_source=None, store=None, load_alarms=True, load_session=True):
+        self.time_source = time_source or SystemTimeSource()
+        self.stopwatch = Stopwatch(clock=self.time_source.monotonic_ns)
+        self.alarms = AlarmScheduler(clock=self.time_source.now)
+        self.store = store
+        self.loaded_until = float("inf")
+        self.session_id = time.time_ns()
+        self._cancelled = set()
+        if store is not None and load_alarms:
+            self.own_alarms()
+        if store is not None and load_session:
+            self.restore_stopwatch()
+
+    def now(self):
+        return self.time_source.now()
+
+    def clock_text(self):
+        return time.strftime("%I:%M:%S %p", time.localtime(self.now()))
+
+    def ms_until_next_second(self):
+        # +1 so the tick lands just after the boundary, never just before it
+        return 1000 - int(self.now() * 1000) % 1000 + 1
+
+    def stopwatch_text(self):
+        return format_time(self.stopwatch.elapsed_ms())
+
+    def next_alarm_delay_ms(self):
+        deadline = self.alarms.next_deadline()
+        if deadline is None or deadline > self.loaded_until:
+            # Wake up at the end of the loaded window to page in more alarms
+            deadline = self.loaded_until
+        if deadline == float("inf"):
+            return None
+        return max(0, math.ceil((deadline - self.now()) * 1000))
+
+    def fire_due(self):
+        now = self.now()
+        fired = self.alarms.pop_due(now)
+        if self.store is not None:
+            for alarm in fired:
+                if alarm.repeat:
+                    self.store.save_alarm(alarm)
+                else:
+                    self.store.delete_alarm(alarm.id)
+            if now >= self.loaded_until:
+                self.load_upcoming()
+        return fired
+
+    # ==== Alarm changes ====
+    def add_alarm(self, fire_at, repeat=None, label=""):
+        alarm = self.alarms.add(fire_at, repeat=repeat, label=label)
+        if self.store is not None:
+            self.store.save_alarm(alarm)
+        return alarm
+
+    def cancel_alarm(self, alarm_id):
+        alarm = self.alarms.cancel(alarm_id)
+        if self.store is not None:
+            self._cancelled.add(alarm_id)
+            self.store.delete_alarm(alarm_id)
+        return alarm
+
+    def snooze_alarm(self, alarm, seconds):
+        snoozed = self.alarms.snooze(alarm, seconds)
+        if self.store is not None:
+            self.store.save_alarm(snoozed)
+        return snoozed
+
+    # ==== Persistence ====
+    def own_alarms(self):
+        """Page alarms in from the store, e.g. once the alarm daemon is gone."""
+        self.alarms.reserve_ids(self.store.max_alarm_id())
+        self.load_upcoming()
+
+    def load_upcoming(self):
+        until = self.now() + LOAD_HORIZON
+        for alarm_id, fire_at, repeat, label in self.store.load_alarms(until):
+            # Skip alarms already in memory or whose delete is still queued
+            if alarm_id in self._cancelled or self.alarms.get(alarm_id) is not None:
+                continue
+            self.alarms.add(fire_at, repeat=repeat, label=label, alarm_id=alarm_id)
+        self.loaded_until = until
+
+    def save_stopwatch(self, closed=False):
+        if self.store is None:
+            return
+        laps = self.stopwatch.laps
+        self.store.save_session(
+            self.session_id, self.now(), self.stopwatch.elapsed_ns(), self.stopwatch.running,
+            closed, laps.laps.tobytes(), laps.splits.tobytes(),
+        )
+        if closed:
+            self.session_id = time.time_ns()
+
+    def restore_stopwatch(self):
+        row = self.store.load_open_session()
+        if row is None:
+            return
+        self.session_id, saved_at, elapsed_ns, running, laps, splits = row
+        if running:
+            # Count the time the app was closed, measured on the wall clock
+            elapsed_ns += max(0, int((self.now() - saved_at) * 1_000_000_000))
+        self.stopwatch.restore(elapsed_ns, laps, splits, running=bool(running))
@@ -0,0 +1,44 @@
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class CountdownListModel(QAbstractListModel):
+    """Lists the countdowns in a TimerWheel, formatting only visible rows.
+
+    Row order is rebuilt at most once per `refresh` call after timers were
+    added, cancelled or expired; otherwise a refresh only tells the view that
+    the remaining times moved, and the view asks for the rows it shows.
+    """
+
+    def __init__(self, wheel, parent=None):
+        super().__init__(parent)
+        self.wheel = wheel
+        self.rows = []
+        self.dirty = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        countdown = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            seconds = int(countdown.remaining(self.wheel.clock()) + 0.999)
+            hours, rest = divmod(seconds, 3600)
+            minutes, seconds = divmod(rest, 60)
+            return f"{countdown.label or f'Timer {countdown.id}'}   {hours:02}:{minutes:02}:{seconds:02}"
+        if role == Qt.UserRole:
+            return countdown.id
+        return None
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def refresh(self):
+        if self.dirty:
+            self.beginResetModel()
+            self.rows = list(self.wheel.timers.values())
+            self.dirty = False
+            self.endResetModel()
+        elif self.rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self.rows) - 1), [Qt.DisplayRole])
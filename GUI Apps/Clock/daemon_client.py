@@ -0,0 +1,67 @@
+import json
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtNetwork import QLocalSocket
+
+from alarms import Alarm
+from alarm_daemon import SOCKET_PATH
+
+
+class DaemonClient(QObject):
+    """Talks to alarm_daemon.py over its Unix socket from the Qt event loop."""
+
+    alarms_listed = pyqtSignal(list)
+    alarms_changed = pyqtSignal()
+    ringing = pyqtSignal(object)
+    stopped = pyqtSignal()
+    error = pyqtSignal(str)
+    disconnected = pyqtSignal()
+
+    def __init__(self, socket_path=SOCKET_PATH, parent=None):
+        super().__init__(parent)
+        self.socket_path = socket_path
+        self.socket = QLocalSocket(self)
+        self.socket.readyRead.connect(self._read)
+        self.socket.disconnected.connect(self.disconnected)
+
+    def connect_to_daemon(self, timeout_ms=200):
+        self.socket.connectToServer(str(self.socket_path))
+        return self.socket.waitForConnected(timeout_ms)
+
+    # ==== Requests ====
+    def request_list(self, limit=50):
+        self._send({"cmd": "list", "limit": limit})
+
+    def add(self, fire_at, repeat=None, label=""):
+        self._send({"cmd": "add", "fire_at": fire_at, "repeat": repeat, "label": label})
+
+    def cancel(self, alarm_id):
+        self._send({"cmd": "cancel", "id": alarm_id})
+
+    def snooze(self, seconds):
+        self._send({"cmd": "snooze", "seconds": seconds})
+
+    def stop(self):
+        self._send({"cmd": "stop"})
+
+    def _send(self, request):
+        self.socket.write((json.dumps(request) + "\n").encode())
+
+    # ==== Replies and events ====
+    def _read(self):
+        while self.socket.canReadLine():
+            message = json.loads(bytes(self.socket.readLine()))
+            event = message.get("event")
+            if event == "changed":
+                self.alarms_changed.emit()
+            elif event == "ringing":
+                self.ringing.emit(self._alarm(message["alarm"]))
+            elif event == "stopped":
+                self.stopped.emit()
+            elif "alarms" in message:
+                self.alarms_listed.emit([self._alarm(a) for a in message["alarms"]])
+            elif not message.get("ok", True):
+                self.error.emit(message.get("error", "unknown error"))
+
+    @staticmethod
+    def _alarm(data):
+        return Alarm(data["id"], data["fire_at"], data["repeat"], data["label"])
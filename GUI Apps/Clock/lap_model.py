@@ -0,0 +1,39 @@
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class LapListModel(QAbstractListModel):
+    """Exposes a LapHistory to a QListView, newest lap first.
+
+    Rows are formatted only when the view asks for them, so only the
+    visible laps are ever turned into strings.
+    """
+
+    def __init__(self, history, format_ms, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.format_ms = format_ms
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.history)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        number = len(self.history) - index.row()
+        lap_ns, split_ns = self.history[number - 1]
+        return (
+            f"Lap {number}: {self.format_ms(lap_ns // 1_000_000)}"
+            f"   split {self.format_ms(split_ns // 1_000_000)}"
+        )
+
+    def record_lap(self, stopwatch):
+        # Newest row lives at the top
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        result = stopwatch.lap()
+        self.endInsertRows()
+        return result
+
+    def reset(self, stopwatch):
+        self.beginResetModel()
+        stopwatch.reset()
+        self.endResetModel()
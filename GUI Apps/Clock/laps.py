@@ -0,0 +1,63 @@
+import csv
+from array import array
+
+EXPORT_CHUNK = 65536
+
+
+class LapHistory:
+    """Lap and split times in nanoseconds, stored in compact int64 arrays.
+
+    Hundreds of thousands of laps cost 16 bytes each; statistics run over a
+    zero-copy NumPy view of the buffers.
+    """
+
+    def __init__(self):
+        self.laps = array("q")
+        self.splits = array("q")
+
+    def __len__(self):
+        return len(self.laps)
+
+    def __getitem__(self, i):
+        return self.laps[i], self.splits[i]
+
+    def append(self, lap_ns, split_ns):
+        self.laps.append(lap_ns)
+        self.splits.append(split_ns)
+
+    def restore(self, laps, splits):
+        self.clear()
+        self.laps.frombytes(laps)
+        self.splits.frombytes(splits)
+
+    def clear(self):
+        # Cleared in place so models holding this history stay valid
+        del self.laps[:]
+        del self.splits[:]
+
+    def stats(self, percentiles=(50, 90, 99)):
+        """Return count/min/max/mean and the given percentiles in ns, or None."""
+        if not self.laps:
+            return None
+        import numpy as np  # deferred so the headless alarm daemon stays small
+
+        data = np.frombuffer(self.laps, dtype=np.int64)
+        result = {
+            "count": int(data.size),
+            "min": int(data.min()),
+            "max": int(data.max()),
+            "mean": float(data.mean()),
+        }
+        for p, value in zip(percentiles, np.percentile(data, percentiles)):
+            result[f"p{p}"] = float(value)
+        return result
+
+    def export_csv(self, path):
+        """Stream the history to CSV one chunk at a time."""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["lap", "lap_ns", "split_ns"])
+            for start in range(0, len(self.laps), EXPORT_CHUNK):
+                laps = self.laps[start:start + EXPORT_CHUNK]
+                splits = self.splits[start:start + EXPORT_CHUNK]
+                writer.writerows(zip(range(start + 1, start + 1 + len(laps)), laps, splits))
@@ -0,0 +1,74 @@
+import time
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QEvent, QTimer, pyqtSignal
+
+
+def set_text_if_changed(label, text):
+    # setText re-lays out and repaints even for an identical string
+    if label.text() != text:
+        label.setText(text)
+
+
+class RenderGovernor(QObject):
+    """Tracks whether a window can actually be seen.
+
+    Emits `visibility_changed` when the window is shown, hidden, minimized,
+    restored, or its native surface gains or loses exposure, so timers that
+    only exist to redraw can be paused while nobody is looking. With
+    `throttle=False` the window always counts as visible once shown, which
+    is how the app behaved before and is handy for comparing wakeup rates.
+    """
+
+    visibility_changed = pyqtSignal(bool)
+
+    def __init__(self, window, throttle=True):
+        super().__init__(window)
+        self.window = window
+        self.throttle = throttle
+        self.visible = False
+        self._handle = None
+        self._wakeups = 0
+        self._stats_started = time.monotonic()
+        self._stats_timer = None
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        kind = event.type()
+        if sip.isdeleted(self.window):
+            # The native window outlives the widget wrapper during teardown
+            return False
+        if kind in (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange, QEvent.Expose):
+            if self._handle is None and self.window.windowHandle() is not None:
+                # Expose events go to the native QWindow, not the QWidget
+                self._handle = self.window.windowHandle()
+                self._handle.installEventFilter(self)
+            self._refresh()
+        return False
+
+    def _refresh(self):
+        handle = self.window.windowHandle()
+        visible = not self.throttle or (
+            self.window.isVisible()
+            and not self.window.isMinimized()
+            and (handle is None or handle.isExposed())
+        )
+        if visible != self.visible:
+            self.visible = visible
+            self.visibility_changed.emit(visible)
+
+    # ==== Wakeup statistics ====
+    def note_wakeup(self):
+        self._wakeups += 1
+
+    def enable_stats(self, interval_ms=10000):
+        self._stats_timer = QTimer(self)
+        self._stats_timer.timeout.connect(self.report_stats)
+        self._stats_timer.start(interval_ms)
+
+    def report_stats(self):
+        now = time.monotonic()
+        rate = self._wakeups / (now - self._stats_started)
+        state = "visible" if self.visible else "hidden"
+        print(f"⏱️ {rate:.2f} render wakeups/s ({state})")
+        self._wakeups = 0
+        self._stats_started = now
@@ -0,0 +1,65 @@
+import time
+
+from laps import LapHistory
+
+
+class Stopwatch:
+    """Stopwatch that reads elapsed time from a monotonic clock.
+
+    The GUI timer only asks for a redraw; it never feeds the count, so late or
+    coalesced ticks cannot make the stopwatch fall behind wall time.
+    """
+
+    def __init__(self, clock=time.perf_counter_ns):
+        self.clock = clock
+        self.laps = LapHistory()
+        self.reset()
+
+    @property
+    def running(self):
+        return self._started_at is not None
+
+    def start(self):
+        if not self.running:
+            self._started_at = self.clock()
+
+    def stop(self):
+        if self.running:
+            self._accumulated += self.clock() - self._started_at
+            self._started_at = None
+
+    def reset(self):
+        self._started_at = None
+        self._accumulated = 0
+        self._last_lap_end = 0
+        self.laps.clear()
+
+    def restore(self, elapsed_ns, laps, splits, running=False):
+        """Resume a saved session; laps/splits are raw int64 bytes."""
+        self.reset()
+        self._accumulated = elapsed_ns
+        self.laps.restore(laps, splits)
+        if len(self.laps):
+            self._last_lap_end = self.laps.splits[-1]
+        if running:
+            self.start()
+
+    def elapsed_ns(self):
+        if self.running:
+            return self._accumulated + (self.clock() - self._started_at)
+        return self._accumulated
+
+    def elapsed_ms(self):
+        return self.elapsed_ns() // 1_000_000
+
+    def split(self):
+        """Total elapsed time right now, without closing the current lap."""
+        return self.elapsed_ns()
+
+    def lap(self):
+        """Close the current lap and return (lap_ns, split_ns)."""
+        split = self.elapsed_ns()
+        lap = split - self._last_lap_end
+        self._last_lap_end = split
+        self.laps.append(lap, split)
+        return lap, split
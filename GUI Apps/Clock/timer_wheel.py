@@ -0,0 +1,123 @@
+import itertools
+import math
+import time
+
+
+class Countdown:
+    __slots__ = ("id", "label", "duration", "deadline", "expires", "slot")
+
+    def __init__(self, countdown_id, label, duration, deadline, expires):
+        self.id = countdown_id
+        self.label = label
+        self.duration = duration  # seconds
+        self.deadline = deadline  # clock() seconds
+        self.expires = expires    # wheel tick
+        self.slot = None          # dict currently holding this countdown
+
+    def remaining(self, now):
+        return max(0.0, self.deadline - now)
+
+
+class TimerWheel:
+    """Hierarchical timing wheel driving any number of countdowns.
+
+    `levels` wheels of 2**bits slots each; level 0 slots are one tick wide and
+    each level up is 2**bits times coarser. Add and cancel are O(1) dict
+    operations on a slot. `advance` walks the ticks that have passed, expiring
+    the current level-0 slot and cascading a coarser slot down whenever a
+    finer wheel wraps; while the wheel is empty it jumps straight to the
+    present instead, so the first countdown after an idle day costs nothing. With the defaults (100 ms ticks, 4 levels of 64 slots)
+    the wheel spans about 19 days; longer countdowns park in the last slot
+    and are re-placed as it cascades.
+    """
+
+    def __init__(self, tick=0.1, levels=4, bits=6, clock=time.monotonic):
+        self.tick = tick
+        self.levels = levels
+        self.bits = bits
+        self.size = 1 << bits
+        self.mask = self.size - 1
+        self.clock = clock
+        self.wheels = [[{} for _ in range(self.size)] for _ in range(levels)]
+        self.timers = {}
+        self.origin = clock()
+        self.current = 0  # next tick to process
+        self._ids = itertools.count(1)
+
+    def __len__(self):
+        return len(self.timers)
+
+    def _tick_at(self, when):
+        return math.ceil((when - self.origin) / self.tick - 1e-9)
+
+    def _passed(self, now):
+        """Last tick that has fully passed at `now`."""
+        return math.floor((now - self.origin) / self.tick + 1e-9)
+
+    def add(self, duration, label=""):
+        now = self.clock()
+        if not self.timers:
+            # Every slot is empty, so skipping the idle ticks is the same as walking them
+            self.current = max(self.current, self._passed(now) + 1)
+        deadline = now + duration
+        countdown = Countdown(next(self._ids), label, duration, deadline, self._tick_at(deadline))
+        self.timers[countdown.id] = countdown
+        self._place(countdown)
+        return countdown
+
+    def cancel(self, countdown_id):
+        countdown = self.timers.pop(countdown_id, None)
+        if countdown is not None:
+            del countdown.slot[countdown.id]
+            countdown.slot = None
+        return countdown
+
+    def advance(self, now=None):
+        """Process every tick up to `now` and return the countdowns that expired."""
+        # Only ticks that have fully passed; a countdown never fires early
+        target = self._passed(self.clock() if now is None else now)
+        if not self.timers:
+            self.current = max(self.current, target + 1)
+            return []
+        expired = []
+        while self.current <= target:
+            index = self.current & self.mask
+            if index == 0:
+                self._cascade()
+            slot = self.wheels[0][index]
+            if slot:
+                self.wheels[0][index] = {}
+                for countdown in slot.values():
+                    countdown.slot = None
+                    del self.timers[countdown.id]
+                expired.extend(slot.values())
+            self.current += 1
+        return expired
+
+    def _place(self, countdown):
+        delta = countdown.expires - self.current
+        if delta < 0:
+            level, index = 0, self.current & self.mask
+        else:
+            expires = countdown.expires
+            span = self.size ** self.levels
+            if delta >= span:
+                expires = self.current + span - 1  # park in the last slot
+            for level in range(self.levels):
+                if expires - self.current < self.size ** (level + 1):
+                    break
+            index = (expires >> (self.bits * level)) & self.mask
+        slot = self.wheels[level][index]
+        slot[countdown.id] = countdown
+        countdown.slot = slot
+
+    def _cascade(self):
+        for level in range(1, self.levels):
+            index = (self.current >> (self.bits * level)) & self.mask
+            slot = self.wheels[level][index]
+            if slot:
+                self.wheels[level][index] = {}
+                for countdown in slot.values():
+                    self._place(countdown)
+            if index != 0:
+                break
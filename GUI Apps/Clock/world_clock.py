@@ -0,0 +1,176 @@
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo, available_timezones
+
+from PyQt5.QtCore import Qt, QPointF, QRect, QSize, QTimer
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter, QStaticText
+from PyQt5.QtWidgets import QWidget
+
+DAY = 24 * 60 * 60
+TRANSITION_STEP = 7 * DAY
+TRANSITION_HORIZON = 366 * DAY
+
+
+def utc_offset(tz, when):
+    return int(datetime.fromtimestamp(when, tz).utcoffset().total_seconds())
+
+
+def next_transition(tz, after):
+    """First second after `after` where the zone's UTC offset changes.
+
+    Steps a week at a time, then bisects to the second. Returns the end of
+    the search horizon for zones without DST.
+    """
+    current = utc_offset(tz, after)
+    lo = after
+    while lo < after + TRANSITION_HORIZON:
+        hi = lo + TRANSITION_STEP
+        if utc_offset(tz, hi) != current:
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if utc_offset(tz, mid) == current:
+                    lo = mid
+                else:
+                    hi = mid
+            return hi
+        lo = hi
+    return after + TRANSITION_HORIZON
+
+
+def default_zones():
+    """Every IANA region zone, ordered by current UTC offset."""
+    now = int(time.time())
+    names = [n for n in available_timezones() if "/" in n and not n.startswith(("Etc/", "SystemV/"))]
+    return sorted(names, key=lambda n: (utc_offset(ZoneInfo(n), now), n))
+
+
+class Zone:
+    __slots__ = ("name", "tz", "offset", "next_transition", "label")
+
+    def __init__(self, name):
+        self.name = name
+        self.tz = ZoneInfo(name)
+        self.offset = 0
+        self.next_transition = 0
+        self.label = None
+
+
+class WorldClockPanel(QWidget):
+    """Hundreds of zone clocks painted on one widget from one timer.
+
+    Each zone's UTC offset is cached until its next DST transition, so a
+    frame is integer arithmetic plus cached QStaticText draws. Every second
+    only the seconds column of the visible rows is repainted; the HH:MM
+    column joins it once a minute.
+    """
+
+    def __init__(self, zone_names=None, now=time.time, parent=None):
+        super().__init__(parent)
+        self.now = now
+        self.zones = [Zone(name) for name in (zone_names or default_zones())]
+        self.active = False
+
+        self.setFont(QFont("Arial", 16))
+        metrics = QFontMetrics(self.font())
+        self.row_height = metrics.height() + 10
+        self.hhmm_width = metrics.horizontalAdvance("00:00")
+        self.seconds_width = metrics.horizontalAdvance(":00") + 4
+        self.text_y = 5
+        self._hhmm_cache = {}
+        self._seconds_cache = [self._static(f":{s:02}") for s in range(60)]
+        self._last_minute = None
+
+        utc = int(self.now())
+        for zone in self.zones:
+            self._refresh_zone(zone, utc)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+        self.setMinimumHeight(self.row_height * len(self.zones))
+
+    def sizeHint(self):
+        return QSize(600, self.row_height * len(self.zones))
+
+    def _static(self, text):
+        static = QStaticText(text)
+        static.setTextFormat(Qt.PlainText)
+        static.prepare(font=self.font())
+        return static
+
+    def _refresh_zone(self, zone, utc):
+        zone.offset = utc_offset(zone.tz, utc)
+        zone.next_transition = next_transition(zone.tz, utc)
+        sign = "+" if zone.offset >= 0 else "-"
+        hours, minutes = divmod(abs(zone.offset) // 60, 60)
+        zone.label = self._static(f"{zone.name}  (UTC{sign}{hours:02}:{minutes:02})")
+
+    def _hhmm(self, minute_of_day):
+        static = self._hhmm_cache.get(minute_of_day)
+        if static is None:
+            hours, minutes = divmod(minute_of_day, 60)
+            static = self._hhmm_cache[minute_of_day] = self._static(f"{hours:02}:{minutes:02}")
+        return static
+
+    # ==== Columns ====
+    def _seconds_x(self):
+        return self.width() - self.seconds_width - 10
+
+    def _hhmm_x(self):
+        return self._seconds_x() - self.hhmm_width
+
+    # ==== Ticking ====
+    def set_active(self, active):
+        self.active = active
+        if active and not self.timer.isActive():
+            self._last_minute = None
+            self.update()
+            self._schedule()
+        elif not active:
+            self.timer.stop()
+
+    def _schedule(self):
+        self.timer.start(1000 - int(self.now() * 1000) % 1000 + 1)
+
+    def tick(self):
+        if not self.active:
+            return
+        minute = int(self.now()) // 60
+        visible = self.visibleRegion().boundingRect()
+        if minute != self._last_minute:
+            left = self._hhmm_x()
+            self._last_minute = minute
+        else:
+            left = self._seconds_x()
+        self.update(QRect(left, visible.top(), self.width() - left, visible.height()))
+        self._schedule()
+
+    def paintEvent(self, event):
+        rect = event.rect()
+        painter = QPainter(self)
+        painter.fillRect(rect, QColor("#1c1b1b"))
+        painter.setPen(QColor("white"))
+
+        utc = int(self.now())
+        hhmm_x = self._hhmm_x()
+        seconds_x = self._seconds_x()
+        draw_label = rect.left() < hhmm_x
+        draw_hhmm = rect.left() < seconds_x and rect.right() >= hhmm_x
+        first = max(0, rect.top() // self.row_height)
+        last = min(len(self.zones) - 1, rect.bottom() // self.row_height)
+
+        for row in range(first, last + 1):
+            zone = self.zones[row]
+            if utc >= zone.next_transition:
+                self._refresh_zone(zone, utc)
+                if not draw_label:
+                    # The offset in the label changed too; repaint the whole row
+                    self.update(0, row * self.row_height, self.width(), self.row_height)
+            local = utc + zone.offset
+            y = row * self.row_height + self.text_y
+            if draw_label:
+                painter.drawStaticText(QPointF(10, y), zone.label)
+            if draw_hhmm:
+                painter.drawStaticText(QPointF(hhmm_x, y), self._hhmm(local // 60 % 1440))
+            painter.drawStaticText(QPointF(seconds_x, y), self._seconds_cache[local % 60])
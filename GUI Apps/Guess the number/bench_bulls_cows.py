@@ -0,0 +1,69 @@
+import argparse
+import time
+
+import numpy as np
+
+from bulls_cows import MAX_ATTEMPTS, BullsCowsGame, CandidateSolver, score
+
+# Bulls and Cows solver: plays games by always taking the hint, and times the
+# hint search and the candidate filter per guess. The filter is compared with
+# scoring every candidate in plain Python.
+#   python bench_bulls_cows.py [--digits 4 5 6] [--games 50] [--repeats]
+
+
+def python_filter(solver, candidates, guess, feedback):
+    return [code for code in candidates if score(code, guess) == feedback]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Bulls and Cows solver")
+    parser.add_argument("--digits", type=int, nargs="+", default=[4, 5, 6])
+    parser.add_argument("--games", type=int, default=50)
+    parser.add_argument("--repeats", action="store_true", help="codes may repeat digits")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    for digits in args.digits:
+        started = time.perf_counter()
+        solver = CandidateSolver(digits, args.repeats, seed=args.seed)
+        setup = time.perf_counter() - started
+        game = BullsCowsGame(digits, args.repeats, max_attempts=50, seed=args.seed)
+        hint_ms, filter_ms, guesses = [], [], []
+        for _ in range(args.games):
+            game.reset()
+            solver.reset()
+            while not game.won:
+                started = time.perf_counter()
+                code = solver.hint()
+                hint_ms.append((time.perf_counter() - started) * 1000)
+                bulls, cows = game.guess(code)
+                started = time.perf_counter()
+                solver.update(code, bulls, cows)
+                filter_ms.append((time.perf_counter() - started) * 1000)
+            guesses.append(game.attempts)
+
+        guesses = np.array(guesses)
+        mode = "any digits" if args.repeats else "different digits"
+        print(f"🐂 {digits} {mode}: {len(solver.codes):,} codes, set up in {setup * 1000:.0f} ms")
+        print(f"   {args.games} games: {guesses.mean():.2f} guesses on average, worst {guesses.max()},"
+              f" {np.mean(guesses <= MAX_ATTEMPTS):.0%} within {MAX_ATTEMPTS}")
+        p50, p99 = np.percentile(hint_ms, [50, 99])
+        print(f"   hint: p50 {p50:.1f} ms  p99 {p99:.1f} ms  max {max(hint_ms):.1f} ms")
+
+        # The first filter is the biggest: every code is still a candidate
+        solver.reset()
+        guess, feedback = solver.code(0), score(game.secret, solver.code(0))
+        started = time.perf_counter()
+        solver.update(guess, *feedback)
+        vectorized = time.perf_counter() - started
+        everything = [solver.code(i) for i in range(len(solver.codes))]
+        started = time.perf_counter()
+        python_filter(solver, everything, guess, feedback)
+        plain = time.perf_counter() - started
+        print(f"   first filter over all codes: {vectorized * 1000:.1f} ms vectorized,"
+              f" {plain * 1000:.0f} ms in Python ({plain / vectorized:.0f}x);"
+              f" later filters p50 {np.median(filter_ms):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
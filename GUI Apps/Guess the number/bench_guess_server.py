@@ -0,0 +1,140 @@
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from guess_server import HOST, PORT
+
+# Load generator for guess_server.py: `connections` clients, each holding
+# `sessions` games at once and playing them all by binary search, one guess
+# per game in flight. Finished games are replaced right away, so the server
+# holds connections x sessions games for the whole run.
+#   python bench_guess_server.py [--connections 100] [--sessions 200] [--seconds 10]
+# Every held game has a guess in flight, so latency at saturation is roughly
+# sessions held / guesses per second; lower --sessions to see idle latency.
+# Starts the server in a subprocess, with a temporary leaderboard, when
+# nothing is listening on the port.
+
+NEW_GAME = json.dumps({"op": "new", "player": "bench"}).encode() + b"\n"
+
+
+async def start_games(reader, writer, count):
+    writer.write(NEW_GAME * count)
+    games = []
+    for _ in range(count):
+        reply = json.loads(await reader.readline())
+        games.append([reply["session"], reply["low"], reply["high"], 0])  # session, lo, hi, last guess
+    return games
+
+
+async def connect(port, sessions):
+    reader, writer = await asyncio.open_connection(HOST, port)
+    return reader, writer, await start_games(reader, writer, sessions)
+
+
+async def play(reader, writer, games, deadline, latencies):
+    try:
+        while time.perf_counter() < deadline:
+            lines = []
+            for game in games:
+                game[3] = (game[1] + game[2]) // 2
+                lines.append(b'{"op": "guess", "session": %d, "number": %d}\n' % (game[0], game[3]))
+            sent = time.perf_counter()
+            writer.write(b"".join(lines))
+            finished = []
+            for i, game in enumerate(games):
+                reply = json.loads(await reader.readline())
+                latencies.append(time.perf_counter() - sent)
+                if reply["over"]:
+                    finished.append(i)
+                elif reply["result"] == "low":
+                    game[1] = game[3] + 1
+                else:
+                    game[2] = game[3] - 1
+            if finished:
+                for i, game in zip(finished, await start_games(reader, writer, len(finished))):
+                    games[i] = game
+    finally:
+        writer.close()
+
+
+async def request(port, payload):
+    reader, writer = await asyncio.open_connection(HOST, port)
+    writer.write(json.dumps(payload).encode() + b"\n")
+    reply = json.loads(await reader.readline())
+    writer.close()
+    return reply
+
+
+async def run(args):
+    started = time.perf_counter()
+    players = await asyncio.gather(*(connect(args.port, args.sessions) for _ in range(args.connections)))
+    stats = await request(args.port, {"op": "stats"})
+    print(f"🔌 {args.connections} connections holding {stats['sessions']:,} sessions"
+          f" (set up in {time.perf_counter() - started:.1f} s)")
+
+    latencies = []
+    started = time.perf_counter()
+    deadline = started + args.seconds
+    await asyncio.gather(*(play(*player, deadline, latencies) for player in players))
+    elapsed = time.perf_counter() - started
+
+    samples = np.array(latencies) * 1000
+    p50, p99, p999 = np.percentile(samples, [50, 99, 99.9])
+    print(f"🎯 {len(samples):,} guesses in {elapsed:.1f} s ({len(samples) / elapsed:,.0f} guesses/s)"
+          f"  latency p50 {p50:.1f} ms  p99 {p99:.1f} ms  p99.9 {p999:.1f} ms")
+    stats = await request(args.port, {"op": "stats"})
+    line = f"   server: peak {stats['peak_sessions']:,} sessions, {stats['games_won']:,} games won"
+    if "max_rss_kb" in stats:
+        line += f", max RSS {stats['max_rss_kb'] / 1024:.0f} MB"
+    print(line)
+
+
+async def wait_for_server(port, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(HOST, port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+        else:
+            writer.close()
+            return
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the guess server")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--sessions", type=int, default=200, help="games held at once per connection")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    server = None
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            asyncio.run(wait_for_server(args.port, timeout=0))
+        except OSError:
+            # A throwaway leaderboard, so the bench games stay off the real one
+            server = subprocess.Popen([sys.executable, str(Path(__file__).parent / "guess_server.py"),
+                                       "--port", str(args.port), "--db", str(Path(tmp) / "leaderboard.db")],
+                                      stdout=subprocess.DEVNULL)
+            asyncio.run(wait_for_server(args.port))
+        try:
+            asyncio.run(run(args))
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from guess_engine import STRATEGIES, simulate_batch
+from leaderboard import Leaderboard
+
+# Leaderboard at millions of games: insert throughput as the table grows,
+# one game at a time from the GUI, and board reads from the live top-k
+# against loading them from SQLite through the index or by a full scan.
+#   python bench_leaderboard.py [games] [players]
+
+RANGES = ((1, 100), (1, 1000))
+CHUNK = 250_000
+
+
+def simulated_games(count, players, rng):
+    """`(player, low, high, attempts, won, ts)` rows of human-like games."""
+    rows = []
+    for low, high in RANGES:
+        won, attempts = simulate_batch(STRATEGIES["human"], count // len(RANGES), low, high, rng=rng)
+        names = rng.integers(0, players, won.size)
+        ts = 1.7e9 + np.sort(rng.uniform(0, 365 * 86400, won.size))
+        rows += zip((f"player-{n}" for n in names.tolist()), [low] * won.size, [high] * won.size,
+                    attempts.tolist(), won.astype(int).tolist(), ts.tolist())
+    rows.sort(key=lambda row: row[5])
+    return rows
+
+
+def timed_ms(fn, repeat=200):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return np.median(samples) * 1000
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    players = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    rng = np.random.default_rng(11)
+    rows = simulated_games(games, players, rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "leaderboard.db"
+        board = Leaderboard(path)
+
+        rates = []
+        started = time.perf_counter()
+        for lo in range(0, len(rows), CHUNK):
+            chunk_started = time.perf_counter()
+            board.record_many(rows[lo:lo + CHUNK])
+            board.flush()
+            rates.append(len(rows[lo:lo + CHUNK]) / (time.perf_counter() - chunk_started))
+        elapsed = time.perf_counter() - started
+        print(f"🏆 insert {len(rows):,} games: {elapsed:.1f} s ({len(rows) / elapsed:,.0f} games/s);"
+              f" first chunk {rates[0]:,.0f}/s, last {rates[-1]:,.0f}/s")
+
+        ts = rows[-1][5]
+        started = time.perf_counter()
+        for i in range(1000):
+            board.record("player-0", 1, 100, 1 + i % 10, i % 3 != 0, ts + i)
+        queued = (time.perf_counter() - started) / 1000 * 1e6
+        board.flush()
+        print(f"   single game: {queued:.1f} µs on the caller's thread (committed in the background)")
+
+        low, high = RANGES[0]
+        print(f"   top {board.k} from the live board: {timed_ms(lambda: board.top(low, high)) * 1000:.1f} µs")
+        cold = Leaderboard(path)
+        started = time.perf_counter()
+        cold.top(low, high)
+        print(f"   first read after opening (leaderboard index): {(time.perf_counter() - started) * 1000:.2f} ms")
+        query = "SELECT attempts, ts, player FROM games {} WHERE won AND low = ? AND high = ? ORDER BY attempts, ts LIMIT ?"
+        for label, hint in (("index", ""), ("full scan", "NOT INDEXED")):
+            sql = query.format(hint)
+            ms = timed_ms(lambda: cold._reader.execute(sql, (low, high, board.k)).fetchall(), 3 if hint else 200)
+            print(f"   top {board.k} by SQL ({label}): {ms:.2f} ms")
+        ms = timed_ms(lambda: cold.player_record("player-7", low, high))
+        print(f"   one player's record (player index): {ms:.2f} ms")
+        assert cold.top(low, high) == board.top(low, high)
+        cold.close()
+        board.close()
+        print(f"   database: {path.stat().st_size / 2 ** 20:.0f} MB for {len(rows) + 1000:,} games")
+
+
+if __name__ == "__main__":
+    main()
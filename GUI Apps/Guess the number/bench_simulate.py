@@ -0,0 +1,49 @@
+import argparse
+import time
+
+import numpy as np
+
+from guess_engine import HIGH, LOW, MAX_ATTEMPTS, STRATEGIES, GuessGame, play, simulate
+
+# Plays millions of games per strategy with the batched NumPy simulator and
+# reports win rate, the attempts distribution and games/s, next to the same
+# engine driven one game at a time.
+#   python bench_simulate.py [--games 5000000] [--high 100] [--attempts 10]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate guess-the-number games")
+    parser.add_argument("--games", type=int, default=5_000_000)
+    parser.add_argument("--low", type=int, default=LOW)
+    parser.add_argument("--high", type=int, default=HIGH)
+    parser.add_argument("--attempts", type=int, default=MAX_ATTEMPTS)
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), action="append",
+                        help="strategies to run (default: all)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for name in args.strategy or list(STRATEGIES):
+        strategy = STRATEGIES[name]
+
+        game = GuessGame(args.low, args.high, args.attempts, seed=args.seed)
+        rng = np.random.default_rng(args.seed)
+        single_games = 20_000
+        started = time.perf_counter()
+        for _ in range(single_games):
+            game.reset()
+            play(game, strategy, rng)
+        single_rate = single_games / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+        result = simulate(strategy, args.games, args.low, args.high, args.attempts, seed=args.seed)
+        elapsed = time.perf_counter() - started
+
+        print(f"🎯 {name}: {result.games:,} games in {elapsed:.2f} s ({result.games / elapsed:,.0f} games/s,"
+              f" {result.games / elapsed / single_rate:.0f}x one at a time)")
+        print(f"   win rate {result.win_rate:.2%}, mean attempts when won {result.mean_attempts():.2f}")
+        shares = result.attempts_used[1:] / result.games
+        print("   won on attempt: " + "  ".join(f"{n}:{share:.1%}" for n, share in enumerate(shares, 1) if share))
+
+
+if __name__ == "__main__":
+    main()
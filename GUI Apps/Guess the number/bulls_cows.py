@@ -0,0 +1,210 @@
+import itertools
+import math
+import random
+
+import numpy as np
+
+# Bulls and Cows without Qt: guess a secret code of `digits` digits. A bull
+# is a right digit in the right place, a cow a right digit in the wrong
+# place. Classic codes have different digits; with `repeats` any digits
+# (Mastermind style) are allowed.
+
+DIGITS = 4
+MAX_ATTEMPTS = 12
+# Hint work cap, in (guess, candidate or feedback class) pairs. Under 10 ns
+# each, which keeps a hint well under 100 ms even for 6-digit codes.
+HINT_BUDGET = 4_000_000
+BLOCK_PAIRS = 500_000  # pairs per array pass
+
+
+def check_code(code, digits, repeats=False):
+    """`code` as a string of `digits` digits; ValueError if it is not one."""
+    code = code.strip()
+    if len(code) != digits or not code.isdigit() or not code.isascii():
+        raise ValueError(f"Please enter exactly {digits} digits!")
+    if not repeats and len(set(code)) != digits:
+        raise ValueError(f"Please enter {digits} different digits!")
+    return code
+
+
+def score(secret, guess):
+    """`(bulls, cows)` of `guess` against `secret`, both digit strings."""
+    bulls = sum(s == g for s, g in zip(secret, guess))
+    common = sum(min(secret.count(d), guess.count(d)) for d in set(guess))
+    return bulls, common - bulls
+
+
+class BullsCowsGame:
+    """One round of Bulls and Cows, with the same life cycle as GuessGame.
+
+    Invalid codes raise ValueError and do not use up an attempt.
+    """
+
+    __slots__ = ("digits", "repeats", "max_attempts", "rng", "secret", "attempts", "won")
+
+    def __init__(self, digits=DIGITS, repeats=False, max_attempts=MAX_ATTEMPTS, seed=None, rng=None, secret=None):
+        if not 1 <= digits <= (10 if not repeats else 9) or max_attempts < 1:
+            raise ValueError("need 1-10 digits (1-9 with repeats) and at least one attempt")
+        self.digits = digits
+        self.repeats = repeats
+        self.max_attempts = max_attempts
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.reset(secret)
+
+    def reset(self, secret=None):
+        """Start over with `secret`, or a new one drawn from the game's rng."""
+        if secret is None:
+            digits = (self.rng.choices if self.repeats else self.rng.sample)("0123456789", k=self.digits)
+            secret = "".join(digits)
+        self.secret = check_code(secret, self.digits, self.repeats)
+        self.attempts = 0
+        self.won = False
+
+    @property
+    def lost(self):
+        return not self.won and self.attempts >= self.max_attempts
+
+    @property
+    def over(self):
+        return self.won or self.attempts >= self.max_attempts
+
+    def guess(self, code):
+        """`(bulls, cows)` for `code`."""
+        if self.over:
+            raise RuntimeError("the game is over; reset to play again")
+        code = check_code(code, self.digits, self.repeats)
+        self.attempts += 1
+        bulls, cows = score(self.secret, code)
+        self.won = bulls == self.digits
+        return bulls, cows
+
+
+# ==== Candidate tracking ====
+MAX_SOLVER_DIGITS = 6  # 10 bits per position and per digit count must fit in 64
+
+if hasattr(np, "bitwise_count"):
+    popcount = np.bitwise_count
+else:  # NumPy < 2.0
+    _BYTE_BITS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def popcount(x):
+        return _BYTE_BITS[x[..., None].view(np.uint8)].sum(axis=-1, dtype=np.uint8)
+
+
+def all_codes(digits, repeats=False):
+    """Every code as a `(n, digits)` uint8 array, in numeric order."""
+    if repeats:
+        numbers = np.arange(10 ** digits, dtype=np.int64)
+        return (numbers[:, None] // 10 ** np.arange(digits - 1, -1, -1) % 10).astype(np.uint8)
+    count = math.perm(10, digits)
+    codes = itertools.chain.from_iterable(itertools.permutations(range(10), digits))
+    return np.fromiter(codes, dtype=np.uint8, count=count * digits).reshape(count, digits)
+
+
+class CandidateSolver:
+    """The secrets still consistent with a game's feedback, and hints.
+
+    Every code is packed into two uint64 bitsets: bit `10 * position + digit`
+    for each place, and for each digit d occurring c times, bits
+    `digits * d` to `digits * d + c - 1`. The bulls between two codes are then
+    the popcount of their place bits ANDed, and the digits they share (bulls
+    plus cows) the popcount of their count bits ANDed. The candidates are a
+    boolean mask over all codes, and feedback is scored for a block of guesses
+    against every candidate at once, so filtering and hint search are array
+    operations on a few bytes per pair.
+    """
+
+    def __init__(self, digits=DIGITS, repeats=False, seed=None):
+        if not 1 <= digits <= MAX_SOLVER_DIGITS:
+            raise ValueError(f"hints need 1-{MAX_SOLVER_DIGITS} digits")
+        self.digits = digits
+        self.repeats = repeats
+        self.rng = np.random.default_rng(seed)
+        self.codes = all_codes(digits, repeats)
+        self.numbers = self.codes @ 10 ** np.arange(digits - 1, -1, -1)  # ascending, for `index`
+        one = np.uint64(1)
+        self.places = np.zeros(len(self.codes), dtype=np.uint64)
+        for position in range(digits):
+            self.places |= one << (self.codes[:, position].astype(np.uint64) + np.uint64(10 * position))
+        self.shared = np.zeros(len(self.codes), dtype=np.uint64)
+        for d in range(10):
+            count = (self.codes == d).sum(axis=1).astype(np.uint64)
+            self.shared |= ((one << count) - one) << np.uint64(digits * d)
+        self.candidates = np.ones(len(self.codes), dtype=bool)
+
+    def reset(self):
+        self.candidates[:] = True
+
+    @property
+    def remaining(self):
+        return int(np.count_nonzero(self.candidates))
+
+    def index(self, code):
+        """Row of `code` in `self.codes`."""
+        return int(np.searchsorted(self.numbers, int(code)))
+
+    def code(self, index):
+        return "".join(map(str, self.codes[index]))
+
+    def pack(self, bulls, cows):
+        """Feedback as one small int; unique because cows <= digits - bulls."""
+        return bulls * self.digits + bulls + cows
+
+    def feedback(self, guesses, targets):
+        """Packed feedback of each guess against each target: a `(guesses, targets)` uint8 array."""
+        bulls = popcount(self.places[guesses][:, None] & self.places[targets][None, :])
+        common = popcount(self.shared[guesses][:, None] & self.shared[targets][None, :])
+        bulls *= np.uint8(self.digits)
+        bulls += common
+        return bulls
+
+    def update(self, code, bulls, cows):
+        """Keep only the candidates that would have answered `code` with `(bulls, cows)`."""
+        alive = np.flatnonzero(self.candidates)
+        packed = self.feedback(np.array([self.index(code)]), alive)[0]
+        self.candidates[alive[packed != self.pack(bulls, cows)]] = False
+        return self.remaining
+
+    def expected_remaining(self, guesses, alive):
+        """For each guess, the expected candidates left after its feedback (a win leaves none)."""
+        classes = (self.digits + 1) ** 2
+        packed = self.feedback(guesses, alive).astype(np.intp)
+        packed += (np.arange(len(guesses)) * classes)[:, None]
+        sizes = np.bincount(packed.ravel(), minlength=len(guesses) * classes).reshape(len(guesses), classes)
+        # A feedback class of size s is hit with probability s / n and leaves s
+        squares = (sizes.astype(np.int64) ** 2).sum(axis=1) - self.candidates[guesses]
+        return squares / len(alive)
+
+    def hint(self, budget=HINT_BUDGET):
+        """The code that minimises the expected number of candidates left.
+
+        Scores every code when that fits in `budget`, and otherwise the
+        candidates plus a random sample of other codes that does, so the work
+        per hint is bounded however many digits there are. Stops early at a
+        candidate that would tell all the others apart.
+        """
+        alive = np.flatnonzero(self.candidates)
+        if len(alive) <= 2:
+            return self.code(alive[0])
+        classes = (self.digits + 1) ** 2
+        limit = max(1, budget // (len(alive) + classes))
+        # Candidates first, as they might win outright; other codes may split better
+        if len(alive) >= limit:
+            guesses = self.rng.choice(alive, limit, replace=False)
+        else:
+            others = np.flatnonzero(~self.candidates)
+            if len(others) > limit - len(alive):
+                others = self.rng.choice(others, limit - len(alive), replace=False)
+            guesses = np.concatenate([alive, others])
+        perfect = (len(alive) - 1) / len(alive)
+        best, best_expected = None, np.inf
+        block = max(1, BLOCK_PAIRS // (len(alive) + classes))  # bounds the temporary arrays
+        for lo in range(0, len(guesses), block):
+            chunk = guesses[lo:lo + block]
+            expected = self.expected_remaining(chunk, alive)
+            i = int(np.argmin(expected))
+            if expected[i] < best_expected:
+                best, best_expected = chunk[i], expected[i]
+            if best_expected <= perfect:
+                break
+        return self.code(best)
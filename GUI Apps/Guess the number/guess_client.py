@@ -0,0 +1,59 @@
+import json
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtNetwork import QTcpSocket
+
+from guess_server import HOST, PORT
+
+
+class GuessClient(QObject):
+    """Plays on guess_server.py over TCP from the Qt event loop."""
+
+    started = pyqtSignal(dict)  # session, low, high, max_attempts
+    guessed = pyqtSignal(dict)  # result, attempts, max_attempts, over (+ secret, place)
+    ranked = pyqtSignal(dict)  # low, high, top: [[attempts, ts, player], ...]
+    error = pyqtSignal(str)
+    disconnected = pyqtSignal()
+
+    def __init__(self, host=HOST, port=PORT, player="", parent=None):
+        super().__init__(parent)
+        self.host = host
+        self.port = port
+        self.player = player
+        self.session = None
+        self.socket = QTcpSocket(self)
+        self.socket.readyRead.connect(self._read)
+        self.socket.disconnected.connect(self.disconnected)
+
+    def connect_to_server(self, timeout_ms=500):
+        self.socket.connectToHost(self.host, self.port)
+        return self.socket.waitForConnected(timeout_ms)
+
+    # ==== Requests ====
+    def new_game(self, round_number=None):
+        request = {"op": "new", "player": self.player}
+        if round_number is not None:
+            request["round"] = round_number
+        self._send(request)
+
+    def guess(self, number):
+        self._send({"op": "guess", "session": self.session, "number": number})
+
+    def top(self):
+        self._send({"op": "top"})
+
+    def _send(self, request):
+        self.socket.write((json.dumps(request) + "\n").encode())
+
+    # ==== Replies ====
+    def _read(self):
+        while self.socket.canReadLine():
+            message = json.loads(bytes(self.socket.readLine()))
+            if not message.get("ok", False):
+                self.error.emit(message.get("error", "unknown error"))
+            elif "result" in message:
+                self.guessed.emit(message)
+            elif "top" in message:
+                self.ranked.emit(message)
+            elif "low" in message:
+                self.session = message["session"]
+                self.started.emit(message)
@@ -0,0 +1,181 @@
+import random
+
+import numpy as np
+
+# Game rules without Qt: one game at a time for the window, or whole batches
+# of games as NumPy arrays for the simulator.
+
+LOW, HIGH = 1, 100
+MAX_ATTEMPTS = 10
+
+TOO_LOW, TOO_HIGH, CORRECT = "low", "high", "correct"
+
+
+class GuessGame:
+    """One round of guess-the-number.
+
+    The secret is drawn from `random.Random(seed)`, so a seed replays the
+    same sequence of secrets across `reset` calls; many games can share one
+    `rng` instead. Out-of-range guesses raise ValueError and do not use up an
+    attempt. Slotted, so a server can hold tens of thousands of them.
+    """
+
+    __slots__ = ("low", "high", "max_attempts", "rng", "secret", "attempts", "won")
+
+    def __init__(self, low=LOW, high=HIGH, max_attempts=MAX_ATTEMPTS, seed=None, rng=None, secret=None):
+        if low > high or max_attempts < 1:
+            raise ValueError("need low <= high and at least one attempt")
+        self.low = low
+        self.high = high
+        self.max_attempts = max_attempts
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.reset(secret)
+
+    def reset(self, secret=None):
+        """Start over with `secret`, or a new one drawn from the game's rng."""
+        self.secret = secret if secret is not None else self.rng.randint(self.low, self.high)
+        self.attempts = 0
+        self.won = False
+
+    @property
+    def lost(self):
+        return not self.won and self.attempts >= self.max_attempts
+
+    @property
+    def over(self):
+        return self.won or self.attempts >= self.max_attempts
+
+    def guess(self, number):
+        """TOO_LOW, TOO_HIGH or CORRECT for `number`."""
+        if self.over:
+            raise RuntimeError("the game is over; reset to play again")
+        if not self.low <= number <= self.high:
+            raise ValueError(f"Please enter a number between {self.low} and {self.high}!")
+        self.attempts += 1
+        if number < self.secret:
+            return TOO_LOW
+        if number > self.secret:
+            return TOO_HIGH
+        self.won = True
+        return CORRECT
+
+
+# ==== Strategies ====
+# A strategy maps the still-possible range [lo, hi] of every active game to
+# its next guess. They work on int64 arrays so the simulator can play a whole
+# batch per round; a single game passes one-element arrays.
+class BinarySearch:
+    name = "binary"
+
+    def propose(self, lo, hi, rng):
+        return (lo + hi) // 2
+
+
+class RandomGuess:
+    """Any number still consistent with the feedback so far."""
+
+    name = "random"
+
+    def propose(self, lo, hi, rng):
+        return rng.integers(lo, hi + 1)
+
+
+class HumanLike:
+    """Aims near the middle, but not exactly, and favours round numbers.
+
+    The guess is the midpoint plus Gaussian noise of `spread` times the range
+    width. While the range is wider than `round_above`, it snaps to a multiple
+    of 5 as people tend to ("50", then "25"...).
+    """
+
+    name = "human"
+
+    def __init__(self, spread=0.15, round_above=20):
+        self.spread = spread
+        self.round_above = round_above
+
+    def propose(self, lo, hi, rng):
+        width = hi - lo
+        guess = (lo + hi) / 2 + rng.normal(0.0, 1.0, np.shape(lo)) * (self.spread * width)
+        guess = np.where(width > self.round_above, np.round(guess / 5) * 5, np.round(guess))
+        return np.clip(guess, lo, hi).astype(np.int64)
+
+
+STRATEGIES = {strategy.name: strategy for strategy in (BinarySearch(), RandomGuess(), HumanLike())}
+
+
+def play(game, strategy, rng):
+    """Play `game` to the end with `strategy`; returns True if it was won."""
+    lo, hi = np.array([game.low]), np.array([game.high])
+    while not game.over:
+        guess = int(strategy.propose(lo, hi, rng)[0])
+        result = game.guess(guess)
+        if result == TOO_LOW:
+            lo[0] = guess + 1
+        elif result == TOO_HIGH:
+            hi[0] = guess - 1
+    return game.won
+
+
+# ==== Batched simulation ====
+class SimulationResult:
+    def __init__(self, max_attempts):
+        self.games = 0
+        self.wins = 0
+        # attempts_used[n] = games won on attempt n (index 0 unused)
+        self.attempts_used = np.zeros(max_attempts + 1, dtype=np.int64)
+
+    def add(self, won, attempts):
+        self.games += len(won)
+        self.wins += int(np.count_nonzero(won))
+        self.attempts_used += np.bincount(attempts[won], minlength=len(self.attempts_used))
+
+    @property
+    def win_rate(self):
+        return self.wins / self.games if self.games else float("nan")
+
+    def mean_attempts(self):
+        """Mean attempts over won games."""
+        return float(np.arange(len(self.attempts_used)) @ self.attempts_used) / self.wins if self.wins else float("nan")
+
+
+def simulate_batch(strategy, games, low=LOW, high=HIGH, max_attempts=MAX_ATTEMPTS, rng=None):
+    """Play `games` games at once; returns `(won, attempts)` arrays.
+
+    Each round asks the strategy for a guess in every unfinished game and
+    narrows their ranges with array comparisons, so the Python loop runs
+    `max_attempts` times regardless of how many games there are.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    secret = rng.integers(low, high + 1, games)
+    lo = np.full(games, low, dtype=np.int64)
+    hi = np.full(games, high, dtype=np.int64)
+    attempts = np.zeros(games, dtype=np.int64)
+    won = np.zeros(games, dtype=bool)
+    active = np.arange(games)
+    for attempt in range(1, max_attempts + 1):
+        if not active.size:
+            break
+        guess = strategy.propose(lo[active], hi[active], rng)
+        target = secret[active]
+        attempts[active] = attempt
+        hit = guess == target
+        low_guess = guess < target
+        lo[active] = np.where(low_guess, guess + 1, lo[active])
+        hi[active] = np.where(~low_guess & ~hit, guess - 1, hi[active])
+        won[active[hit]] = True
+        active = active[~hit]
+    return won, attempts
+
+
+def simulate(strategy, games, low=LOW, high=HIGH, max_attempts=MAX_ATTEMPTS, seed=None,
+             batch_size=1_000_000):
+    """Play `games` games in batches of `batch_size`; returns a SimulationResult."""
+    if isinstance(strategy, str):
+        strategy = STRATEGIES[strategy]
+    rng = np.random.default_rng(seed)
+    result = SimulationResult(max_attempts)
+    for start in range(0, games, batch_size):
+        won, attempts = simulate_batch(strategy, min(batch_size, games - start), low, high, max_attempts, rng)
+        result.add(won, attempts)
+    return result
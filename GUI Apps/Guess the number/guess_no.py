@@ -1,33 +1,166 @@
+import argparse
+import getpass
 import sys
 from pathlib import Path
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QLabel, QWidget, QVBoxLayout, 
                              QHBoxLayout, QGridLayout, QLineEdit, QPushButton, QFrame)
 from PyQt5.QtGui import QIcon, QFont, QPixmap, QPalette
-from PyQt5.QtCore import Qt
-from random import randint
+from PyQt5.QtCore import Qt, QTimer
+
+from bulls_cows import MAX_SOLVER_DIGITS, BullsCowsGame, CandidateSolver
+from guess_client import GuessClient
+from guess_engine import TOO_HIGH, TOO_LOW, GuessGame
+from guess_server import HOST, PORT
+from leaderboard import DB_PATH, Leaderboard
 
 base_path = Path(__file__).parent
 icon_path = base_path / "assets" / "numbers.png"
 
+sys.path.insert(0, str(base_path.parent))  # theme.py is shared by the apps
+from theme import hex_rgba, set_state, state_rules, stylesheet
+
+
+def outlined(color):
+    return f"color: {color}; background: {hex_rgba(color, 0.2)}; border: 2px solid {color};"
+
+
+STYLE = stylesheet("""
+    QWidget {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #667eea, stop:1 #764ba2);
+    }
+    QLabel#title {
+        color: white;
+        background: rgba(255, 255, 255, 0.1);
+        border-radius: 15px;
+        padding: 15px;
+        margin: 10px;
+    }
+    QLabel#prompt {
+        color: white;
+        background: None;
+        border-radius: 10px;
+        padding: 10px;
+        margin: 5px;
+    }
+    QLineEdit#guess_input {
+        background: white;
+        border: 3px solid #4CAF50;
+        border-radius: 15px;
+        padding: 12px;
+        font-size: 18px;
+        color: #333;
+    }
+    QLineEdit#guess_input:focus {
+        border: 3px solid #45a049;
+        background: #f0f8ff;
+    }
+    QPushButton#submit {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #4CAF50, stop:1 #45a049);
+        color: white;
+        border: none;
+        border-radius: 15px;
+        padding: 15px;
+        font-size: 16px;
+    }
+    QPushButton#submit:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #45a049, stop:1 #4CAF50);
+    }
+    QPushButton#submit:pressed {
+        background: #3d8b40;
+    }
+    QLabel#result {
+        color: white;
+        background: rgba(255, 255, 255, 0.1);
+        border-radius: 10px;
+        padding: 15px;
+        margin: 5px;
+        min-height: 50px;
+    }
+    QLabel#attempts {
+        color: white;
+        background: None;
+        border-radius: 8px;
+        padding: 8px;
+        margin: 5px;
+    }
+    QLabel#leaderboard, QLabel#history {
+        color: white;
+        background: rgba(255, 255, 255, 0.1);
+        border-radius: 10px;
+        padding: 10px;
+        margin: 5px;
+    }
+    QPushButton#reset {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #ff7043, stop:1 #f4511e);
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 12px;
+        font-size: 14px;
+    }
+    QPushButton#reset:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #f4511e, stop:1 #ff7043);
+    }
+    QPushButton#reset:pressed {
+        background: #e64a19;
+    }
+    QPushButton#hint {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #42a5f5, stop:1 #1e88e5);
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 12px;
+        font-size: 14px;
+    }
+    QPushButton#hint:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #1e88e5, stop:1 #42a5f5);
+    }
+    QPushButton#hint:disabled {
+        background: rgba(255, 255, 255, 0.2);
+    }
+""", state_rules("QLabel#result", {
+    "warning": outlined("#ffeb3b"),
+    "error": outlined("#f44336"),
+    "low": outlined("#2196F3"),
+    "feedback": outlined("#2196F3"),
+    "high": outlined("#FF9800"),
+    "win": outlined("#4CAF50"),
+    "lose": outlined("#f44336"),
+}))
+
 class Guess_number_game(QWidget):
-    def __init__(self):
+    def __init__(self, client=None, leaderboard=None, player=""):
         super().__init__()
-        self.secret_number = randint(1, 100)
-        self.attempt_count = 0
-        self.max_attempts = 10
+        self.game = GuessGame()
+        # With a GuessClient the server holds the game and its leaderboard;
+        # replies arrive as signals
+        self.client = client
+        self.leaderboard = leaderboard
+        self.player = player
         self.initUI()
+        if client is not None:
+            self.setWindowTitle(f"Number Guessing Game: online as {client.player}")
+            client.started.connect(self.on_started)
+            client.guessed.connect(self.on_guessed)
+            client.ranked.connect(self.on_ranked)
+            client.error.connect(self.show_warning)
+            client.disconnected.connect(lambda: self.show_warning("Lost the connection to the server."))
+        elif leaderboard is not None:
+            self.show_leaderboard(leaderboard.top(self.game.low, self.game.high), self.game.low, self.game.high)
 
     def initUI(self):
         self.setWindowTitle("Number Guessing Game")
         self.setWindowIcon(QIcon(str(icon_path)))
         
-        # Set window background color
-        self.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #667eea, stop:1 #764ba2);
-            }
-        """)
+        # The whole window is styled by one stylesheet, parsed once
+        self.setStyleSheet(STYLE)
 
         # Create main layout
         main_layout = QVBoxLayout()
@@ -38,49 +171,20 @@ class Guess_number_game(QWidget):
         self.title_label = QLabel("🎯 Number Guessing Game")
         self.title_label.setAlignment(Qt.AlignCenter)
         self.title_label.setFont(QFont("Arial", 24, QFont.Bold))
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 15px;
-                padding: 15px;
-                margin: 10px;
-            }
-        """)
+        self.title_label.setObjectName("title")
 
         # Instructions label
-        self.label = QLabel("🎲 Guess a number between 1 and 100:")
+        self.label = QLabel(f"🎲 Guess a number between {self.game.low} and {self.game.high}:")
         self.label.setAlignment(Qt.AlignCenter)
         self.label.setFont(QFont("Arial", 16))
-        self.label.setStyleSheet("""
-            QLabel {
-                color: white;
-                background: None;
-                border-radius: 10px;
-                padding: 10px;
-                margin: 5px;
-            }
-        """)
+        self.label.setObjectName("prompt")
 
         # Input field
         self.input = QLineEdit()
         self.input.setFont(QFont("Arial", 18))
         self.input.setAlignment(Qt.AlignCenter)
         self.input.setPlaceholderText("Enter your guess here...")
-        self.input.setStyleSheet("""
-            QLineEdit {
-                background: white;
-                border: 3px solid #4CAF50;
-                border-radius: 15px;
-                padding: 12px;
-                font-size: 18px;
-                color: #333;
-            }
-            QLineEdit:focus {
-                border: 3px solid #45a049;
-                background: #f0f8ff;
-            }
-        """)
+        self.input.setObjectName("guess_input")
         
         # Connect Enter key to submit
         self.input.returnPressed.connect(self.check_guess)
@@ -88,76 +192,32 @@ class Guess_number_game(QWidget):
         # Submit button
         self.button = QPushButton("🚀 Submit Guess")
         self.button.setFont(QFont("Arial", 16, QFont.Bold))
-        self.button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4CAF50, stop:1 #45a049);
-                color: white;
-                border: none;
-                border-radius: 15px;
-                padding: 15px;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #45a049, stop:1 #4CAF50);
-            }
-            QPushButton:pressed {
-                background: #3d8b40;
-            }
-        """)
+        self.button.setObjectName("submit")
         self.button.clicked.connect(self.check_guess)
 
         # Result label
         self.result = QLabel("")
         self.result.setAlignment(Qt.AlignCenter)
         self.result.setFont(QFont("Arial", 18, QFont.Bold))
-        self.result.setStyleSheet("""
-            QLabel {
-                color: white;
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 10px;
-                padding: 15px;
-                margin: 5px;
-                min-height: 50px;
-            }
-        """)
+        self.result.setObjectName("result")
 
         # Attempts counter
-        self.attempts_label = QLabel(f"Attempts: {self.attempt_count}/{self.max_attempts}")
+        self.attempts_label = QLabel(f"Attempts: {self.game.attempts}/{self.game.max_attempts}")
         self.attempts_label.setAlignment(Qt.AlignCenter)
         self.attempts_label.setFont(QFont("Arial", 14))
-        self.attempts_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                background: None;
-                border-radius: 8px;
-                padding: 8px;
-                margin: 5px;
-            }
-        """)
+        self.attempts_label.setObjectName("attempts")
+
+        # Leaderboard panel, filled once a board is known
+        self.leaderboard_label = QLabel("")
+        self.leaderboard_label.setTextFormat(Qt.PlainText)
+        self.leaderboard_label.setFont(QFont("Arial", 12))
+        self.leaderboard_label.setObjectName("leaderboard")
+        self.leaderboard_label.hide()
 
         # Reset button
         self.reset_button = QPushButton("🔄 New Game")
         self.reset_button.setFont(QFont("Arial", 14, QFont.Bold))
-        self.reset_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff7043, stop:1 #f4511e);
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 12px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f4511e, stop:1 #ff7043);
-            }
-            QPushButton:pressed {
-                background: #e64a19;
-            }
-        """)
+        self.reset_button.setObjectName("reset")
         self.reset_button.clicked.connect(self.reset_game)
 
         # Add widgets to layout
@@ -167,10 +227,11 @@ class Guess_number_game(QWidget):
         main_layout.addWidget(self.button)
         main_layout.addWidget(self.result)
         main_layout.addWidget(self.attempts_label)
+        main_layout.addWidget(self.leaderboard_label)
         main_layout.addWidget(self.reset_button)
 
         self.setLayout(main_layout)
-        self.resize(450, 550)
+        self.resize(450, 550 if self.client is None and self.leaderboard is None else 800)
         
         # Center the window on screen
         self.center_window()
@@ -187,95 +248,74 @@ class Guess_number_game(QWidget):
     def check_guess(self):
         try:
             guess = int(self.input.text())
-            if guess < 1 or guess > 100:
-                self.result.setText("⚠️ Please enter a number between 1 and 100!")
-                self.result.setStyleSheet("""
-                    QLabel {
-                        color: #ffeb3b;
-                        background: rgba(255, 235, 59, 0.2);
-                        border: 2px solid #ffeb3b;
-                        border-radius: 10px;
-                        padding: 15px;
-                        margin: 5px;
-                        min-height: 50px;
-                    }
-                """)
-                return
         except ValueError:
             self.result.setText("❌ Please enter a valid number!")
-            self.result.setStyleSheet("""
-                QLabel {
-                    color: #f44336;
-                    background: rgba(244, 67, 54, 0.2);
-                    border: 2px solid #f44336;
-                    border-radius: 10px;
-                    padding: 15px;
-                    margin: 5px;
-                    min-height: 50px;
-                }
-            """)
+            set_state(self.result, "error")
+            return
+        if self.client is not None:
+            self.client.guess(guess)
+            return
+        try:
+            outcome = self.game.guess(guess)
+        except ValueError as e:  # out of range; does not use up an attempt
+            self.show_warning(str(e))
             return
+        self.show_outcome(outcome, self.game.attempts, self.game.max_attempts,
+                          self.game.secret if self.game.over else None)
+        if self.game.over and self.leaderboard is not None:
+            game = self.game
+            place = self.leaderboard.record(self.player, game.low, game.high, game.attempts, game.won)
+            self.show_place(place)
+            self.show_leaderboard(self.leaderboard.top(game.low, game.high), game.low, game.high)
+
+    def on_guessed(self, reply):
+        self.show_outcome(reply["result"], reply["attempts"], reply["max_attempts"], reply.get("secret"))
+        if reply["over"]:
+            self.show_place(reply.get("place"))
+            self.client.top()
+
+    def on_ranked(self, reply):
+        self.show_leaderboard(reply["top"], reply["low"], reply["high"])
 
-        self.attempt_count += 1
-        self.attempts_label.setText(f"Attempts: {self.attempt_count}/{self.max_attempts}")
+    def show_place(self, place):
+        if place is not None:
+            self.result.setText(f"{self.result.text()}\n🏆 #{place} on the leaderboard!")
 
-        if guess < self.secret_number:
+    def show_leaderboard(self, entries, low, high):
+        """List `(attempts, ts, player)` wins, best first."""
+        lines = [f"🏆 Fewest attempts ({low}-{high})"]
+        lines += [f"{place}. {player or 'anonymous'}: {attempts}"
+                  for place, (attempts, _, player) in enumerate(entries, 1)]
+        if not entries:
+            lines.append("No wins yet. Be the first!")
+        self.leaderboard_label.setText("\n".join(lines))
+        self.leaderboard_label.show()
+
+    def show_warning(self, message):
+        self.result.setText(f"⚠️ {message}")
+        set_state(self.result, "warning")
+
+    def show_outcome(self, outcome, attempts, max_attempts, secret=None):
+        """Show a guess's outcome; `secret` is only known once the game is over."""
+        self.attempts_label.setText(f"Attempts: {attempts}/{max_attempts}")
+
+        if outcome == TOO_LOW:
             self.result.setText("📈 Too low! Try a higher number.")
-            self.result.setStyleSheet("""
-                QLabel {
-                    color: #2196F3;
-                    background: rgba(33, 150, 243, 0.2);
-                    border: 2px solid #2196F3;
-                    border-radius: 10px;
-                    padding: 15px;
-                    margin: 5px;
-                    min-height: 50px;
-                }
-            """)
-        elif guess > self.secret_number:
+            set_state(self.result, "low")
+        elif outcome == TOO_HIGH:
             self.result.setText("📉 Too high! Try a lower number.")
-            self.result.setStyleSheet("""
-                QLabel {
-                    color: #FF9800;
-                    background: rgba(255, 152, 0, 0.2);
-                    border: 2px solid #FF9800;
-                    border-radius: 10px;
-                    padding: 15px;
-                    margin: 5px;
-                    min-height: 50px;
-                }
-            """)
+            set_state(self.result, "high")
         else:
-            self.result.setText(f"🎉 Congratulations! You guessed it in {self.attempt_count} attempts!")
-            self.result.setStyleSheet("""
-                QLabel {
-                    color: #4CAF50;
-                    background: rgba(76, 175, 80, 0.2);
-                    border: 2px solid #4CAF50;
-                    border-radius: 10px;
-                    padding: 15px;
-                    margin: 5px;
-                    min-height: 50px;
-                }
-            """)
+            self.result.setText(f"🎉 Congratulations! You guessed it in {attempts} attempts!")
+            set_state(self.result, "win")
             self.button.setEnabled(False)
             self.input.setEnabled(False)
             return
 
         # Check if max attempts reached
-        if self.attempt_count >= self.max_attempts:
-            self.result.setText(f"💀 Game Over! The number was {self.secret_number}. Try again!")
-            self.result.setStyleSheet("""
-                QLabel {
-                    color: #f44336;
-                    background: rgba(244, 67, 54, 0.2);
-                    border: 2px solid #f44336;
-                    border-radius: 10px;
-                    padding: 15px;
-                    margin: 5px;
-                    min-height: 50px;
-                }
-            """)
+        if secret is not None:
+            self.result.setText(f"💀 Game Over! The number was {secret}. Try again!")
+            set_state(self.result, "lose")
             self.button.setEnabled(False)
             self.input.setEnabled(False)
 
@@ -285,34 +325,233 @@ class Guess_number_game(QWidget):
 
     def reset_game(self):
         """Reset the game to start fresh"""
-        self.secret_number = randint(1, 100)
-        self.attempt_count = 0
+        if self.client is not None:
+            self.client.new_game()  # the board resets when the server replies
+            return
+        self.game.reset()
+        self.start_board(self.game.low, self.game.high, self.game.max_attempts)
+
+    def on_started(self, reply):
+        self.start_board(reply["low"], reply["high"], reply["max_attempts"])
+        if self.leaderboard_label.isHidden():
+            self.client.top()
+
+    def start_board(self, low, high, max_attempts):
+        self.label.setText(f"🎲 Guess a number between {low} and {high}:")
         self.input.clear()
         self.input.setEnabled(True)
         self.button.setEnabled(True)
         self.result.setText("")
-        self.result.setStyleSheet("""
-            QLabel {
-                color: white;
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 10px;
-                padding: 15px;
-                margin: 5px;
-                min-height: 50px;
-            }
-        """)
-        self.attempts_label.setText(f"Attempts: {self.attempt_count}/{self.max_attempts}")
+        set_state(self.result, "")
+        self.attempts_label.setText(f"Attempts: 0/{max_attempts}")
+        self.input.setFocus()
+
+class Bulls_cows_game(QWidget):
+    """Bulls and Cows: find a code of `digits` digits, with solver hints."""
+
+    def __init__(self, digits=4, repeats=False):
+        super().__init__()
+        self.game = BullsCowsGame(digits, repeats)
+        self.solver = None  # kept in step with every guess once built
+        self.guesses = []
+        self.initUI()
+        if digits <= MAX_SOLVER_DIGITS:
+            # Listing every code takes up to half a second; do it once the window is up
+            QTimer.singleShot(0, self.prepare_solver)
+
+    def initUI(self):
+        game = self.game
+        self.setWindowTitle("Bulls and Cows")
+        self.setWindowIcon(QIcon(str(icon_path)))
+        self.setStyleSheet(STYLE)
+
+        main_layout = QVBoxLayout()
+        main_layout.setSpacing(20)
+        main_layout.setContentsMargins(30, 30, 30, 30)
+
+        self.title_label = QLabel("🐂 Bulls and Cows")
+        self.title_label.setAlignment(Qt.AlignCenter)
+        self.title_label.setFont(QFont("Arial", 24, QFont.Bold))
+        self.title_label.setObjectName("title")
+
+        kind = "digits" if game.repeats else "different digits"
+        self.label = QLabel(f"🔢 Guess the secret code of {game.digits} {kind}.\n"
+                            "🐂 Bull: right digit, right place. 🐄 Cow: right digit, wrong place.")
+        self.label.setAlignment(Qt.AlignCenter)
+        self.label.setFont(QFont("Arial", 14))
+        self.label.setObjectName("prompt")
+
+        self.input = QLineEdit()
+        self.input.setFont(QFont("Arial", 18))
+        self.input.setAlignment(Qt.AlignCenter)
+        self.input.setMaxLength(game.digits)
+        self.input.setPlaceholderText("Enter your code here...")
+        self.input.setObjectName("guess_input")
+        self.input.returnPressed.connect(self.check_guess)
+
+        self.button = QPushButton("🚀 Submit Guess")
+        self.button.setFont(QFont("Arial", 16, QFont.Bold))
+        self.button.setObjectName("submit")
+        self.button.clicked.connect(self.check_guess)
+
+        self.result = QLabel("")
+        self.result.setAlignment(Qt.AlignCenter)
+        self.result.setFont(QFont("Arial", 18, QFont.Bold))
+        self.result.setObjectName("result")
+
+        self.attempts_label = QLabel(f"Attempts: 0/{game.max_attempts}")
+        self.attempts_label.setAlignment(Qt.AlignCenter)
+        self.attempts_label.setFont(QFont("Arial", 14))
+        self.attempts_label.setObjectName("attempts")
+
+        # Previous guesses with their bulls and cows
+        self.history_label = QLabel("")
+        self.history_label.setFont(QFont("Courier New", 13))
+        self.history_label.setObjectName("history")
+        self.history_label.hide()
+
+        self.hint_button = QPushButton("💡 Hint")
+        self.hint_button.setFont(QFont("Arial", 14, QFont.Bold))
+        self.hint_button.setObjectName("hint")
+        self.hint_button.clicked.connect(self.show_hint)
+        if game.digits > MAX_SOLVER_DIGITS:
+            self.hint_button.setEnabled(False)
+            self.hint_button.setToolTip(f"Hints need at most {MAX_SOLVER_DIGITS} digits")
+
+        self.reset_button = QPushButton("🔄 New Game")
+        self.reset_button.setFont(QFont("Arial", 14, QFont.Bold))
+        self.reset_button.setObjectName("reset")
+        self.reset_button.clicked.connect(self.reset_game)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.hint_button)
+        buttons.addWidget(self.reset_button)
+
+        main_layout.addWidget(self.title_label)
+        main_layout.addWidget(self.label)
+        main_layout.addWidget(self.input)
+        main_layout.addWidget(self.button)
+        main_layout.addWidget(self.result)
+        main_layout.addWidget(self.attempts_label)
+        main_layout.addWidget(self.history_label)
+        main_layout.addLayout(buttons)
+
+        self.setLayout(main_layout)
+        self.resize(500, 800)
+        self.center_window()
+
+    def center_window(self):
+        """Center the window on the screen"""
+        screen = QApplication.desktop().screenGeometry()
+        size = self.geometry()
+        self.move(
+            (screen.width() - size.width()) // 2,
+            (screen.height() - size.height()) // 2
+        )
+
+    def check_guess(self):
+        try:
+            bulls, cows = self.game.guess(self.input.text())
+        except ValueError as e:  # not a valid code; does not use up an attempt
+            self.result.setText(f"⚠️ {e}")
+            set_state(self.result, "warning")
+            return
+        code = self.input.text().strip()
+        self.guesses.append((code, bulls, cows))
+        if self.solver is not None:
+            self.solver.update(code, bulls, cows)
+        self.attempts_label.setText(f"Attempts: {self.game.attempts}/{self.game.max_attempts}")
+        self.history_label.setText("\n".join(f"{g}   🐂 {b}  🐄 {c}" for g, b, c in self.guesses))
+        self.history_label.show()
+
+        if self.game.won:
+            self.result.setText(f"🎉 Cracked it in {self.game.attempts} attempts!")
+            set_state(self.result, "win")
+        elif self.game.lost:
+            self.result.setText(f"💀 Game Over! The code was {self.game.secret}. Try again!")
+            set_state(self.result, "lose")
+        else:
+            self.result.setText(f"🐂 {bulls} {'bull' if bulls == 1 else 'bulls'},"
+                                f" 🐄 {cows} {'cow' if cows == 1 else 'cows'}")
+            set_state(self.result, "feedback")
+        if self.game.over:
+            for widget in (self.button, self.input, self.hint_button):
+                widget.setEnabled(False)
+        self.input.clear()
+        self.input.setFocus()
+
+    def show_hint(self):
+        """Suggest the code that leaves the fewest possible secrets on average."""
+        self.prepare_solver()
+        code = self.solver.hint()
+        remaining = self.solver.remaining
+        self.input.setText(code)
+        self.result.setText(f"💡 Try {code}: {remaining} possible {'code' if remaining == 1 else 'codes'} left")
+        set_state(self.result, "")
+        self.input.setFocus()
+
+    def prepare_solver(self):
+        if self.solver is None:
+            self.solver = CandidateSolver(self.game.digits, self.game.repeats)
+            for code, bulls, cows in self.guesses:
+                self.solver.update(code, bulls, cows)
+
+    def reset_game(self):
+        self.game.reset()
+        self.guesses.clear()
+        if self.solver is not None:
+            self.solver.reset()
+        for widget in (self.button, self.input):
+            widget.setEnabled(True)
+        self.hint_button.setEnabled(self.game.digits <= MAX_SOLVER_DIGITS)
+        self.input.clear()
+        self.result.setText("")
+        set_state(self.result, "")
+        self.attempts_label.setText(f"Attempts: 0/{self.game.max_attempts}")
+        self.history_label.hide()
         self.input.setFocus()
 
+
 def main():
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Number guessing game")
+    parser.add_argument("--server", nargs="?", const=f"{HOST}:{PORT}", metavar="HOST:PORT",
+                        help="play on guess_server.py instead of locally")
+    parser.add_argument("--player", default=getpass.getuser(), help="name shown to the server")
+    parser.add_argument("--round", type=int, help="tournament round for the first game")
+    parser.add_argument("--db", default=str(DB_PATH), help="leaderboard for local games")
+    parser.add_argument("--digits", type=int, help="play Bulls and Cows with a code of this many digits")
+    parser.add_argument("--repeats", action="store_true", help="Bulls and Cows codes may repeat digits")
+    args, qt_args = parser.parse_known_args()
+    app = QApplication(sys.argv[:1] + qt_args)
     
     # Set application style
     app.setStyle('Fusion')
+
+    if args.digits:
+        try:
+            game = Bulls_cows_game(args.digits, args.repeats)
+        except ValueError as e:
+            parser.error(str(e))
+        game.show()
+        sys.exit(app.exec_())
+
+    client = None
+    if args.server:
+        host, _, port = args.server.rpartition(":")
+        client = GuessClient(host or HOST, int(port), args.player)
+        if not client.connect_to_server():
+            print(f"⚠️  No guess server at {args.server}; playing locally", file=sys.stderr)
+            client = None
     
-    game = Guess_number_game()
+    leaderboard = Leaderboard(args.db) if client is None else None
+    game = Guess_number_game(client, leaderboard, args.player)
+    if client is not None:
+        client.new_game(args.round)
     game.show()
-    sys.exit(app.exec_())
+    status = app.exec_()
+    if leaderboard is not None:
+        leaderboard.close()
+    sys.exit(status)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,198 @@
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import signal
+import time
+
+from guess_engine import CORRECT, HIGH, LOW, MAX_ATTEMPTS, GuessGame
+from leaderboard import DB_PATH, Leaderboard
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Multiplayer guess-the-number server for office tournaments. No Qt is
+# imported. Clients (the game window with --server, or bench_guess_server.py)
+# speak one JSON object per line over TCP on localhost:
+#   {"op": "new", "player": "ana"}               -> {"ok": true, "session": 7, "low": 1, "high": 100, "max_attempts": 10}
+#   {"op": "new", "player": "ana", "round": 3}   (everyone in round 3 chases the same number)
+#   {"op": "guess", "session": 7, "number": 50}  -> {"ok": true, "session": 7, "result": "low", "attempts": 1,
+#                                                    "max_attempts": 10, "over": false}
+#                                                   ("secret" is added once the game is over, and
+#                                                    "place" when the win made the leaderboard)
+#   {"op": "top"}                                -> {"ok": true, "low": 1, "high": 100, "top": [[3, ts, "ana"], ...]}
+#   {"op": "stats"}                              -> sessions, guesses, guesses/s
+# Errors come back as {"ok": false, "error": "..."}. Finished games go to the
+# leaderboard and are dropped, as are the sessions of a disconnected client.
+#   python guess_server.py [--port 8766] [--seed 1] [--db leaderboard.db]
+
+HOST = "127.0.0.1"
+PORT = 8766
+WRITE_HIGH_WATER = 64 * 1024  # only wait for the socket once this much is queued
+
+
+class Session(GuessGame):
+    """One player's game on the server; slotted like GuessGame, sharing the server's rng."""
+
+    __slots__ = ("id", "player", "owner")
+
+    def __init__(self, session_id, player, owner, low, high, max_attempts, rng, secret=None):
+        super().__init__(low, high, max_attempts, rng=rng, secret=secret)
+        self.id = session_id
+        self.player = player
+        self.owner = owner  # the connection's set of session ids
+
+
+class GuessServer:
+    def __init__(self, low=LOW, high=HIGH, max_attempts=MAX_ATTEMPTS, seed=None, leaderboard=None):
+        self.low = low
+        self.high = high
+        self.max_attempts = max_attempts
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.sessions = {}
+        self.ids = itertools.count(1)
+        self.started = time.monotonic()
+        self.guesses = 0
+        self.games_won = 0
+        self.games_lost = 0
+        self.peak_sessions = 0
+        self.leaderboard = leaderboard
+
+    def round_secret(self, round_number):
+        """The same secret for every player in a tournament round."""
+        return random.Random(f"{self.seed}:{round_number}").randint(self.low, self.high)
+
+    # ==== Requests ====
+    def new_game(self, request, owner):
+        round_number = request.get("round")
+        secret = self.round_secret(int(round_number)) if round_number is not None else None
+        session = Session(next(self.ids), str(request.get("player", "")), owner,
+                          self.low, self.high, self.max_attempts, self.rng, secret)
+        self.sessions[session.id] = session
+        owner.add(session.id)
+        self.peak_sessions = max(self.peak_sessions, len(self.sessions))
+        return {"ok": True, "session": session.id, "low": self.low, "high": self.high,
+                "max_attempts": self.max_attempts}
+
+    def guess(self, request, owner):
+        session_id = request.get("session")
+        # Only the connection that started a game may play it
+        if session_id not in owner:
+            return {"ok": False, "error": "no such session; start a new game"}
+        session = self.sessions[session_id]
+        number = request.get("number")
+        if not isinstance(number, int) or isinstance(number, bool):
+            return {"ok": False, "error": "Please enter a valid number!"}
+        result = session.guess(number)  # ValueError when out of range, reported by dispatch
+        self.guesses += 1
+        reply = {"ok": True, "session": session.id, "result": result, "attempts": session.attempts,
+                 "max_attempts": session.max_attempts, "over": session.over}
+        if session.over:
+            reply["secret"] = session.secret
+            if result == CORRECT:
+                self.games_won += 1
+            else:
+                self.games_lost += 1
+            if self.leaderboard is not None:
+                place = self.leaderboard.record(session.player, session.low, session.high,
+                                                session.attempts, session.won)
+                if place is not None:
+                    reply["place"] = place
+            self.finish(session)
+        return reply
+
+    def top(self):
+        entries = self.leaderboard.top(self.low, self.high) if self.leaderboard is not None else []
+        return {"ok": True, "low": self.low, "high": self.high, "top": entries}
+
+    def finish(self, session):
+        del self.sessions[session.id]
+        session.owner.discard(session.id)
+
+    def stats(self):
+        elapsed = time.monotonic() - self.started
+        reply = {"ok": True, "sessions": len(self.sessions), "peak_sessions": self.peak_sessions,
+                 "guesses": self.guesses, "guesses_per_s": round(self.guesses / elapsed, 1) if elapsed else 0.0,
+                 "games_won": self.games_won, "games_lost": self.games_lost}
+        if resource is not None:
+            reply["max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return reply
+
+    def dispatch(self, request, owner):
+        op = request.get("op")
+        try:
+            if op == "guess":
+                return self.guess(request, owner)
+            if op == "new":
+                return self.new_game(request, owner)
+            if op == "top":
+                return self.top()
+            if op == "stats":
+                return self.stats()
+        except (TypeError, ValueError) as e:
+            return {"ok": False, "error": str(e)}
+        return {"ok": False, "error": f"unknown op {op!r}"}
+
+    # ==== Connections ====
+    async def handle_client(self, reader, writer):
+        owner = set()
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    reply = self.dispatch(request, owner) if isinstance(request, dict) else None
+                except ValueError:
+                    reply = None
+                if reply is None:
+                    reply = {"ok": False, "error": "expected one JSON object per line"}
+                writer.write(json.dumps(reply).encode() + b"\n")
+                # Pipelined requests are answered without a drain per line
+                if writer.transport.get_write_buffer_size() > WRITE_HIGH_WATER:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for session_id in list(owner):
+                self.finish(self.sessions[session_id])
+            writer.close()
+
+
+async def serve(host=HOST, port=PORT, seed=None, low=LOW, high=HIGH, max_attempts=MAX_ATTEMPTS, db=DB_PATH):
+    leaderboard = Leaderboard(db)
+    game_server = GuessServer(low, high, max_attempts, seed, leaderboard)
+    # A deep backlog so thousands of players can connect at once
+    server = await asyncio.start_server(game_server.handle_client, host, port, backlog=4096)
+    print(f"🎯 Guess server on {host}:{port} (numbers {low}-{high}, {max_attempts} attempts,"
+          f" tournament seed {game_server.seed})", flush=True)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    try:
+        await stop.wait()
+    finally:
+        server.close()
+        await server.wait_closed()
+        leaderboard.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multiplayer guess-the-number server")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--seed", type=int, help="tournament seed: fixes the secret of each round")
+    parser.add_argument("--low", type=int, default=LOW)
+    parser.add_argument("--high", type=int, default=HIGH)
+    parser.add_argument("--attempts", type=int, default=MAX_ATTEMPTS)
+    parser.add_argument("--db", default=str(DB_PATH), help="leaderboard of finished games")
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.seed, args.low, args.high, args.attempts, args.db))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import bisect
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+DATA_DIR = Path.home() / ".guess_the_number"
+DB_PATH = DATA_DIR / "leaderboard.db"
+TOP_K = 10
+WRITER_CACHE_KB = 64 * 1024
+
+# Every finished game is one `games` row. The leaderboard index only holds
+# wins, ordered the way the board ranks them (fewest attempts, then earliest),
+# so loading a board reads its first k entries; the player index answers a
+# player's record for a range without touching anyone else's games.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id       INTEGER PRIMARY KEY,
+    player   TEXT NOT NULL,
+    low      INTEGER NOT NULL,
+    high     INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    won      INTEGER NOT NULL,
+    ts       REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_leaderboard ON games (low, high, attempts, ts) WHERE won;
+CREATE INDEX IF NOT EXISTS games_player ON games (player, low, high, won, attempts);
+"""
+
+
+class Leaderboard:
+    """Finished guess-the-number games in SQLite (WAL mode), with live top-k boards.
+
+    Each range (low, high) has a board of its best `k` wins as a sorted list
+    of `(attempts, ts, player)`. A board is read from the leaderboard index
+    the first time it is asked for and kept up to date by `record` with a
+    bisect insert, so `top` is O(k) however many games are stored, and a
+    game that does not make the board costs one comparison. Inserts are
+    queued to a background thread that commits whatever has piled up in one
+    transaction, so recording a game never blocks the GUI.
+    """
+
+    def __init__(self, path=DB_PATH, k=TOP_K):
+        self.path = str(path)
+        self.k = k
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._reader = self._connect()
+        self._reader.executescript(SCHEMA)
+        self._boards = {}
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="leaderboard-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ==== Reads ====
+    def top(self, low, high):
+        """The best `k` wins for the range as `(attempts, ts, player)`, best first."""
+        return list(self._board(low, high))
+
+    def _board(self, low, high):
+        board = self._boards.get((low, high))
+        if board is None:
+            # Wins are only queued once their board is loaded, so a board
+            # never misses a queued win nor counts a committed one twice
+            board = self._boards[low, high] = self._reader.execute(
+                "SELECT attempts, ts, player FROM games WHERE won AND low = ? AND high = ?"
+                " ORDER BY attempts, ts LIMIT ?",
+                (low, high, self.k),
+            ).fetchall()
+        return board
+
+    def player_record(self, player, low, high):
+        """`(games, wins, best attempts or None)` for `player` in the range; committed games only."""
+        games, wins, best = self._reader.execute(
+            "SELECT COUNT(*), COALESCE(SUM(won), 0), MIN(CASE WHEN won THEN attempts END)"
+            " FROM games WHERE player = ? AND low = ? AND high = ?",
+            (player, low, high),
+        ).fetchone()
+        return games, wins, best
+
+    def count(self):
+        return self._reader.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    # ==== Writes (queued) ====
+    def record(self, player, low, high, attempts, won, ts=None):
+        """Save a finished game; returns its 1-based place on the board, or None."""
+        ts = time.time() if ts is None else ts
+        place = self._rank(self._board(low, high), (attempts, ts, player)) if won else None
+        self._queue.put([(player, low, high, attempts, int(won), ts)])
+        return place
+
+    def record_many(self, rows):
+        """Save `(player, low, high, attempts, won, ts)` rows."""
+        rows = list(rows)
+        for player, low, high, attempts, won, ts in rows:
+            if won:
+                self._rank(self._board(low, high), (attempts, ts, player))
+        self._queue.put(rows)
+
+    def _rank(self, board, entry):
+        if len(board) == self.k and entry >= board[-1]:
+            return None
+        place = bisect.bisect(board, entry)
+        board.insert(place, entry)
+        del board[self.k:]
+        return place + 1
+
+    def flush(self):
+        """Block until every queued game is committed."""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self):
+        self._queue.put(None)
+        self._writer.join()
+        self._reader.close()
+
+    def _write_loop(self):
+        conn = self._connect()
+        # The player index takes inserts all over its B-tree; keep its hot
+        # pages cached so inserts stay cheap as the table grows
+        conn.execute(f"PRAGMA cache_size = -{WRITER_CACHE_KB}")
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            waiters = []
+            with conn:
+                for op in batch:
+                    if op is None:
+                        running = False
+                        break
+                    if isinstance(op, threading.Event):
+                        waiters.append(op)
+                        continue
+                    conn.executemany(
+                        "INSERT INTO games (player, low, high, attempts, won, ts) VALUES (?, ?, ?, ?, ?, ?)", op)
+            for done in waiters:
+                done.set()
+        conn.close()
@@ -0,0 +1,138 @@
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PyQt5.QtWidgets import QApplication
+
+base_path = Path(__file__).parent
+sys.path[:0] = [str(base_path / "Guess the number"), str(base_path / "BMI calculator")]
+
+from bmi_calc import RESULT_STATES, BMICalculator
+from bmi_engine import COLORS, compute_bmi
+from guess_engine import CORRECT, STRATEGIES, TOO_LOW, GuessGame
+from guess_no import Guess_number_game
+from theme import hex_rgba, set_state
+
+# Cost of restyling the result label once per interaction, in the real windows:
+# a fresh stylesheet string every time (how the apps used to do it) against
+# switching a dynamic property within the stylesheet parsed at startup.
+# Interactions replay simulated guess games and a BMI typed digit by digit.
+#   python bench_theme.py [games]
+
+GUESS_COLORS = {"low": "#2196F3", "high": "#FF9800", "win": "#4CAF50", "lose": "#f44336"}
+
+
+def legacy_guess_css(state):
+    if not state:
+        return "QLabel { color: white; background: rgba(255, 255, 255, 0.1); border-radius: 10px;" \
+               " padding: 15px; margin: 5px; min-height: 50px; }"
+    color = GUESS_COLORS[state]
+    return f"""
+        QLabel {{
+            color: {color};
+            background: {hex_rgba(color, 0.2)};
+            border: 2px solid {color};
+            border-radius: 10px;
+            padding: 15px;
+            margin: 5px;
+            min-height: 50px;
+        }}
+    """
+
+
+def guess_states(games):
+    """Result-label states of `games` human-like games, with the reset after each."""
+    game, strategy, rng = GuessGame(seed=4), STRATEGIES["human"], np.random.default_rng(4)
+    states = []
+    for _ in range(games):
+        game.reset()
+        lo, hi = np.array([game.low]), np.array([game.high])
+        while not game.over:
+            guess = int(strategy.propose(lo, hi, rng)[0])
+            outcome = game.guess(guess)
+            if outcome == TOO_LOW:
+                lo[0] = guess + 1
+            elif outcome != CORRECT:
+                hi[0] = guess - 1
+            states.append("win" if outcome == CORRECT else "lose" if game.lost else outcome)
+        states.append("")
+    return states
+
+
+def bmi_states(people):
+    """Result-label states while typing weights like "7", "72", "72.", "72.5" at a fixed height."""
+    rng = random.Random(4)
+    states = []
+    for _ in range(people):
+        weight, height = f"{rng.uniform(45, 120):.1f}", rng.uniform(1.5, 2.0)
+        for typed in (weight[:n] for n in range(1, len(weight) + 1)):
+            _, category = compute_bmi([float(typed.rstrip("."))], [height])
+            states.append(RESULT_STATES[category[0]])
+        states.append("")
+    return states
+
+
+def timed(app, label, restyle, states):
+    """Median µs per interaction for the restyle alone and with the repaint it triggers."""
+    restyle_us, total_us = [], []
+    for state in states:
+        started = time.perf_counter()
+        restyle(state)
+        styled = time.perf_counter()
+        label.repaint()
+        restyle_us.append((styled - started) * 1e6)
+        total_us.append((time.perf_counter() - started) * 1e6)
+    app.processEvents()
+    return statistics.median(restyle_us), statistics.mean(restyle_us), statistics.median(total_us)
+
+
+def compare(app, name, label, legacy, states):
+    before = timed(app, label, legacy, states)
+    label.setStyleSheet("")
+    after = timed(app, label, lambda state: set_state(label, state), states)
+    changes = sum(a != b for a, b in zip(states, states[1:]))
+    print(f"🎨 {name}: {len(states)} interactions, state changes on {changes / len(states):.0%}")
+    print(f"   stylesheet per interaction: restyle median {before[0]:.0f} µs, mean {before[1]:.0f} µs;"
+          f" with repaint {before[2]:.0f} µs")
+    print(f"   state property:             restyle median {after[0]:.1f} µs, mean {after[1]:.0f} µs;"
+          f" with repaint {after[2]:.0f} µs  ({before[1] / after[1]:.1f}x on restyle)")
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    app = QApplication(sys.argv)
+
+    guess = Guess_number_game()
+    guess.show()
+    app.processEvents()
+    label = guess.result
+    compare(app, "guess result", label, lambda state: label.setStyleSheet(legacy_guess_css(state)), guess_states(games))
+    guess.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bmi = BMICalculator(history_path=Path(tmp) / "history.db")
+        bmi.show()
+        app.processEvents()
+        label = bmi.result
+        colors = dict(zip(RESULT_STATES, COLORS), **{"": "black"})
+        # The old BMI window already skipped restyling while the category held
+        last = [None]
+
+        def legacy(state):
+            if state != last[0]:
+                label.setStyleSheet(f"color: {colors[state]};")
+                last[0] = state
+
+        compare(app, "BMI result", label, legacy, bmi_states(games))
+        bmi.history.close()
+
+
+if __name__ == "__main__":
+    main()
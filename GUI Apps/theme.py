@@ -0,0 +1,50 @@
+from textwrap import dedent
+
+# Shared styling for the apps in this folder. Each app builds one stylesheet
+# at import time and sets it once on its top-level window. Widgets that change
+# look as the user interacts (a result label turning red, green...) get one
+# rule per visual state, selected by a dynamic property, so switching state
+# re-polishes that widget instead of re-parsing CSS:
+#
+#   STYLE = stylesheet("QLabel#result { padding: 10px; }",
+#                      state_rules("QLabel#result", {"error": "color: red;"}))
+#   window.setStyleSheet(STYLE)
+#   set_state(window.result, "error")
+#
+# Apps import it by putting this folder on sys.path.
+
+STATE = "state"
+
+
+def stylesheet(*parts):
+    """Join stylesheet fragments (indented triple-quoted strings are fine)."""
+    return "\n".join(dedent(part).strip() for part in parts if part) + "\n"
+
+
+def state_rules(selector, states, prop=STATE):
+    """One `selector[prop="name"] { ... }` rule per entry of `states` (name -> declarations)."""
+    return "\n".join(f'{selector}[{prop}="{name}"] {{ {declarations} }}' for name, declarations in states.items())
+
+
+def hex_rgba(color, alpha):
+    """"#2196F3", 0.2 -> "rgba(33, 150, 243, 0.2)"."""
+    color = color.lstrip("#")
+    r, g, b = (int(color[i:i + 2], 16) for i in (0, 2, 4))
+    return f"rgba({r}, {g}, {b}, {alpha})"
+
+
+def set_state(widget, state, prop=STATE):
+    """Switch `widget` to the `state` rules of the stylesheet already applied.
+
+    Does nothing when the state is unchanged. Otherwise only this widget is
+    re-polished; "" falls back to the widget's stateless rules. Returns
+    whether the state changed.
+    """
+    if widget.property(prop) == state:
+        return False
+    widget.setProperty(prop, state)
+    # The stylesheet style drops the widget's cached rules in polish() itself,
+    # so the usual unpolish() first would only repeat that work
+    widget.style().polish(widget)
+    widget.update()
+    return True